@@ -0,0 +1,97 @@
+"""Template render time of the Bandit findings tables: iterrows() vs precomputed row records.
+
+Usage: python benchmarks/bench_bandit_render.py [--findings 50000] [--repeat 3]
+
+The legacy side renders only the findings loop of the old template straight off
+the DataFrame; the records side renders the full current template, so the
+comparison understates the gain rather than overstating it. Charts are left out.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from jinja2 import Environment, FileSystemLoader
+
+from synthetic import SEVERITIES, write_bandit
+
+RESOURCES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'resources')
+sys.path.append(os.path.join(RESOURCES, 'common'))
+
+from report_utils import load_generator  # noqa: E402
+
+# Findings tables of the Bandit template before row records
+LEGACY_TEMPLATE = """
+{% for severity in ['LOW', 'MEDIUM', 'HIGH'] %}
+<table>
+    <tbody>
+        {% for index, row in data[data.issue_severity == severity].iterrows() %}
+        <tr>
+            <td>{{ row.filename }}</td>
+            <td>{{ row.line_number }}</td>
+            <td><pre>{{ row.code }}</pre></td>
+            <td>{{ row.issue_text }}</td>
+            <td>{{ row.cwe_id }}</td>
+            <td>{{ row.issue_confidence }}</td>
+            <td><a href="{{ row.more_info }}">Link</a></td>
+        </tr>
+        {% endfor %}
+        <tr class="total-row">
+            <td colspan="6">Total {{ severity }} Severity Issues</td>
+            <td>{{ data[data.issue_severity == severity].shape[0] }}</td>
+        </tr>
+    </tbody>
+</table>
+{% endfor %}
+"""
+
+
+def best_of(repeat, func):
+    """Run ``func`` ``repeat`` times; return the fastest wall time and the last result."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--findings', type=int, default=50000, help='Number of synthetic findings')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per variant, the fastest one is reported')
+    args = parser.parse_args(argv)
+
+    bandit = load_generator('bandit')
+    with tempfile.TemporaryDirectory() as tmp:
+        df = bandit.load_and_parse(write_bandit(os.path.join(tmp, 'bandit.json'), args.findings))
+    scan = bandit.build_scan(df)
+    plots = {chart[0]: '' for chart in bandit.CHARTS}
+
+    legacy = Environment().from_string(LEGACY_TEMPLATE)
+    legacy_time, legacy_html = best_of(args.repeat, lambda: legacy.render(data=df))
+
+    env = Environment(loader=FileSystemLoader([os.path.join(RESOURCES, 'bandit'), os.path.join(RESOURCES, 'common')]))
+    template = env.get_template('report_template.html')
+
+    def render_records():
+        # Sections are single-use iterators, so split again on every run
+        sections = bandit.split_by_severity(df)
+        return template.render(
+            sections={severity: bandit.records(bandit.BanditRecord, sections[severity]) for severity in SEVERITIES},
+            severity_totals={severity: int(scan.counts['severity'].get(severity, 0)) for severity in SEVERITIES},
+            findings=None,
+            **plots
+        )
+
+    records_time, records_html = best_of(args.repeat, render_records)
+
+    print(f'{args.findings} findings, best of {args.repeat}')
+    print(f'  iterrows  {legacy_time:8.3f}s  {len(legacy_html) / 1e6:7.1f} MB')
+    print(f'  records   {records_time:8.3f}s  {len(records_html) / 1e6:7.1f} MB')
+    print(f'  speedup   {legacy_time / records_time:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""Trend of many builds from the history store vs re-parsing every archived scan.
+
+Usage: python benchmarks/bench_history.py [--builds 500] [--findings 2000]
+
+Both sides end with the same per-build severity counts; the history side also
+renders the full trends report (every aggregate, charts included).
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+RESOURCES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'resources')
+sys.path.append(os.path.join(RESOURCES, 'common'))
+
+from history import HistoryStore, main as render_trends  # noqa: E402
+from report_utils import load_generator  # noqa: E402
+from synthetic import write_bandit  # noqa: E402
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--builds', type=int, default=500, help='Number of recorded builds')
+    parser.add_argument('--findings', type=int, default=2000, help='Findings per synthetic scan')
+    parser.add_argument('--archived', type=int, default=20,
+                        help='Scans actually re-parsed for the legacy side, the time is scaled up to --builds')
+    args = parser.parse_args(argv)
+
+    bandit = load_generator('bandit')
+    with tempfile.TemporaryDirectory() as tmp:
+        scans = [write_bandit(os.path.join(tmp, f'bandit_{seed}.json'), args.findings, seed=seed)
+                 for seed in range(args.archived)]
+
+        def reparse():
+            return [bandit.build_scan(bandit.load_and_parse(path)).counts['severity'] for path in scans]
+
+        reparse_time, _ = timed(reparse)
+        reparse_time *= args.builds / args.archived
+
+        store = HistoryStore(os.path.join(tmp, 'history'), 'bandit')
+        counts = [bandit.build_scan(bandit.load_and_parse(path)).counts for path in scans]
+        append_time, _ = timed(lambda: [store.append(counts[build % len(counts)], str(build)) for build in range(args.builds)])
+
+        trend_time, trend = timed(lambda: store.trend('severity'))
+        output = os.path.join(tmp, 'bandit-trends.html')
+        report_time, _ = timed(lambda: render_trends(['--history-dir', os.path.join(tmp, 'history'), '--tool', 'bandit', '--output', output]))
+        size = sum(os.path.getsize(os.path.join(store.path, name)) for name in os.listdir(store.path))
+
+    print(f'{args.builds} builds of {args.findings} findings, history {size / 1e6:.2f} MB')
+    print(f'  re-parse scans  {reparse_time:8.2f}s  (extrapolated from {args.archived})')
+    print(f'  append runs     {append_time:8.2f}s  ({append_time / args.builds * 1000:.1f} ms per run)')
+    print(f'  severity trend  {trend_time:8.3f}s  {trend.counts.shape}')
+    print(f'  trends report   {report_time:8.2f}s  (all aggregates, charts included)')
+
+
+if __name__ == '__main__':
+    main()
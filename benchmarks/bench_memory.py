@@ -0,0 +1,104 @@
+"""Resident set of the SonarQube and Bandit loaders: whole-document json_normalize vs the column schemas.
+
+Usage: python benchmarks/bench_memory.py [--findings 200000]
+
+Every variant loads in a fresh process, so each peak RSS only covers that loader
+(plus the interpreter and pandas, measured separately as the import baseline).
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+from synthetic import write_bandit, write_sonarqube
+
+RESOURCES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'resources')
+sys.path.append(os.path.join(RESOURCES, 'common'))
+
+from report_utils import load_generator  # noqa: E402
+
+
+def legacy_sonarqube(paths):
+    import pandas as pd
+    frames = []
+    for path, key in zip(paths, ['issues', 'hotspots']):
+        with open(path) as f:
+            frames.append(pd.json_normalize(json.load(f)[key]))
+    return frames
+
+
+def schema_sonarqube(paths):
+    sonarqube = load_generator('sonarqube')
+    return [sonarqube.load_json(path, key) for path, key in zip(paths, ['issues', 'hotspots'])]
+
+
+def legacy_bandit(paths):
+    import pandas as pd
+    with open(paths[0]) as f:
+        data = json.load(f)
+    for item in data['results']:
+        item['cwe_id'] = item['issue_cwe']['id']
+    return [pd.DataFrame(data['results'])]
+
+
+def schema_bandit(paths):
+    return [load_generator('bandit').load_and_parse(paths[0])]
+
+
+def nothing(paths):
+    import pandas  # noqa: F401
+    return []
+
+
+def measure(loader, paths, queue):
+    from report_utils import peak_rss
+    start = time.perf_counter()
+    frames = loader(paths)
+    seconds = time.perf_counter() - start
+    size = sum(int(df.memory_usage(deep=True).sum()) for df in frames)
+    queue.put((seconds, size, peak_rss()))
+
+
+def write_inputs(tmp, findings, queue):
+    queue.put((
+        write_sonarqube(os.path.join(tmp, 'issues.json'), os.path.join(tmp, 'hotspots.json'), findings),
+        [write_bandit(os.path.join(tmp, 'bandit.json'), findings)],
+    ))
+
+
+def run(target, *target_args):
+    # Linux keeps the peak RSS across fork and exec, so this process must stay small
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=target, args=(*target_args, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--findings', type=int, default=200000, help='Issues and hotspots each (SonarQube) and Bandit results')
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sonarqube, bandit = run(write_inputs, tmp, args.findings)
+        _, _, base = run(measure, nothing, [])
+        print(f'{args.findings} findings per export, import baseline {base / 1e6:.0f} MB RSS')
+        print(f'  {"loader":<20} {"time":>8} {"frames":>10} {"peak RSS":>10} {"above baseline":>15}')
+        for name, loader, paths in [
+            ('sonarqube legacy', legacy_sonarqube, sonarqube),
+            ('sonarqube schema', schema_sonarqube, sonarqube),
+            ('bandit legacy', legacy_bandit, bandit),
+            ('bandit schema', schema_bandit, bandit),
+        ]:
+            seconds, size, peak = run(measure, loader, paths)
+            print(f'  {name:<20} {seconds:7.2f}s {size / 1e6:8.1f}MB {peak / 1e6:8.0f}MB {(peak - base) / 1e6:13.0f}MB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+"""Stage timings and peak RSS of every report generator on synthetic scans, saved as JSON.
+
+Usage:
+    python benchmarks/bench_reports.py --sizes 1000 10000 100000 --output before.json
+    python benchmarks/bench_reports.py --tools bandit sonarqube --sizes 1000000 --generator-args=--no-charts
+    python benchmarks/bench_reports.py --compare before.json after.json
+
+Each tool and size is built by the generator's own generate_report() in a fresh
+process, so the peak RSS covers that build alone. The timings are the
+generator's stages (parse, aggregate, charts, tables, render, write) plus the
+chart parts (rasterising and base64 encoding, summed over charts). Synthetic
+inputs are written once to --data-dir and reused by later runs.
+"""
+import argparse
+import contextlib
+import importlib.metadata
+import json
+import multiprocessing
+import os
+import platform
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+import warnings
+
+from synthetic import write_bandit, write_safety, write_sonarqube, write_trufflehog
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+RESOURCES = os.path.join(BENCHMARKS_DIR, '..', 'resources')
+sys.path.append(os.path.join(RESOURCES, 'common'))
+
+from report_utils import load_generator  # noqa: E402
+
+TOOLS = ['bandit', 'safety', 'sonarqube', 'trufflehog']
+DEFAULT_SIZES = [1000, 10000, 100000]
+# Stages in report order; a generator only has the ones its build went through
+STAGES = ['parse', 'aggregate', 'charts', 'tables', 'render', 'write']
+PARTS = ['chart render', 'base64 encode']
+PACKAGES = ['pandas', 'numpy', 'matplotlib', 'seaborn', 'jinja2', 'Pillow']
+# A stage slower than this ratio is flagged by --compare
+REGRESSION_RATIO = 1.10
+
+
+def input_paths(tool, size, data_dir):
+    if tool == 'sonarqube':
+        return [os.path.join(data_dir, f'sonarqube-issues-{size}.json'), os.path.join(data_dir, f'sonarqube-hotspots-{size}.json')]
+    return [os.path.join(data_dir, f'{tool}-{size}.json')]
+
+
+def write_inputs(tool, size, paths):
+    if tool == 'bandit':
+        write_bandit(paths[0], size)
+    elif tool == 'safety':
+        write_safety(paths[0], size)
+    elif tool == 'sonarqube':
+        # Findings split between issues and hotspots, roughly as in real projects
+        write_sonarqube(*paths, size - size // 5, hotspot_count=size // 5)
+    else:
+        write_trufflehog(paths[0], size)
+
+
+def build(tool, argv, workdir, queue):
+    """Child process: build one report and send back its timings."""
+    try:
+        from report_utils import peak_rss
+
+        os.chdir(workdir)
+        generator = load_generator(tool)
+        start = time.perf_counter()
+        # Progress messages and seaborn's deprecation warnings would drown the results table
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull), warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            timer = generator.generate_report(generator.parse_args(argv))
+        wall = time.perf_counter() - start
+        queue.put({
+            **timer.as_dict(),
+            'wall': wall,
+            'peak_rss': peak_rss(),
+            'report_bytes': os.path.getsize(generator.report_path),
+        })
+    except Exception:
+        queue.put({'error': traceback.format_exc()})
+
+
+def in_child(target, *args):
+    # Spawned, not forked: Linux keeps the peak RSS across fork and exec
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=target, args=(*args, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def generate(tool, size, paths, queue):
+    write_inputs(tool, size, paths)
+    queue.put(paths)
+
+
+def environment():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=BENCHMARKS_DIR, capture_output=True, text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(['git', 'status', '--porcelain', '--', RESOURCES], cwd=BENCHMARKS_DIR, capture_output=True, text=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        commit, dirty = None, None
+    versions = {}
+    for package in PACKAGES:
+        try:
+            versions[package] = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            versions[package] = None
+    return {
+        'commit': commit,
+        'dirty': dirty,
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'packages': versions,
+    }
+
+
+def row(result):
+    seconds = {**result['stages'], **result['parts']}
+    cells = [f"{seconds[name]:8.3f}" if name in seconds else f"{'-':>8}" for name in STAGES + PARTS]
+    return ' '.join(cells) + f" {result['total']:8.3f} {result['peak_rss'] / 1e6:8.0f}MB {result['report_bytes'] / 1e6:7.1f}MB"
+
+
+def header():
+    names = [name.replace('chart render', 'rasterise').replace('base64 encode', 'base64') for name in STAGES + PARTS]
+    return f"  {'tool':<11} {'findings':>9} " + ' '.join(f'{name:>8}' for name in names) + f" {'total':>8} {'peak RSS':>10} {'report':>9}"
+
+
+def run(args):
+    data_dir = args.data_dir or os.path.join(tempfile.gettempdir(), 'security-report-bench')
+    os.makedirs(data_dir, exist_ok=True)
+    generator_args = shlex.split(args.generator_args)
+    results = []
+    print(header())
+    for size in args.sizes:
+        for tool in args.tools:
+            paths = input_paths(tool, size, data_dir)
+            if not all(os.path.exists(path) for path in paths):
+                in_child(generate, tool, size, paths)
+            argv = [*paths, f'{tool}/report_template.html', *generator_args]
+            attempts = []
+            for _ in range(args.repeat):
+                with tempfile.TemporaryDirectory() as workdir:
+                    attempts.append(in_child(build, tool, argv, workdir))
+            failed = [attempt for attempt in attempts if 'error' in attempt]
+            if failed:
+                print(f"  {tool:<11} {size:>9} failed:\n{failed[0]['error']}", file=sys.stderr)
+                continue
+            # The fastest attempt, and the highest peak RSS over all of them
+            result = min(attempts, key=lambda attempt: attempt['total'])
+            result['peak_rss'] = max(attempt['peak_rss'] or 0 for attempt in attempts)
+            results.append({'tool': tool, 'findings': size, **result})
+            print(f"  {tool:<11} {size:>9} {row(result)}")
+
+    with open(args.output, 'w') as f:
+        json.dump({'environment': environment(), 'generator_args': generator_args, 'repeat': args.repeat, 'results': results}, f, indent=2)
+    print(f"Results written to {args.output}")
+    return results
+
+
+def compare(before_path, after_path):
+    """Print each stage of ``after`` relative to ``before``; returns True when a stage got slower."""
+    with open(before_path) as f:
+        before = json.load(f)
+    with open(after_path) as f:
+        after = json.load(f)
+    print(f"{(before['environment']['commit'] or before_path)[:12]} -> {(after['environment']['commit'] or after_path)[:12]} (after / before, ! = over {REGRESSION_RATIO:.2f})")
+    baseline = {(result['tool'], result['findings']): result for result in before['results']}
+    regressed = False
+    for result in after['results']:
+        old = baseline.get((result['tool'], result['findings']))
+        if old is None:
+            continue
+        cells = []
+        for name in STAGES + PARTS + ['total', 'peak_rss']:
+            new_value = result.get(name, {**result['stages'], **result['parts']}.get(name))
+            old_value = old.get(name, {**old['stages'], **old['parts']}.get(name))
+            if not new_value or not old_value:
+                continue
+            ratio = new_value / old_value
+            # Sub-10ms stages are noise
+            slower = ratio > REGRESSION_RATIO and (name == 'peak_rss' or new_value - old_value > 0.01)
+            regressed = regressed or slower
+            cells.append(f"{name} {ratio:.2f}{'!' if slower else ''}")
+        print(f"  {result['tool']:<11} {result['findings']:>9}  " + ', '.join(cells))
+    return regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tools', nargs='+', choices=TOOLS, default=TOOLS)
+    parser.add_argument('--sizes', nargs='+', type=int, default=DEFAULT_SIZES, help='Findings per scan, e.g. 1000 to 1000000')
+    parser.add_argument('--repeat', type=int, default=1, help='Builds per tool and size, the fastest one is reported')
+    parser.add_argument('--generator-args', default='', help="Extra generator options, e.g. '--render-profile legacy'")
+    parser.add_argument('--data-dir', help='Where the synthetic inputs are kept (default a directory in the system temp dir)')
+    parser.add_argument('--output', default='bench_reports.json', help='Results file (default bench_reports.json)')
+    parser.add_argument('--compare', nargs=2, metavar=('BEFORE', 'AFTER'), help='Compare two results files instead; exit status 1 on a regression')
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        sys.exit(1 if compare(*args.compare) else 0)
+    run(args)
+
+
+if __name__ == '__main__':
+    main()
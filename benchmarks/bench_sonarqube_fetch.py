@@ -0,0 +1,43 @@
+"""SonarQube report straight from the search API: sequential vs concurrent page fetching.
+
+Usage: python benchmarks/bench_sonarqube_fetch.py [--issues 10000] [--hotspots 5000] [--latency 0.05]
+
+Pages are replayed by the local stub (sonarqube_stub.py) with a fixed latency
+per response; charts are left out so the timings are dominated by fetching.
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from sonarqube_stub import start_stub, synthesize
+from report_utils import load_generator
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--issues', type=int, default=10000, help='Issues in the synthetic project (the API returns at most 10000)')
+    parser.add_argument('--hotspots', type=int, default=5000, help='Hotspots in the synthetic project')
+    parser.add_argument('--latency', type=float, default=0.05, help='Seconds the stub waits before every response')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 8], help='--fetch-workers values to compare')
+    args = parser.parse_args(argv)
+
+    sonarqube = load_generator('sonarqube')
+    with tempfile.TemporaryDirectory() as tmp:
+        server, url = start_stub(synthesize(os.path.join(tmp, 'pages'), args.issues, args.hotspots), latency=args.latency)
+        os.chdir(tmp)
+        print(f'{args.issues} issues, {args.hotspots} hotspots, pages of {sonarqube.API_PAGE_SIZE}, {args.latency * 1000:.0f} ms per response')
+        for workers in args.workers:
+            start = time.perf_counter()
+            sonarqube.main(['issues.json', 'hotspots.json', 'sonarqube/report_template.html', '--no-charts', '--server-url', url,
+                            '--project-key', 'bench', '--fetch-workers', str(workers)])
+            seconds = time.perf_counter() - start
+            with open('issues.json') as f:
+                fetched = len(json.load(f)['issues'])
+            print(f'  {workers:2d} workers  {seconds:7.2f}s  ({fetched} issues exported)')
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""Cold start of the report generators on small scans, with and without charts.
+
+Usage: python benchmarks/bench_startup.py [--repeat 5]
+
+Every run is a fresh interpreter, as on an ephemeral agent. Besides the wall time
+it reports the cumulative import time of the heavy modules (from -X importtime),
+so a regression in lazy importing shows up even when the total is noisy.
+"""
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from synthetic import write_bandit, write_trufflehog
+
+RESOURCES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'resources')
+HEAVY_MODULES = ['pandas', 'matplotlib.pyplot', 'seaborn', 'jinja2']
+
+# Scenario name, tool, number of findings
+SCENARIOS = [
+    ('trufflehog, empty', 'trufflehog', 0),
+    ('trufflehog, 50 findings', 'trufflehog', 50),
+    ('bandit, 50 findings', 'bandit', 50),
+]
+WRITERS = {'bandit': write_bandit, 'trufflehog': write_trufflehog}
+
+
+def import_times(stderr):
+    """Cumulative import time in seconds of each top-level heavy module that was imported."""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = (part.strip() for part in line[len('import time:'):].split('|'))
+        if name in HEAVY_MODULES:
+            times[name] = int(cumulative) / 1e6
+    return times
+
+
+def run(tool, input_path, workdir, extra_args):
+    script = os.path.join(RESOURCES, tool, 'html_generator.py')
+    command = [sys.executable, '-X', 'importtime', script, input_path, 'report_template.html'] + extra_args
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=workdir, capture_output=True, text=True, check=True)
+    return time.perf_counter() - start, import_times(result.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per scenario, the median is reported')
+    args = parser.parse_args(argv)
+
+    print(f"{'scenario':<26}{'mode':<12}{'median':>9}  imports")
+    with tempfile.TemporaryDirectory() as workdir:
+        for label, tool, findings in SCENARIOS:
+            shutil.copy(os.path.join(RESOURCES, tool, 'report_template.html'), workdir)
+            input_path = WRITERS[tool](os.path.join(workdir, f'{tool}-{findings}.json'), findings)
+            for mode, extra_args in [('charts', []), ('no-charts', ['--no-charts'])]:
+                runs = [run(tool, input_path, workdir, extra_args) for _ in range(args.repeat)]
+                imports = runs[-1][1]
+                summary = ', '.join(f'{name} {imports[name]:.2f}s' for name in HEAVY_MODULES if name in imports)
+                print(f'{label:<26}{mode:<12}{statistics.median(wall for wall, _ in runs):8.2f}s  {summary}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""Local stand-in for the SonarQube search API that replays recorded page responses.
+
+    python benchmarks/sonarqube_stub.py synthesize pages/ --issues 20000 --hotspots 5000
+    python benchmarks/sonarqube_stub.py record https://sonar.example.com my-project pages/
+    python benchmarks/sonarqube_stub.py serve pages/ --port 9000 --latency 0.05
+
+A recording is a directory with ``issues/<p>.json`` and ``hotspots/<p>.json``,
+the bodies the server returned for page ``p``, and ``recording.json`` with the
+page size they were recorded at. ``serve`` answers ``/api/issues/search`` and
+``/api/hotspots/search`` from it, so the generator can be pointed at the stub
+with ``--server-url http://localhost:9000 --project-key <any>``.
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from synthetic import sonarqube_hotspots, sonarqube_issues
+
+RESOURCES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'resources')
+sys.path.append(os.path.join(RESOURCES, 'common'))
+
+from report_utils import load_generator  # noqa: E402
+
+KEYS = {'/api/issues/search': 'issues', '/api/hotspots/search': 'hotspots'}
+
+
+def write_page(directory, key, number, body):
+    os.makedirs(os.path.join(directory, key), exist_ok=True)
+    with open(os.path.join(directory, key, f'{number}.json'), 'w') as f:
+        json.dump(body, f)
+
+
+def synthesize(directory, issues, hotspots, page_size=500, seed=0):
+    """Write a recording of a project with ``issues`` issues and ``hotspots`` hotspots."""
+    for key, count, items in [('issues', issues, sonarqube_issues), ('hotspots', hotspots, sonarqube_hotspots)]:
+        generated = list(items(count, seed))
+        for number in range(1, max(1, -(-count // page_size)) + 1):
+            paging = {'pageIndex': number, 'pageSize': page_size, 'total': count}
+            write_page(directory, key, number, {'paging': paging, key: generated[(number - 1) * page_size:number * page_size], 'components': []})
+    with open(os.path.join(directory, 'recording.json'), 'w') as f:
+        json.dump({'page_size': page_size}, f)
+    return directory
+
+
+def record(server_url, project_key, directory, token=None, branch=None):
+    """Record every page of a real server's issues and hotspots searches."""
+    sonarqube = load_generator('sonarqube')
+    client = sonarqube.SonarQubeClient(server_url, token)
+    for key in sonarqube.ENDPOINTS:
+        for number, page in enumerate(sonarqube.fetch_pages(client, key, project_key, branch), 1):
+            write_page(directory, key, number, page)
+    client.close()
+    with open(os.path.join(directory, 'recording.json'), 'w') as f:
+        json.dump({'page_size': sonarqube.API_PAGE_SIZE}, f)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    # Keep-alive, like the real server, so the client's connection pool is exercised
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = {name: values[0] for name, values in parse_qs(url.query).items()}
+        key = KEYS.get(url.path)
+        if key is None:
+            return self.reply(404, {'errors': [{'msg': f'Unknown url: {url.path}'}]})
+        if int(params.get('ps', 100)) != self.server.page_size:
+            return self.reply(400, {'errors': [{'msg': f'Recorded with ps={self.server.page_size}'}]})
+        time.sleep(self.server.latency)
+        try:
+            with open(os.path.join(self.server.directory, key, f"{int(params.get('p', 1))}.json"), 'rb') as f:
+                body = f.read()
+        except FileNotFoundError:
+            return self.reply(400, {'errors': [{'msg': 'Can return only the first 10000 results'}]})
+        self.reply(200, body)
+
+    def reply(self, status, body):
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub(directory, port=0, latency=0.0):
+    """Serve a recording from a background thread; returns the server, its URL and ``server.shutdown()`` stops it."""
+    server = ThreadingHTTPServer(('127.0.0.1', port), StubHandler)
+    server.daemon_threads = True
+    server.directory = directory
+    server.latency = latency
+    with open(os.path.join(directory, 'recording.json')) as f:
+        server.page_size = json.load(f)['page_size']
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+    serve_parser = commands.add_parser('serve', help='Replay a recording')
+    serve_parser.add_argument('directory')
+    serve_parser.add_argument('--port', type=int, default=9000)
+    serve_parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response, like a loaded server')
+    synthesize_parser = commands.add_parser('synthesize', help='Write a recording of synthetic findings')
+    synthesize_parser.add_argument('directory')
+    synthesize_parser.add_argument('--issues', type=int, default=20000)
+    synthesize_parser.add_argument('--hotspots', type=int, default=5000)
+    record_parser = commands.add_parser('record', help="Record a real server's pages")
+    record_parser.add_argument('server_url')
+    record_parser.add_argument('project_key')
+    record_parser.add_argument('directory')
+    record_parser.add_argument('--branch')
+    record_parser.add_argument('--token', default=os.environ.get('SONAR_TOKEN'))
+    args = parser.parse_args(argv)
+
+    if args.command == 'synthesize':
+        synthesize(args.directory, args.issues, args.hotspots)
+    elif args.command == 'record':
+        record(args.server_url, args.project_key, args.directory, args.token, args.branch)
+    else:
+        server, url = start_stub(args.directory, args.port, args.latency)
+        print(f'Replaying {args.directory} on {url}')
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
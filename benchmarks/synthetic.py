@@ -0,0 +1,185 @@
+"""Synthetic scan results for the report benchmarks.
+
+The generated files follow the shape of the real tool output closely enough for
+the generators (nested keys, mixed column types, HTML-unsafe text), with a fixed
+seed so runs are comparable.
+"""
+import json
+import random
+
+SEVERITIES = ['LOW', 'MEDIUM', 'HIGH']
+
+
+def bandit_results(count, seed=0):
+    """Yield ``count`` Bandit result entries."""
+    rng = random.Random(seed)
+    for i in range(count):
+        line = rng.randint(1, 2000)
+        test = rng.randint(101, 703)
+        yield {
+            'code': f"{line} password = 'hunter{i}'\n{line + 1} connect(user, password)\n",
+            'col_offset': rng.randint(0, 40),
+            'filename': f'./src/pkg{i % 60}/module{i % 700}.py',
+            'issue_confidence': rng.choice(SEVERITIES),
+            'issue_cwe': {'id': rng.choice([78, 89, 259, 327, 502]), 'link': 'https://cwe.mitre.org/data/definitions/259.html'},
+            'issue_severity': rng.choice(SEVERITIES),
+            'issue_text': f"Possible hardcoded password: 'hunter{i}' <check>",
+            'line_number': line,
+            'line_range': [line, line + 1],
+            'more_info': f'https://bandit.readthedocs.io/en/latest/plugins/b{test}.html',
+            'test_id': f'B{test}',
+            'test_name': f'check_{test % 40}',
+        }
+
+
+def write_bandit(path, count, seed=0):
+    """Write a Bandit JSON report with ``count`` findings to ``path``."""
+    data = {
+        'errors': [],
+        'generated_at': '2024-01-01T00:00:00Z',
+        'metrics': {'_totals': {'loc': count * 10, 'nosec': 0}},
+        'results': list(bandit_results(count, seed)),
+    }
+    with open(path, 'w') as f:
+        json.dump(data, f)
+    return path
+
+
+def trufflehog_findings(count, seed=0):
+    """Yield ``count`` Trufflehog (v2 JSON) findings."""
+    rng = random.Random(seed)
+    for i in range(count):
+        yield {
+            'branch': 'origin/main',
+            'commit': f'Update configuration {i}',
+            'commitHash': f'{rng.getrandbits(160):040x}',
+            'date': f'2024-01-{i % 28 + 1:02d} 12:00:00',
+            'diff': f'+API_KEY={rng.getrandbits(128):032x}\n',
+            'path': f'config/service{i % 40}/settings.env',
+            'printDiff': '+API_KEY=...',
+            'reason': rng.choice(['High Entropy', 'AWS API Key', 'Generic Secret']),
+            'stringsFound': [f'{rng.getrandbits(128):032x}'],
+        }
+
+
+def write_trufflehog(path, count, seed=0):
+    """Write a Trufflehog JSON array with ``count`` findings to ``path``."""
+    with open(path, 'w') as f:
+        json.dump(list(trufflehog_findings(count, seed)), f)
+    return path
+
+
+def safety_report(count, seed=0):
+    """A Safety 2.x JSON report with ``count`` vulnerabilities spread over a few hundred packages."""
+    rng = random.Random(seed)
+    packages = [f'package-{i}' for i in range(max(1, min(2000, count // 4)))]
+    vulnerabilities = []
+    for i in range(count):
+        version = f'{rng.randint(0, 9)}.{rng.randint(0, 30)}.{rng.randint(0, 9)}'
+        vulnerabilities.append({
+            'vulnerability_id': str(40000 + i),
+            'package_name': rng.choice(packages),
+            'ignored': {},
+            'ignored_reason': None,
+            'ignored_expires': None,
+            'vulnerable_spec': [f'<{version}'],
+            'all_vulnerable_specs': [f'<{version}'],
+            'analyzed_version': version,
+            'advisory': f'Affected versions are vulnerable to <crafted> input {i} leading to denial of service.',
+            'is_transitive': False,
+            'published_date': None,
+            'fixed_versions': [],
+            'closest_versions_without_known_vulnerabilities': [],
+            'resources': [],
+            'CVE': f'CVE-2024-{10000 + i}',
+            'severity': None,
+            'affected_versions': [],
+            'more_info_url': f'https://data.safetycli.com/v/{40000 + i}/f17',
+        })
+    affected = sorted({item['package_name'] for item in vulnerabilities})
+    scanned = packages + [f'clean-package-{i}' for i in range(len(packages))]
+    return {
+        'report_meta': {'scan_target': 'environment', 'packages_found': len(scanned), 'vulnerabilities_found': count},
+        'scanned_packages': {name: {'name': name, 'version': '1.0.0'} for name in scanned},
+        'affected_packages': {name: {'name': name, 'version': '1.0.0'} for name in affected},
+        'announcements': [],
+        'vulnerabilities': vulnerabilities,
+        'ignored_vulnerabilities': [],
+        'remediations': {},
+    }
+
+
+def write_safety(path, count, seed=0):
+    """Write a Safety JSON report with ``count`` vulnerabilities to ``path``."""
+    with open(path, 'w') as f:
+        json.dump(safety_report(count, seed), f)
+    return path
+
+
+SONAR_SEVERITIES = ['INFO', 'MINOR', 'MAJOR', 'CRITICAL', 'BLOCKER']
+
+
+def sonarqube_issues(count, seed=0):
+    """Yield ``count`` SonarQube issues as returned by ``api/issues/search``."""
+    rng = random.Random(seed)
+    for i in range(count):
+        line = rng.randint(1, 2000)
+        rule = rng.randint(100, 6000)
+        yield {
+            'key': f'AY{rng.getrandbits(64):016x}',
+            'rule': f'python:S{rule}',
+            'severity': rng.choice(SONAR_SEVERITIES),
+            'component': f'proj:src/pkg{i % 60}/module{i % 700}.py',
+            'project': 'proj',
+            'line': line,
+            'hash': f'{rng.getrandbits(128):032x}',
+            'textRange': {'startLine': line, 'endLine': line, 'startOffset': 4, 'endOffset': 40},
+            'flows': [{'locations': [{'component': f'proj:src/pkg{i % 60}/module{i % 700}.py',
+                                      'textRange': {'startLine': line, 'endLine': line, 'startOffset': 0, 'endOffset': 8},
+                                      'msg': 'Source of the value'}]}] if i % 5 == 0 else [],
+            'status': 'OPEN',
+            'message': f'Refactor this function to reduce its Cognitive Complexity from {rng.randint(16, 60)} to the 15 allowed <{i}>.',
+            'effort': f'{rng.randint(1, 60)}min',
+            'debt': f'{rng.randint(1, 60)}min',
+            'author': f'dev{i % 25}@example.com',
+            'tags': rng.sample(['brain-overload', 'cwe', 'owasp-a3', 'pitfall', 'suspicious'], 2),
+            'creationDate': f'2024-01-{i % 28 + 1:02d}T12:00:00+0000',
+            'updateDate': f'2024-02-{i % 28 + 1:02d}T12:00:00+0000',
+            'type': rng.choice(['BUG', 'VULNERABILITY', 'CODE_SMELL']),
+            'scope': 'MAIN',
+            'quickFixAvailable': False,
+            'cleanCodeAttribute': 'FOCUSED',
+            'impacts': [{'softwareQuality': 'MAINTAINABILITY', 'severity': 'HIGH'}],
+        }
+
+
+def sonarqube_hotspots(count, seed=0):
+    """Yield ``count`` SonarQube hotspots as returned by ``api/hotspots/search``."""
+    rng = random.Random(seed)
+    for i in range(count):
+        line = rng.randint(1, 2000)
+        yield {
+            'key': f'AZ{rng.getrandbits(64):016x}',
+            'component': f'proj:src/pkg{i % 60}/module{i % 700}.py',
+            'project': 'proj',
+            'securityCategory': rng.choice(['weak-cryptography', 'insecure-conf', 'auth', 'others', 'sql-injection']),
+            'vulnerabilityProbability': rng.choice(['LOW', 'MEDIUM', 'HIGH']),
+            'status': 'TO_REVIEW',
+            'line': line,
+            'message': f'Make sure this weak hash algorithm is not used in a sensitive context here <{i}>.',
+            'author': f'dev{i % 25}@example.com',
+            'creationDate': f'2024-01-{i % 28 + 1:02d}T12:00:00+0000',
+            'updateDate': f'2024-02-{i % 28 + 1:02d}T12:00:00+0000',
+            'textRange': {'startLine': line, 'endLine': line, 'startOffset': 4, 'endOffset': 40},
+            'flows': [],
+            'ruleKey': f'python:S{rng.randint(2000, 5000)}',
+        }
+
+
+def write_sonarqube(issues_path, hotspots_path, count, seed=0, hotspot_count=None):
+    """Write SonarQube issues and hotspots exports with ``count`` issues and as many hotspots unless given."""
+    hotspot_count = count if hotspot_count is None else hotspot_count
+    for path, key, items, total in [(issues_path, 'issues', sonarqube_issues, count), (hotspots_path, 'hotspots', sonarqube_hotspots, hotspot_count)]:
+        with open(path, 'w') as f:
+            json.dump({'paging': {'pageIndex': 1, 'pageSize': total, 'total': total}, key: list(items(total, seed)), 'components': []}, f)
+    return issues_path, hotspots_path
@@ -1,58 +1,117 @@
 import argparse
-import json
 import os
-import base64
-from jinja2 import Environment, FileSystemLoader
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import re
+import sys
+from collections import Counter, namedtuple
+from operator import attrgetter
 from textwrap import wrap
 
-# Argument parsing
-parser = argparse.ArgumentParser(description='Process the JSON file and HTML template.')
-parser.add_argument('file_path', type=str, help='Path to the JSON file')
-parser.add_argument('template_path', type=str, help='Path to the HTML template file')
-args = parser.parse_args()
-file_path = args.file_path
-template_path = args.template_path
-
-# Define the path for images
+# The shared modules sit in ../common, both in the library checkout and in .security-reports/ where the pipeline steps copy them
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'common'))
+from report_utils import FrameSchema, RowSpool, add_cache_arguments, add_chart_arguments, add_profile_arguments, add_table_arguments, aggregate, baseline_section, build_report, chart_job, counts_from_counter, diff_findings, iter_json_array, partition, record_type, records, subset, write_baseline_diff
+from history import add_history_arguments
+
+# Define the path for images, only written with --save-images
 images_path = './bandit/images/'
-os.makedirs(images_path, exist_ok=True)  # Create the directory if it doesn't exist
+report_path = './bandit/bandit-report.html'
+diff_path = './bandit/bandit-baseline-diff.json'
+
+SEVERITIES = ['LOW', 'MEDIUM', 'HIGH']
+AGGREGATES = {'severity': 'issue_severity', 'file': 'filename', 'confidence': 'issue_confidence', 'issue_type': 'test_name'}
+# Everything the charts and the template need, built once per scan
+BanditScan = namedtuple('BanditScan', ['counts', 'sections'])
+BanditRow = namedtuple('BanditRow', ['filename', 'line_number', 'code', 'issue_text', 'cwe_id', 'issue_confidence', 'more_info'])
+# Escaped copy of a BanditRow for server-side tables
+BanditRecord = record_type('BanditRecord', BanditRow._fields)
+# The only fields read from each result; the rest (line_range, col_offset, the CWE link, ...) is never loaded
+SCHEMA = FrameSchema(
+    {'issue_severity': 'issue_severity', 'test_name': 'test_name', 'filename': 'filename', 'line_number': 'line_number',
+     'code': 'code', 'issue_text': 'issue_text', 'cwe_id': ('issue_cwe', 'id'), 'issue_confidence': 'issue_confidence',
+     'more_info': 'more_info'},
+    categorical=['issue_severity', 'test_name', 'filename', 'issue_confidence', 'more_info'],
+)
+# How each BanditRow column is shown by client-side tables
+COLUMN_KINDS = ['text', 'text', 'pre', 'text', 'text', 'text', 'link']
+# Fixed findings in the baseline comparison
+BaselineRecord = record_type('BanditBaselineRecord', ['filename', 'line_number', 'test_id', 'issue_severity', 'issue_text'])
+BASELINE_COLUMNS = ['File', 'Line Number', 'Test', 'Severity', 'Description']
+# Line numbers Bandit puts in front of every line of a code snippet
+LINE_NUMBERS = re.compile(r'^\d+', re.MULTILINE)
 
-def get_image_as_data_url(image_path):
-    with open(image_path, 'rb') as image_file:
-        encoded_image = base64.b64encode(image_file.read()).decode()
-    return f"data:image/png;base64,{encoded_image}"
+# Argument parsing
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Process the JSON file and HTML template.')
+    parser.add_argument('file_path', type=str, help='Path to the JSON file')
+    parser.add_argument('template_path', type=str, help='Path to the HTML template file')
+    parser.add_argument('--stream', action='store_true', help='Read the results incrementally instead of loading the whole JSON file')
+    parser.add_argument('--save-images', action='store_true', help=f'Also write the chart images to {images_path}')
+    parser.add_argument('--baseline', help=f'Bandit JSON of an earlier scan: only report the findings that are new since then, list the fixed ones and write {diff_path}')
+    add_chart_arguments(parser)
+    add_table_arguments(parser)
+    add_cache_arguments(parser)
+    add_history_arguments(parser)
+    add_profile_arguments(parser)
+    return parser.parse_args(argv)
 
 # Functions
 def parse_json(data):
-    results = []
-    for item in data['results']:
-        item['cwe_id'] = item['issue_cwe']['id']
-        results.append(item)
-    df = pd.DataFrame(results)
+    return parse_results(data['results'])
+
+def parse_results(results):
+    df = SCHEMA.frame(results)
+    if df.empty:
+        # No findings (a clean scan or an empty baseline diff): keep the columns the tables and charts read
+        df = df.reindex(columns=list(SCHEMA.columns))
     return df
 
 def load_and_parse(file_path):
-    with open(file_path) as f:
-        data = json.load(f)
-    df = parse_json(data)
-    return df
+    # Results are decoded one at a time, so the whole JSON document is never held in memory
+    return parse_results(iter_json_array(file_path, 'results'))
+
+def normalize_code(code):
+    """Snippet without line numbers or layout, so a finding keeps its fingerprint when code moves."""
+    return ' '.join(LINE_NUMBERS.sub('', code or '').split())
+
+def fingerprint(item):
+    return item['filename'], item['test_id'], normalize_code(item.get('code'))
+
+def build_scan(df):
+    return BanditScan(aggregate(df, AGGREGATES), split_by_severity(df))
+
+def split_by_severity(df):
+    segments = partition(df[['issue_severity'] + list(BanditRow._fields)], 'issue_severity', SEVERITIES)
+    return {severity: segment[list(BanditRow._fields)].itertuples(index=False, name='BanditRow') for severity, segment in segments.items()}
+
+def stream_and_aggregate(file_path):
+    """Aggregate the results one record at a time, spooling table rows to disk."""
+    counters = {name: Counter() for name in AGGREGATES}
+    sections = {severity: RowSpool(BanditRow) for severity in SEVERITIES}
+    for item in iter_json_array(file_path, 'results'):
+        # Missing fields are skipped or left empty, as the schema does when loading a frame
+        for name, column in AGGREGATES.items():
+            if item.get(column) is not None:
+                counters[name][item[column]] += 1
+        if item.get('issue_severity') in sections:
+            sections[item['issue_severity']].append([
+                item.get('filename'), item.get('line_number'), item.get('code'), item.get('issue_text'),
+                (item.get('issue_cwe') or {}).get('id'), item.get('issue_confidence'), item.get('more_info'),
+            ])
+    counts = {name: counts_from_counter(counter) for name, counter in counters.items()}
+    return BanditScan(counts, sections)
 
 def wrap_text(text, width=30):
     """Wrap text into multiple lines of the given width."""
     return '\n'.join(wrap(text, width))
 
-def generate_severity_plot(df):
-    severity_counts = df['issue_severity'].value_counts()
+def generate_severity_plot(counts):
+    import matplotlib.pyplot as plt
+    severity_counts = counts['severity']
     severity_palette = {
         'LOW': "#FFEB3B",
         'MEDIUM': "#FF9800",
         'HIGH': "#F44336"
     }
-    plt.figure(figsize=(20, 12))
-    plt.rcParams.update({'font.size': 24})  # Increase the font size
+    fig = plt.figure(figsize=(20, 12))
     bars = plt.bar(severity_counts.index, severity_counts.values, color=[severity_palette[severity] for severity in severity_counts.index])
     plt.title('Number of Issues per Severity Level', fontsize=28)
     plt.xlabel('Severity Level', fontsize=24)
@@ -60,14 +119,15 @@ def generate_severity_plot(df):
     plt.xticks(fontsize=20)
     plt.yticks(fontsize=20)
     plt.tight_layout()
-    plt.savefig(os.path.join(images_path, 'severity_counts.png'), dpi=300)
+    return fig
 
-def generate_file_plot(df):
-    file_counts = df['filename'].value_counts().head(10)
+def generate_file_plot(counts):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    file_counts = counts['file'].head(10)
     wrapped_labels = [wrap_text(f"{fname} ({count})", width=40) for fname, count in file_counts.items()]
 
-    plt.figure(figsize=(20, 12))
-    plt.rcParams.update({'font.size': 24})  # Increase the font size
+    fig = plt.figure(figsize=(20, 12))
     sns.barplot(y=wrapped_labels, x=file_counts.values, palette=sns.color_palette(['#66BB6A', '#1f77b4', '#66bba2', '#ff7f0e']), orient='h')
     plt.title('Number of Issues per File (Top 10)', fontsize=28)
     plt.xlabel('Number of Issues', fontsize=24)
@@ -75,59 +135,95 @@ def generate_file_plot(df):
     plt.xticks(fontsize=20)
     plt.yticks(fontsize=20)
     plt.tight_layout()
-    plt.savefig(os.path.join(images_path, 'file_counts.png'), dpi=300)
+    return fig
 
-def generate_confidence_plot(df):
-    confidence_counts = df['issue_confidence'].value_counts()
-    plt.figure(figsize=(20, 12))
+def generate_confidence_plot(counts):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    confidence_counts = counts['confidence']
+    fig = plt.figure(figsize=(20, 12))
     sns.barplot(x=confidence_counts.index, y=confidence_counts.values, palette=sns.color_palette(['#66BB6A', '#1f77b4', '#66bba2', '#ff7f0e']))
     plt.title('Number of Issues per Confidence Level')
     plt.xlabel('Confidence Level')
     plt.ylabel('Number of Issues')
     plt.tight_layout()
-    plt.savefig(os.path.join(images_path, 'confidence_counts.png'), dpi=300)
+    return fig
 
-def generate_issue_type_plot(df):
-    issue_type_counts = df['test_name'].value_counts()
-    plt.figure(figsize=(20, 12))
+def generate_issue_type_plot(counts):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    issue_type_counts = counts['issue_type']
+    fig = plt.figure(figsize=(20, 12))
     sns.barplot(y=issue_type_counts.index[:10], x=issue_type_counts.values[:10], palette='viridis', orient='h')
     plt.title('Number of Issues per Type (Top 10)')
     plt.xlabel('Number of Issues')
     plt.ylabel('Issue Type')
     plt.tight_layout()
-    plt.savefig(os.path.join(images_path, 'issue_type_counts.png'), dpi=300)
-
-def generate_all_plots(file_path):
-    df = load_and_parse(file_path)
-    generate_severity_plot(df)
-    generate_file_plot(df)
-    generate_confidence_plot(df)
-    generate_issue_type_plot(df)
-
-# Main
-df = load_and_parse(file_path)
-generate_all_plots(file_path)
-
-# Convert the images to data URLs
-severity_plot_data_url = get_image_as_data_url(os.path.join(images_path, 'severity_counts.png'))
-file_plot_data_url = get_image_as_data_url(os.path.join(images_path, 'file_counts.png'))
-confidence_plot_data_url = get_image_as_data_url(os.path.join(images_path, 'confidence_counts.png'))
-issue_type_plot_data_url = get_image_as_data_url(os.path.join(images_path, 'issue_type_counts.png'))
-
-env = Environment(loader=FileSystemLoader('./'))
-template = env.get_template(template_path)
-
-print("Rendering template...")
-html_content = template.render(
-    data=df,
-    severity_plot=severity_plot_data_url,
-    file_plot=file_plot_data_url,
-    confidence_plot=confidence_plot_data_url,
-    issue_type_plot=issue_type_plot_data_url
-)
-
-print("Writing HTML content to file...")
-with open('./bandit/bandit-report.html', 'w') as f:
-    f.write(html_content)
-
-print("Finished writing file.")
\ No newline at end of file
+    return fig
+
+# Larger default font for every chart, applied per chart instead of globally
+CHART_RC = {'font.size': 24}
+
+# Template variable, image file name, plot function and plotted aggregate of every chart
+CHARTS = [
+    ('severity_plot', 'severity_counts.png', generate_severity_plot, 'severity'),
+    ('file_plot', 'file_counts.png', generate_file_plot, 'file'),
+    ('confidence_plot', 'confidence_counts.png', generate_confidence_plot, 'confidence'),
+    ('issue_type_plot', 'issue_type_counts.png', generate_issue_type_plot, 'issue_type'),
+]
+
+def chart_jobs(scan, args):
+    """Every chart of the scan, keyed by template variable."""
+    return [
+        chart_job(name, plot, subset(scan.counts, aggregate_name), dpi=300, rc=CHART_RC,
+                  save_path=os.path.join(images_path, image_name) if args.save_images else None)
+        for name, image_name, plot, aggregate_name in CHARTS
+    ]
+
+def read_scan(args, cache, timer):
+    """The results frame (the aggregated scan with --stream) and the baseline sections."""
+    if args.baseline:
+        with timer.stage('diff'):
+            diff = diff_findings(iter_json_array(args.file_path, 'results'), iter_json_array(args.baseline, 'results'), fingerprint)
+            write_baseline_diff(diff_path, {'bandit': diff})
+            baseline = [baseline_section('Bandit', diff, BASELINE_COLUMNS, BaselineRecord)]
+        # The rest of the report only covers the new findings
+        with timer.stage('parse'):
+            return parse_json({'results': diff.new}), baseline
+    if args.stream:
+        with timer.stage('parse'):
+            return stream_and_aggregate(args.file_path), None
+    with timer.stage('parse'):
+        model_key = cache.key('model', cache.file_digest(args.file_path))
+        df = cache.cached('model', model_key, lambda: load_and_parse(args.file_path))
+    timer.add_frames({'results': df})
+    return df, None
+
+def severity_totals(scan):
+    return {severity: int(scan.counts['severity'].get(severity, 0)) for severity in SEVERITIES}
+
+def table_total(scan):
+    return sum(severity_totals(scan).values())
+
+def table_sections(scan):
+    totals = severity_totals(scan)
+    return {severity: (COLUMN_KINDS, scan.sections[severity], totals[severity]) for severity in SEVERITIES}
+
+def template_context(scan, args):
+    return dict(
+        sections={severity: records(BanditRecord, rows) for severity, rows in scan.sections.items()},
+        severity_totals=severity_totals(scan),
+    )
+
+def main(argv=None):
+    generate_report(parse_args(argv))
+
+def generate_report(args):
+    return build_report(
+        args, 'bandit', __file__, report_path, [args.file_path], read_scan,
+        aggregate=None if args.stream and not args.baseline else build_scan, counts=attrgetter('counts'),
+        charts=chart_jobs, context=template_context, total=table_total, tables=table_sections,
+    )
+
+if __name__ == '__main__':
+    main()
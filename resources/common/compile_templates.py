@@ -0,0 +1,48 @@
+"""Regenerate compiled_templates.py, the Jinja-compiled code of the bundled templates.
+
+Run it after editing one of the templates (until then the edited template is
+simply compiled at run time):
+
+    python compile_templates.py
+"""
+import argparse
+import os
+
+import jinja2
+
+from report_utils import BUNDLED_TEMPLATES, COMMON_DIR, RESOURCES_DIR, template_digest, template_environment
+
+HEADER = '''"""Jinja-compiled code of the bundled templates, keyed by the SHA-256 of their source.
+
+Generated by compile_templates.py, do not edit.
+"""
+'''
+
+
+def compile_bundled(environment):
+    """``[(template, source digest, generated Python)]`` of every bundled template."""
+    compiled = []
+    for template in BUNDLED_TEMPLATES:
+        with open(os.path.join(RESOURCES_DIR, template), encoding='utf-8') as f:
+            source = f.read()
+        compiled.append((template, template_digest(source), environment.compile(source, template, raw=True)))
+    return compiled
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--output', default=os.path.join(COMMON_DIR, 'compiled_templates.py'))
+    args = parser.parse_args(argv)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(HEADER)
+        f.write(f"JINJA_VERSION = {'.'.join(jinja2.__version__.split('.')[:2])!r}\n")
+        f.write('TEMPLATES = {\n')
+        for template, digest, code in compile_bundled(template_environment()):
+            f.write(f'    # {template}\n    {digest!r}: {code!r},\n')
+        f.write('}\n')
+    print(f"Compiled {len(BUNDLED_TEMPLATES)} templates into {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,21 @@
+"""Jinja-compiled code of the bundled templates, keyed by the SHA-256 of their source.
+
+Generated by compile_templates.py, do not edit.
+"""
+JINJA_VERSION = '3.1'
+TEMPLATES = {
+    # bandit/report_template.html
+    '0e561a2b68a26ca40cfa3cc940fcf5a0a26a7fe8528ee024508ee6654cb5a53e': 'from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join\nname = \'bandit/report_template.html\'\n\ndef root(context, missing=missing, environment=environment):\n    resolve = context.resolve_or_missing\n    undefined = environment.undefined\n    concat = environment.concat\n    cond_expr_undefined = Undefined\n    if 0: yield None\n    l_0_baseline = resolve(\'baseline\')\n    l_0_no_charts = resolve(\'no_charts\')\n    l_0_severity_plot = resolve(\'severity_plot\')\n    l_0_file_plot = resolve(\'file_plot\')\n    l_0_issue_type_plot = resolve(\'issue_type_plot\')\n    l_0_confidence_plot = resolve(\'confidence_plot\')\n    l_0_severity_totals = resolve(\'severity_totals\')\n    l_0_findings = resolve(\'findings\')\n    try:\n        t_1 = environment.filters[\'lower\']\n    except KeyError:\n        @internalcode\n        def t_1(*unused):\n            raise TemplateRuntimeError("No filter named \'lower\' found.")\n    pass\n    yield \'<!DOCTYPE html>\\n<html>\\n<head>\\n    <meta charset="UTF-8">\\n    <title>Bandit Security Report</title>\\n    <style>\\n        body {\\n            font-family: Arial, sans-serif;\\n            color: #333;\\n            margin: 0;\\n            padding: 20px;\\n            line-height: 1.6;\\n            background-color: #f2f2f2;\\n        }\\n\\n        h1 {\\n            color: #333;\\n        }\\n\\n        h2, h3 {\\n            color: #555;\\n        }\\n\\n        .report-img {\\n            width: 48%;\\n            height: auto;\\n        }\\n\\n        .img-container {\\n            display: flex;\\n            justify-content: space-between;\\n            align-items: center;\\n            flex-wrap: wrap;\\n        }\\n\\n        table {\\n            width: 100%;\\n            border-collapse: collapse;\\n            margin-bottom: 20px;\\n            border-radius: 15px;\\n            overflow: hidden;\\n            box-shadow: 0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -2px rgba(0, 0, 0, 0.05);\\n        }\\n\\n        th, td {\\n            border: none;\\n            padding: 8px;\\n            text-align: left;\\n            background: transparent;\\n        }\\n\\n        .low {\\n            background: linear-gradient(to right, #FFEB3B, #FFC107);\\n        }\\n\\n        .medium {\\n            background: linear-gradient(to right, #FF9800, #FF5722);\\n        }\\n\\n        .high {\\n            background: linear-gradient(to right, #F44336, #B71C1C);\\n        }\\n\\n        .total-row {\\n            background-color: rgba(0, 120, 255, 0.1);\\n            font-weight: bold;\\n        }\\n    </style>\\n</head>\\n<body>\\n    <h1>Security Report</h1>\\n\\n    <h2>1. Bandit</h2>\\n    <p>\\n        Bandit is a comprehensive security analysis tool for Python applications.\\n        It\\\'s designed to find common security issues in Python code, such as insecure function calls or hardcoded passwords.\\n        Bandit works by analyzing the Abstract Syntax Tree (AST) of the Python code to find patterns that could indicate potential security issues.\\n    </p>\\n\\n    \'\n    if (undefined(name=\'baseline\') if l_0_baseline is missing else l_0_baseline):\n        pass\n        yield \'\\n    \'\n        template = environment.get_template(\'baseline_diff.html\', \'bandit/report_template.html\')\n        gen = template.root_render_func(template.new_context(context.get_all(), True, {}))\n        try:\n            for event in gen:\n                yield event\n        finally: gen.close()\n        yield \'\\n    \'\n    yield \'\\n\\n    \'\n    if (not (undefined(name=\'no_charts\') if l_0_no_charts is missing else l_0_no_charts)):\n        pass\n        yield \'\\n    <h2>2. Summary</h2>\\n    <!-- First row of images -->\\n    <img class="report-img" src="\'\n        yield str((undefined(name=\'severity_plot\') if l_0_severity_plot is missing else l_0_severity_plot))\n        yield \'" alt="Severity Count">\\n    <img class="report-img" src="\'\n        yield str((undefined(name=\'file_plot\') if l_0_file_plot is missing else l_0_file_plot))\n        yield \'" alt="File Count">\\n\\n    <!-- Margin between the rows -->\\n    <div style="margin: 30px 0;"></div>\\n\\n    <!-- Second row of images -->\\n    <img class="report-img" src="\'\n        yield str((undefined(name=\'issue_type_plot\') if l_0_issue_type_plot is missing else l_0_issue_type_plot))\n        yield \'" alt="Issue Type Count">\\n    <img class="report-img" src="\'\n        yield str((undefined(name=\'confidence_plot\') if l_0_confidence_plot is missing else l_0_confidence_plot))\n        yield \'" alt="Confidence Level Count">\\n    \'\n    yield \'\\n\\n    <h2>3. Details</h2>\\n    <p>\\n        In this section, we provide detailed information about each vulnerability found by the Bandit tool.\\n        This includes the file where the issue was found, the line number, a description of the issue, the severity and confidence levels, and a link to more information about how to fix it.\\n    </p>\\n\\n    \'\n    for (l_1_severity, l_1_total) in context.call(environment.getattr((undefined(name=\'severity_totals\') if l_0_severity_totals is missing else l_0_severity_totals), \'items\')):\n        l_1_sections = resolve(\'sections\')\n        _loop_vars = {}\n        pass\n        yield \'\\n        <h3>\'\n        yield str(l_1_severity)\n        yield \' Severity</h3>\\n        <table>\\n            <thead class="\'\n        yield str(t_1(l_1_severity))\n        yield \'">\\n                <tr>\\n                    <th>File</th>\\n                    <th>Line Number</th>\\n                    <th>Code</th>\\n                    <th>Description</th>\\n                    <th>CWE</th>\\n                    <th>Confidence</th>\\n                    <th>More Info</th>\\n                </tr>\\n            </thead>\\n            <tbody\'\n        if (undefined(name=\'findings\') if l_0_findings is missing else l_0_findings):\n            pass\n            yield \' data-findings="\'\n            yield str(l_1_severity)\n            yield \'"\'\n        yield \'>\\n                \'\n        if (not (undefined(name=\'findings\') if l_0_findings is missing else l_0_findings)):\n            pass\n            yield \'\\n                \'\n            for l_2_row in environment.getitem((undefined(name=\'sections\') if l_1_sections is missing else l_1_sections), l_1_severity):\n                _loop_vars = {}\n                pass\n                yield \'\\n                <tr>\\n                    <td>\'\n                yield str(environment.getattr(l_2_row, \'filename\'))\n                yield \'</td>\\n                    <td>\'\n                yield str(environment.getattr(l_2_row, \'line_number\'))\n                yield \'</td>\\n                    <td><pre>\'\n                yield str(environment.getattr(l_2_row, \'code\'))\n                yield \'</pre></td>\\n                    <td>\'\n                yield str(environment.getattr(l_2_row, \'issue_text\'))\n                yield \'</td>\\n                    <td>\'\n                yield str(environment.getattr(l_2_row, \'cwe_id\'))\n                yield \'</td>\\n                    <td>\'\n                yield str(environment.getattr(l_2_row, \'issue_confidence\'))\n                yield \'</td>\\n                    <td><a href="\'\n                yield str(environment.getattr(l_2_row, \'more_info\'))\n                yield \'">Link</a></td>\\n                </tr>\\n                \'\n            l_2_row = missing\n            yield \'\\n                \'\n        yield \'\\n                <!-- Total count for this severity -->\\n                <tr style="font-weight: bold;" class="total-row">\\n                    <td colspan="6">Total \'\n        yield str(l_1_severity)\n        yield \' Severity Issues</td>\\n                    <td>\'\n        yield str(l_1_total)\n        yield \'</td>\\n                </tr>\\n            </tbody>\\n        </table>\\n    \'\n    l_1_severity = l_1_total = l_1_sections = missing\n    yield \'\\n\\n    \'\n    if (undefined(name=\'findings\') if l_0_findings is missing else l_0_findings):\n        pass\n        yield \'\\n    \'\n        template = environment.get_template(\'findings_table.html\', \'bandit/report_template.html\')\n        gen = template.root_render_func(template.new_context(context.get_all(), True, {}))\n        try:\n            for event in gen:\n                yield event\n        finally: gen.close()\n        yield \'\\n    \'\n    yield \'\\n</body>\\n</html>\'\n\nblocks = {}\ndebug_info = \'80=26&81=29&84=37&87=40&88=42&94=44&95=46&104=49&105=54&107=56&118=58&119=64&120=67&122=71&123=73&124=75&125=77&126=79&127=81&128=83&134=88&135=90&141=94&142=97\'',
+    # safety/report_template.html
+    'bcd685179fa8d870a03aea902b5093212e12211defd78131d8f88469f807bb9b': 'from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join\nname = \'safety/report_template.html\'\n\ndef root(context, missing=missing, environment=environment):\n    resolve = context.resolve_or_missing\n    undefined = environment.undefined\n    concat = environment.concat\n    cond_expr_undefined = Undefined\n    if 0: yield None\n    l_0_no_charts = resolve(\'no_charts\')\n    l_0_total_packages_pie = resolve(\'total_packages_pie\')\n    l_0_vulnerabilities_per_package_pie = resolve(\'vulnerabilities_per_package_pie\')\n    l_0_rows = resolve(\'rows\')\n    l_0_total = resolve(\'total\')\n    pass\n    yield \'\\n<!DOCTYPE html>\\n<html>\\n<head>\\n    <meta charset="UTF-8">\\n    <title>Safety Security Report</title>\\n    <style>\\n        body {\\n            font-family: Arial, sans-serif;\\n            color: #333;\\n            margin: 0;\\n            padding: 20px;\\n            line-height: 1.6;\\n            background-color: #f2f2f2;\\n        }\\n\\n        .gradient {\\n        background: linear-gradient(to right, #66bba2, #66BB6A);\\n        }\\n\\n        .total-row {\\n            background-color: rgba(0, 120, 255, 0.1);\\n            font-weight: bold;\\n        }\\n\\n        h1 {\\n            color: #333;\\n        }\\n\\n        h2, h3 {\\n            color: #555;\\n        }\\n\\n        .report-img {\\n            width: 45%;\\n            height: auto;\\n        }\\n\\n        .img-container {\\n            display: flex;\\n            justify-content: space-between;\\n            align-items: center;\\n            flex-wrap: wrap;\\n        }\\n\\n        table {\\n            width: 100%;\\n            border-collapse: collapse;\\n            margin-bottom: 20px;\\n            border-radius: 15px;\\n            overflow: hidden;\\n            box-shadow: 0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -2px rgba(0, 0, 0, 0.05);\\n        }\\n\\n        th, td {\\n            border: none;\\n            padding: 8px;\\n            text-align: left;\\n            background: transparent;\\n        }\\n\\n        tr:nth-child(even) {\\n            background-color: #f2f2f2;\\n        }\\n\\n        .low {\\n            background: linear-gradient(to right, #FFEB3B, #FFC107);\\n        }\\n\\n        .medium {\\n            background: linear-gradient(to right, #FF9800, #FF5722);\\n        }\\n\\n        .high {\\n            background: linear-gradient(to right, #F44336, #B71C1C);\\n        }\\n    </style>\\n</head>\\n<body>\\n    <h1>Security Report</h1>\\n\\n    <h2>1. Safety</h2>\\n    <p>\\n        Safety is a comprehensive security analysis tool for Python applications.\\n        It\\\'s designed to find common security vulnerabilities in Python packages.\\n        Safety checks the installed Python packages against a database of known vulnerabilities.\\n    </p>\\n\\n    \'\n    if (not (undefined(name=\'no_charts\') if l_0_no_charts is missing else l_0_no_charts)):\n        pass\n        yield \'\\n    <h2>2. Summary</h2>\\n    <img class="report-img" src="\'\n        yield str((undefined(name=\'total_packages_pie\') if l_0_total_packages_pie is missing else l_0_total_packages_pie))\n        yield \'" alt="Total Packages Analyzed">\\n    <img class="report-img" src="\'\n        yield str((undefined(name=\'vulnerabilities_per_package_pie\') if l_0_vulnerabilities_per_package_pie is missing else l_0_vulnerabilities_per_package_pie))\n        yield \'" alt="Vulnerabilities per Package">\\n    \'\n    yield \'\\n\\n    <h2>3. Details</h2>\\n    <p>\\n        In this section, we provide detailed information about each vulnerability found by the Safety tool.\\n        This includes the package name, the installed version, a description of the vulnerability, and a link to more information about how to fix it.\\n    </p>\\n    \\n    <table>\\n        <thead class="gradient">\\n            <tr>\\n                <th>Package Name</th>\\n                <th>Installed Version</th>\\n                <th>Vulnerability</th>\\n                <th>More Info</th>\\n            </tr>\\n        </thead>\\n        <tbody>\\n            \'\n    for l_1_row in (undefined(name=\'rows\') if l_0_rows is missing else l_0_rows):\n        _loop_vars = {}\n        pass\n        yield \'\\n            <tr>\\n                <td>\'\n        yield str(environment.getattr(l_1_row, \'package_name\'))\n        yield \'</td>\\n                <td>\'\n        yield str(environment.getattr(l_1_row, \'analyzed_version\'))\n        yield \'</td>\\n                <td>\'\n        yield str(environment.getattr(l_1_row, \'advisory\'))\n        yield \'</td>\\n                <td><a href="\'\n        yield str(environment.getattr(l_1_row, \'more_info_url\'))\n        yield \'">Link</a></td>\\n            </tr>\\n            \'\n    l_1_row = missing\n    yield \'\\n            <tr style="font-weight: bold;" class="total-row">\\n                <td colspan="3">Total Vulnerabilities</td>\\n                <td>\'\n    yield str((undefined(name=\'total\') if l_0_total is missing else l_0_total))\n    yield \'</td>\\n            </tr>\\n        </tbody>\\n    </table>\\n\\n</body>\\n</html>\'\n\nblocks = {}\ndebug_info = \'89=17&91=20&92=22&111=25&113=29&114=31&115=33&116=35&121=39\'',
+    # sonarqube/report_template.html
+    '4e4c6db36b118975c4de293675fbec6d87f1b65e3a49dbe5c8688c87e10c8ec3': 'from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join\nname = \'sonarqube/report_template.html\'\n\ndef root(context, missing=missing, environment=environment):\n    resolve = context.resolve_or_missing\n    undefined = environment.undefined\n    concat = environment.concat\n    cond_expr_undefined = Undefined\n    if 0: yield None\n    l_0_baseline = resolve(\'baseline\')\n    l_0_no_charts = resolve(\'no_charts\')\n    l_0_severity_plot = resolve(\'severity_plot\')\n    l_0_file_plot = resolve(\'file_plot\')\n    l_0_issue_type_plot = resolve(\'issue_type_plot\')\n    l_0_category_plot = resolve(\'category_plot\')\n    l_0_vulnerability_prob_plot = resolve(\'vulnerability_prob_plot\')\n    l_0_hotspot_file_plot = resolve(\'hotspot_file_plot\')\n    l_0_issues_data_segmented = resolve(\'issues_data_segmented\')\n    l_0_hotspots_data_segmented = resolve(\'hotspots_data_segmented\')\n    l_0_findings = resolve(\'findings\')\n    try:\n        t_1 = environment.filters[\'lower\']\n    except KeyError:\n        @internalcode\n        def t_1(*unused):\n            raise TemplateRuntimeError("No filter named \'lower\' found.")\n    pass\n    yield \'<!DOCTYPE html>\\n<html>\\n<head>\\n    <title>Sonarqube Security Report</title>\\n    <style>\\n        body {\\n            font-family: Arial, sans-serif;\\n            color: #333;\\n            margin: 0;\\n            padding: 20px;\\n            line-height: 1.6;\\n        }\\n\\n        h1 {\\n            color: #333;\\n        }\\n\\n        h2, h3 {\\n            color: #555;\\n        }\\n\\n        .report-img {\\n            width: 48%;\\n            height: auto;\\n        }\\n\\n        .img-container {\\n            display: flex;\\n            justify-content: space-between;\\n            align-items: center;\\n            flex-wrap: wrap;\\n        }\\n\\n        table {\\n            width: 100%;\\n            border-collapse: collapse;\\n            margin-bottom: 20px;\\n            border-radius: 15px;\\n            overflow: hidden;\\n            box-shadow: 0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -2px rgba(0, 0, 0, 0.05);\\n        }\\n\\n        th, td {\\n            border: none;\\n            padding: 8px;\\n            text-align: left;\\n            background: transparent;\\n        }\\n\\n        .low {\\n            background: linear-gradient(to right, #FFEB3B, #FFC107);\\n        }\\n\\n        .medium {\\n            background: linear-gradient(to right, #FF9800, #FF5722);\\n        }\\n\\n        .high {\\n            background: linear-gradient(to right, #F44336, #B71C1C);\\n        }\\n\\n        .minor {\\n            background: linear-gradient(to right, #FFEB3B, #FFC107);\\n        }\\n\\n        .major {\\n            background: linear-gradient(to right, #FF9800, #FF5722);\\n        }\\n\\n        .critical {\\n            background: linear-gradient(to right, #F44336, #B71C1C);\\n        }\\n\\n        .info {\\n            background: linear-gradient(to right, #81D4FA, #29B6F6);\\n        }\\n\\n        .total-row {\\n            background-color: rgba(0, 120, 255, 0.1);\\n            font-weight: bold;\\n        }\\n    </style>\\n</head>\\n<body>\\n    <h1>SonarQube Security Report</h1>\\n\\n    <h2>1. Overview</h2>\\n    <p>\\n        SonarQube is an open-source platform developed by SonarSource for continuous inspection of code quality. \\n        It performs automatic reviews with static analysis of code to detect bugs, code smells, and security vulnerabilities.\\n    </p>\\n\\n    \'\n    if (undefined(name=\'baseline\') if l_0_baseline is missing else l_0_baseline):\n        pass\n        yield \'\\n    \'\n        template = environment.get_template(\'baseline_diff.html\', \'sonarqube/report_template.html\')\n        gen = template.root_render_func(template.new_context(context.get_all(), True, {}))\n        try:\n            for event in gen:\n                yield event\n        finally: gen.close()\n        yield \'\\n    \'\n    yield \'\\n\\n    \'\n    if (not (undefined(name=\'no_charts\') if l_0_no_charts is missing else l_0_no_charts)):\n        pass\n        yield \'\\n    <h2>2. Summary</h2>\\n    <div class="img-container">\\n        <img class="report-img" src="\'\n        yield str((undefined(name=\'severity_plot\') if l_0_severity_plot is missing else l_0_severity_plot))\n        yield \'" alt="Severity Count">\\n        <img class="report-img" src="\'\n        yield str((undefined(name=\'file_plot\') if l_0_file_plot is missing else l_0_file_plot))\n        yield \'" alt="File Count">\\n        <img class="report-img" src="\'\n        yield str((undefined(name=\'issue_type_plot\') if l_0_issue_type_plot is missing else l_0_issue_type_plot))\n        yield \'" alt="Issue Type and Total Security Hotspots">\\n        <img class="report-img" src="\'\n        yield str((undefined(name=\'category_plot\') if l_0_category_plot is missing else l_0_category_plot))\n        yield \'" alt="Number of Hotspots per Security Category">\\n        <img class="report-img" src="\'\n        yield str((undefined(name=\'vulnerability_prob_plot\') if l_0_vulnerability_prob_plot is missing else l_0_vulnerability_prob_plot))\n        yield \'" alt="Distribution of Hotspots by Vulnerability Probability">\\n        <img class="report-img" src="\'\n        yield str((undefined(name=\'hotspot_file_plot\') if l_0_hotspot_file_plot is missing else l_0_hotspot_file_plot))\n        yield \'" alt="Top 10 Components with Most Hotspots">\\n    </div>\\n    \'\n    yield \'\\n\\n    <h2>3. Issue Details</h2>\\n    <p>\\n        Detailed information about each vulnerability found by the SonarQube tool.\\n    </p>\\n\\n    \'\n    for (l_1_severity, l_1_data) in context.call(environment.getattr((undefined(name=\'issues_data_segmented\') if l_0_issues_data_segmented is missing else l_0_issues_data_segmented), \'items\')):\n        l_1_issues_severity_totals = resolve(\'issues_severity_totals\')\n        _loop_vars = {}\n        pass\n        yield \'\\n    <table>\\n        <thead class="\'\n        yield str(t_1(l_1_severity))\n        yield \'">\\n            <tr>\\n                <th>Component</th>\\n                <th>Line</th>\\n                <th>Severity</th>\\n                <th>Issue Type</th>\\n                <th>Message</th>\\n            </tr>\\n        </thead>\\n        <tbody\'\n        if (undefined(name=\'findings\') if l_0_findings is missing else l_0_findings):\n            pass\n            yield \' data-findings="issues:\'\n            yield str(l_1_severity)\n            yield \'"\'\n        yield \'>\\n            \'\n        if (not (undefined(name=\'findings\') if l_0_findings is missing else l_0_findings)):\n            pass\n            yield \'\\n            \'\n            for l_2_row in l_1_data:\n                _loop_vars = {}\n                pass\n                yield \'\\n            <tr>\\n                <td>\'\n                yield str(environment.getattr(l_2_row, \'component\'))\n                yield \'</td>\\n                <td>\'\n                yield str(environment.getattr(l_2_row, \'line\'))\n                yield \'</td>\\n                <td>\'\n                yield str(environment.getattr(l_2_row, \'severity\'))\n                yield \'</td>\\n                <td>\'\n                yield str(environment.getattr(l_2_row, \'type\'))\n                yield \'</td>\\n                <td>\'\n                yield str(environment.getattr(l_2_row, \'message\'))\n                yield \'</td>\\n            </tr>\\n            \'\n            l_2_row = missing\n            yield \'\\n            \'\n        yield \'\\n            <!-- Total count for this severity -->\\n            <tr class="total-row">\\n                <td colspan="4">Total \'\n        yield str(l_1_severity)\n        yield \' Issues</td>\\n                <td>\'\n        yield str(environment.getitem((undefined(name=\'issues_severity_totals\') if l_1_issues_severity_totals is missing else l_1_issues_severity_totals), l_1_severity))\n        yield \'</td>\\n            </tr>\\n        </tbody>\\n    </table>\\n    \'\n    l_1_severity = l_1_data = l_1_issues_severity_totals = missing\n    yield \'\\n\\n    <h2>4. Hotspot Details</h2>\\n    <p>\\n        Detailed information about each security hotspot found by the SonarQube tool.\\n    </p>\\n\\n    \'\n    for (l_1_prob, l_1_data) in context.call(environment.getattr((undefined(name=\'hotspots_data_segmented\') if l_0_hotspots_data_segmented is missing else l_0_hotspots_data_segmented), \'items\')):\n        l_1_hotspots_probability_totals = resolve(\'hotspots_probability_totals\')\n        _loop_vars = {}\n        pass\n        yield \'\\n    <table>\\n        <thead class="\'\n        yield str(t_1(l_1_prob))\n        yield \'">\\n            <tr>\\n                <th>Component</th>\\n                <th>Line</th>\\n                <th>Vulnerability Probability</th>\\n                <th>Message</th>\\n            </tr>\\n        </thead>\\n        <tbody\'\n        if (undefined(name=\'findings\') if l_0_findings is missing else l_0_findings):\n            pass\n            yield \' data-findings="hotspots:\'\n            yield str(l_1_prob)\n            yield \'"\'\n        yield \'>\\n            \'\n        if (not (undefined(name=\'findings\') if l_0_findings is missing else l_0_findings)):\n            pass\n            yield \'\\n            \'\n            for l_2_row in l_1_data:\n                _loop_vars = {}\n                pass\n                yield \'\\n            <tr>\\n                <td>\'\n                yield str(environment.getattr(l_2_row, \'component\'))\n                yield \'</td>\\n                <td>\'\n                yield str(environment.getattr(l_2_row, \'line\'))\n                yield \'</td>\\n                <td>\'\n                yield str(environment.getattr(l_2_row, \'vulnerabilityProbability\'))\n                yield \'</td>\\n                <td>\'\n                yield str(environment.getattr(l_2_row, \'message\'))\n                yield \'</td>\\n            </tr>\\n            \'\n            l_2_row = missing\n            yield \'\\n            \'\n        yield \'\\n            <tr class="total-row">\\n                <td colspan="4">Total \'\n        yield str(l_1_prob)\n        yield \' Vulnerability Probability</td>\\n                <td>\'\n        yield str(environment.getitem((undefined(name=\'hotspots_probability_totals\') if l_1_hotspots_probability_totals is missing else l_1_hotspots_probability_totals), l_1_prob))\n        yield \'</td>\\n            </tr>\\n        </tbody>\\n    </table>\\n    \'\n    l_1_prob = l_1_data = l_1_hotspots_probability_totals = missing\n    yield \'\\n\\n    \'\n    if (undefined(name=\'findings\') if l_0_findings is missing else l_0_findings):\n        pass\n        yield \'\\n    \'\n        template = environment.get_template(\'findings_table.html\', \'sonarqube/report_template.html\')\n        gen = template.root_render_func(template.new_context(context.get_all(), True, {}))\n        try:\n            for event in gen:\n                yield event\n        finally: gen.close()\n        yield \'\\n    \'\n    yield \'\\n</body>\\n</html>\'\n\nblocks = {}\ndebug_info = \'93=29&94=32&97=40&100=43&101=45&102=47&103=49&104=51&105=53&114=56&116=61&125=63&126=69&127=72&129=76&130=78&131=80&132=82&133=84&139=89&140=91&151=95&153=100&161=102&162=108&163=111&165=115&166=117&167=119&168=121&173=126&174=128&180=132&181=135\'',
+    # trufflehog/report_template.html
+    'd1240d279b64bd6eaeea1f6268d9eea83efbadc2c970fd21e2ee5b3fbf408339': 'from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join\nname = \'trufflehog/report_template.html\'\n\ndef root(context, missing=missing, environment=environment):\n    resolve = context.resolve_or_missing\n    undefined = environment.undefined\n    concat = environment.concat\n    cond_expr_undefined = Undefined\n    if 0: yield None\n    l_0_baseline = resolve(\'baseline\')\n    l_0_no_charts = resolve(\'no_charts\')\n    l_0_file_plot = resolve(\'file_plot\')\n    l_0_findings = resolve(\'findings\')\n    l_0_rows = resolve(\'rows\')\n    l_0_total = resolve(\'total\')\n    pass\n    yield \'<!DOCTYPE html>\\n<html>\\n<head>\\n    <meta charset="UTF-8">\\n    <title>Trufflehog Security Report</title>\\n    <style>\\n        body {\\n            font-family: Arial, sans-serif;\\n            color: #333;\\n            margin: 0;\\n            padding: 20px;\\n            line-height: 1.5; \\n        }\\n\\n        h1 {\\n            color: #444;\\n            font-size: 24px; \\n        }\\n\\n        h2 {\\n            color: #555;\\n            font-size: 20px; \\n        }\\n\\n        h3 {\\n            color: #666;\\n            font-size: 18px; \\n        }\\n\\n        p {\\n            color: #777;\\n            font-size: 16px; \\n        }\\n\\n        .report-img {\\n            width: 40%;\\n            height: auto;\\n            display: block;\\n            margin: 20px auto;\\n        }\\n\\n        table {\\n            width: 100%;\\n            border-collapse: collapse;\\n            margin-bottom: 20px;\\n            border-radius: 15px;\\n            overflow: hidden;\\n            box-shadow: 0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -2px rgba(0, 0, 0, 0.05);\\n        }\\n\\n        thead {\\n            background-image: linear-gradient(to right, #0072ff, #00c6ff);\\n        }\\n\\n        th {\\n            background: transparent;\\n            color: white !important;\\n            padding: 8px;\\n            text-align: left;\\n        }\\n\\n        th, td {\\n            border: none;\\n            padding: 8px;\\n            text-align: left;\\n            color: #777;\\n            font-size: 16px; \\n        }\\n\\n        .total-row {\\n            background-color: rgba(0, 120, 255, 0.1);\\n            font-weight: bold;\\n        }\\n    </style>\\n</head>\\n<body>\\n    <h1>Security Report</h1>\\n\\n    <h2>1. Trufflehog</h2>\\n    <p>\\n        Trufflehog is a tool designed to search through git repositories for secrets, digging deep into commit history and branches. It looks for high entropy strings, which are likely to contain secrets.\\n    </p>\\n\\n    \'\n    if (undefined(name=\'baseline\') if l_0_baseline is missing else l_0_baseline):\n        pass\n        yield \'\\n    \'\n        template = environment.get_template(\'baseline_diff.html\', \'trufflehog/report_template.html\')\n        gen = template.root_render_func(template.new_context(context.get_all(), True, {}))\n        try:\n            for event in gen:\n                yield event\n        finally: gen.close()\n        yield \'\\n    \'\n    yield \'\\n\\n    \'\n    if (not (undefined(name=\'no_charts\') if l_0_no_charts is missing else l_0_no_charts)):\n        pass\n        yield \'\\n    <h2>2. Summary</h2>\\n    <img class="report-img" src="\'\n        yield str((undefined(name=\'file_plot\') if l_0_file_plot is missing else l_0_file_plot))\n        yield \'" alt="File Count">\\n    \'\n    yield \'\\n\\n    <h2>3. Details</h2>\\n    <p>\\n        In this section, we provide detailed information about each potential secret found by Trufflehog.\\n    </p>\\n\\n    <table>\\n        <thead>\\n            <tr>\\n                <th>File</th>\\n                <th>Commit</th>\\n                <th>Date</th>\\n                <th>Reason</th>\\n                <th>Strings Found</th>\\n            </tr>\\n        </thead>\\n        <tbody\'\n    if (undefined(name=\'findings\') if l_0_findings is missing else l_0_findings):\n        pass\n        yield \' data-findings="secrets"\'\n    yield \'>\\n            \'\n    if (not (undefined(name=\'findings\') if l_0_findings is missing else l_0_findings)):\n        pass\n        yield \'\\n            \'\n        for l_1_row in (undefined(name=\'rows\') if l_0_rows is missing else l_0_rows):\n            _loop_vars = {}\n            pass\n            yield \'\\n            <tr>\\n                <td>\'\n            yield str(environment.getattr(l_1_row, \'path\'))\n            yield \'</td>\\n                <td>\'\n            yield str(environment.getattr(l_1_row, \'commit\'))\n            yield \'</td>\\n                <td>\'\n            yield str(environment.getattr(l_1_row, \'date\'))\n            yield \'</td>\\n                <td>\'\n            yield str(environment.getattr(l_1_row, \'reason\'))\n            yield \'</td>\\n                <td>\'\n            yield str(environment.getattr(l_1_row, \'stringsFound\'))\n            yield \'</td>\\n            </tr>\\n            \'\n        l_1_row = missing\n        yield \'\\n            \'\n    yield \'\\n            <tr style="font-weight: bold;" class="total-row">\\n                <td colspan="4">Total Potential Secrets Found</td>\\n                <td>\'\n    yield str((undefined(name=\'total\') if l_0_total is missing else l_0_total))\n    yield \'</td>\\n            </tr>\\n        </tbody>\\n    </table>\\n\\n    \'\n    if (undefined(name=\'findings\') if l_0_findings is missing else l_0_findings):\n        pass\n        yield \'\\n    \'\n        template = environment.get_template(\'findings_table.html\', \'trufflehog/report_template.html\')\n        gen = template.root_render_func(template.new_context(context.get_all(), True, {}))\n        try:\n            for event in gen:\n                yield event\n        finally: gen.close()\n        yield \'\\n    \'\n    yield \'\\n</body>\\n</html>\'\n\nblocks = {}\ndebug_info = \'84=18&85=21&88=29&90=32&108=35&109=39&110=42&112=46&113=48&114=50&115=52&116=54&122=59&127=61&128=64\'',
+    # common/findings_table.html
+    '2cc14bae046c35765d59b6fbeed67ca9d5f3ddce27c3e565593aabd75af8cbcf': 'from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join\nname = \'common/findings_table.html\'\n\ndef root(context, missing=missing, environment=environment):\n    resolve = context.resolve_or_missing\n    undefined = environment.undefined\n    concat = environment.concat\n    cond_expr_undefined = Undefined\n    if 0: yield None\n    l_0_findings = resolve(\'findings\')\n    pass\n    yield \'<style>\\n    .pager {\\n        display: flex;\\n        align-items: center;\\n        gap: 12px;\\n        margin: -10px 0 20px;\\n    }\\n\\n    .pager button {\\n        padding: 4px 12px;\\n        border: none;\\n        border-radius: 6px;\\n        background-color: rgba(0, 120, 255, 0.1);\\n        cursor: pointer;\\n    }\\n\\n    .pager button:disabled {\\n        cursor: default;\\n        opacity: 0.5;\\n    }\\n</style>\\n<script type="application/json" id="findings-data">\'\n    yield str((undefined(name=\'findings\') if l_0_findings is missing else l_0_findings))\n    yield \'</script>\\n<script>\\n    // Renders the findings of every <tbody data-findings="..."> one page at a time,\\n    // from rows embedded above or from chunk files loaded on demand.\\n    (function () {\\n        var config = JSON.parse(document.getElementById(\\\'findings-data\\\').textContent);\\n        var pageSize = config.pageSize;\\n        var pending = {};\\n\\n        window.reportFindingsPage = function (section, page, rows) {\\n            var callback = pending[section + \\\':\\\' + page];\\n            delete pending[section + \\\':\\\' + page];\\n            if (callback) {\\n                callback(rows);\\n            }\\n        };\\n\\n        function loadPage(section, page, callback) {\\n            var info = config.sections[section];\\n            if (info.rows) {\\n                callback(info.rows.slice(page * pageSize, (page + 1) * pageSize));\\n                return;\\n            }\\n            if (page >= info.pages) {\\n                callback([]);\\n                return;\\n            }\\n            pending[section + \\\':\\\' + page] = callback;\\n            var script = document.createElement(\\\'script\\\');\\n            script.src = info.src.replace(\\\'{page}\\\', page);\\n            script.onload = function () {\\n                script.remove();\\n            };\\n            document.head.appendChild(script);\\n        }\\n\\n        function cell(kind, value) {\\n            var td = document.createElement(\\\'td\\\');\\n            if (kind === \\\'pre\\\') {\\n                var pre = document.createElement(\\\'pre\\\');\\n                pre.textContent = value;\\n                td.appendChild(pre);\\n            } else if (kind === \\\'link\\\') {\\n                var link = document.createElement(\\\'a\\\');\\n                if (/^https?:\\\\/\\\\//i.test(value)) {\\n                    link.href = value;\\n                }\\n                link.textContent = \\\'Link\\\';\\n                td.appendChild(link);\\n            } else {\\n                td.textContent = value;\\n            }\\n            return td;\\n        }\\n\\n        document.querySelectorAll(\\\'tbody[data-findings]\\\').forEach(function (tbody) {\\n            var section = tbody.getAttribute(\\\'data-findings\\\');\\n            var info = config.sections[section];\\n            var pages = Math.max(1, Math.ceil(info.total / pageSize));\\n            var totalRow = tbody.querySelector(\\\'tr.total-row\\\');\\n\\n            var pager = document.createElement(\\\'div\\\');\\n            pager.className = \\\'pager\\\';\\n            var previous = document.createElement(\\\'button\\\');\\n            previous.textContent = \\\'\\\\u2039 Previous\\\';\\n            var label = document.createElement(\\\'span\\\');\\n            var next = document.createElement(\\\'button\\\');\\n            next.textContent = \\\'Next \\\\u203a\\\';\\n            pager.append(previous, label, next);\\n            tbody.closest(\\\'table\\\').insertAdjacentElement(\\\'afterend\\\', pager);\\n\\n            var current = 0;\\n            function show(page) {\\n                loadPage(section, page, function (rows) {\\n                    current = page;\\n                    tbody.querySelectorAll(\\\'tr.finding\\\').forEach(function (tr) {\\n                        tr.remove();\\n                    });\\n                    rows.forEach(function (row) {\\n                        var tr = document.createElement(\\\'tr\\\');\\n                        tr.className = \\\'finding\\\';\\n                        row.forEach(function (value, index) {\\n                            tr.appendChild(cell(info.columns[index], value));\\n                        });\\n                        tbody.insertBefore(tr, totalRow);\\n                    });\\n                    label.textContent = \\\'Page \\\' + (page + 1) + \\\' of \\\' + pages;\\n                    previous.disabled = page === 0;\\n                    next.disabled = page >= pages - 1;\\n                });\\n            }\\n            previous.addEventListener(\\\'click\\\', function () {\\n                show(current - 1);\\n            });\\n            next.addEventListener(\\\'click\\\', function () {\\n                show(current + 1);\\n            });\\n            show(0);\\n        });\\n    })();\\n</script>\'\n\nblocks = {}\ndebug_info = \'22=13\'',
+    # common/baseline_diff.html
+    '3bd6a9511ad6a86cfa514d97285fad002b5d57222d3f386881b8c1267215f260': 'from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join\nname = \'common/baseline_diff.html\'\n\ndef root(context, missing=missing, environment=environment):\n    resolve = context.resolve_or_missing\n    undefined = environment.undefined\n    concat = environment.concat\n    cond_expr_undefined = Undefined\n    if 0: yield None\n    l_0_baseline = resolve(\'baseline\')\n    pass\n    yield \'<style>\\n    .baseline-counts {\\n        background: linear-gradient(to right, #0072ff, #00c6ff);\\n        color: #fff;\\n    }\\n\\n    .baseline-fixed {\\n        background: linear-gradient(to right, #66BB6A, #2E7D32);\\n        color: #fff;\\n    }\\n</style>\\n<h2>Baseline Comparison</h2>\\n<p>\\n    This report only covers the difference to the baseline scan: the summary and details\\n    sections show the new findings, the findings fixed since the baseline are listed here.\\n</p>\\n\'\n    for l_1_section in (undefined(name=\'baseline\') if l_0_baseline is missing else l_0_baseline):\n        _loop_vars = {}\n        pass\n        yield \'\\n<h3>\'\n        yield str(environment.getattr(l_1_section, \'title\'))\n        yield \'</h3>\\n<table>\\n    <thead class="baseline-counts">\\n        <tr>\\n            <th>New</th>\\n            <th>Fixed</th>\\n            <th>Unchanged</th>\\n        </tr>\\n    </thead>\\n    <tbody>\\n        <tr>\\n            <td>\'\n        yield str(environment.getattr(l_1_section, \'new\'))\n        yield \'</td>\\n            <td>\'\n        yield str(environment.getattr(l_1_section, \'fixed\'))\n        yield \'</td>\\n            <td>\'\n        yield str(environment.getattr(l_1_section, \'unchanged\'))\n        yield \'</td>\\n        </tr>\\n    </tbody>\\n</table>\\n\'\n        if environment.getattr(l_1_section, \'fixed\'):\n            pass\n            yield \'\\n<table>\\n    <thead class="baseline-fixed">\\n        <tr>\\n            \'\n            for l_2_column in environment.getattr(l_1_section, \'columns\'):\n                _loop_vars = {}\n                pass\n                yield \'\\n            <th>\'\n                yield str(l_2_column)\n                yield \'</th>\\n            \'\n            l_2_column = missing\n            yield \'\\n        </tr>\\n    </thead>\\n    <tbody>\\n        \'\n            for l_2_row in environment.getattr(l_1_section, \'fixed_rows\'):\n                _loop_vars = {}\n                pass\n                yield \'\\n        <tr>\\n            \'\n                for l_3_value in l_2_row:\n                    _loop_vars = {}\n                    pass\n                    yield \'\\n            <td>\'\n                    yield str(l_3_value)\n                    yield \'</td>\\n            \'\n                l_3_value = missing\n                yield \'\\n        </tr>\\n        \'\n            l_2_row = missing\n            yield \'\\n    </tbody>\\n</table>\\n\'\n        yield \'\\n\'\n    l_1_section = missing\n\nblocks = {}\ndebug_info = \'17=13&18=17&29=19&30=21&31=23&35=25&39=28&40=32&45=36&47=40&48=44\'',
+    # common/trend_template.html
+    '49dbde4deffea540808b3a572d3cedd927a8078046f1e10deb3290898b701f0d': 'from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join\nname = \'common/trend_template.html\'\n\ndef root(context, missing=missing, environment=environment):\n    resolve = context.resolve_or_missing\n    undefined = environment.undefined\n    concat = environment.concat\n    cond_expr_undefined = Undefined\n    if 0: yield None\n    l_0_tool = resolve(\'tool\')\n    l_0_builds = resolve(\'builds\')\n    l_0_charts = resolve(\'charts\')\n    try:\n        t_1 = environment.filters[\'capitalize\']\n    except KeyError:\n        @internalcode\n        def t_1(*unused):\n            raise TemplateRuntimeError("No filter named \'capitalize\' found.")\n    pass\n    yield \'<!DOCTYPE html>\\n<html>\\n<head>\\n    <meta charset="UTF-8">\\n    <title>\'\n    yield str(t_1((undefined(name=\'tool\') if l_0_tool is missing else l_0_tool)))\n    yield \' Trends</title>\\n    <style>\\n        body {\\n            font-family: Arial, sans-serif;\\n            color: #333;\\n            margin: 0;\\n            padding: 20px;\\n            line-height: 1.6;\\n            background-color: #f2f2f2;\\n        }\\n\\n        h1 {\\n            color: #333;\\n        }\\n\\n        h2 {\\n            color: #555;\\n        }\\n\\n        .report-img {\\n            width: 90%;\\n            height: auto;\\n        }\\n    </style>\\n</head>\\n<body>\\n    <h1>\'\n    yield str(t_1((undefined(name=\'tool\') if l_0_tool is missing else l_0_tool)))\n    yield \' Trends</h1>\\n    <p>\\n        Findings per build over the last \'\n    yield str((undefined(name=\'builds\') if l_0_builds is missing else l_0_builds))\n    yield \' recorded runs, one chart per aggregate of the report.\\n    </p>\\n\\n    \'\n    for (l_1_aggregate, l_1_chart) in (undefined(name=\'charts\') if l_0_charts is missing else l_0_charts):\n        _loop_vars = {}\n        pass\n        yield \'\\n    <h2>\'\n        yield str(l_1_aggregate)\n        yield \'</h2>\\n    \'\n        if l_1_chart:\n            pass\n            yield \'\\n    <img class="report-img" src="\'\n            yield str(l_1_chart)\n            yield \'" alt="\'\n            yield str(l_1_aggregate)\n            yield \' per build">\\n    \'\n        yield \'\\n    \'\n    l_1_aggregate = l_1_chart = missing\n    yield \'\\n</body>\\n</html>\'\n\nblocks = {}\ndebug_info = \'5=21&31=23&33=25&36=27&37=31&38=33&39=36\'',
+}
@@ -0,0 +1,119 @@
+"""Build the reports of several scanners in one Python process.
+
+Each tool's html_generator.py still works on its own; this entry point loads them
+side by side so pandas, matplotlib, seaborn and the Jinja environment are imported
+and set up once instead of once per report.
+
+    python generate_reports.py --bandit bandit.json --safety safety.json \\
+        --sonarqube issues.json hotspots.json --trufflehog trufflehog.json --jobs 4
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+from history import add_history_arguments
+from report_utils import add_cache_arguments, add_chart_arguments, add_profile_arguments, add_table_arguments, load_generator, template_environment
+
+TOOLS = ['bandit', 'safety', 'sonarqube', 'trufflehog']
+# Tools whose generator can read its input incrementally (--stream)
+STREAMING_TOOLS = ['bandit', 'trufflehog']
+# Tools whose generator can compare against a baseline scan (--baseline)
+BASELINE_TOOLS = ['bandit', 'sonarqube', 'trufflehog']
+
+
+# Cheap: the generators import pandas and matplotlib lazily
+GENERATORS = {tool: load_generator(tool) for tool in TOOLS}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Generate the HTML reports of several scanners in one process.')
+    parser.add_argument('--bandit', metavar='JSON', help='Bandit results')
+    parser.add_argument('--safety', metavar='JSON', help='Safety results')
+    parser.add_argument('--sonarqube', nargs=2, metavar=('ISSUES_JSON', 'HOTSPOTS_JSON'), help='SonarQube issues and hotspots')
+    parser.add_argument('--trufflehog', metavar='JSON', help='Trufflehog results')
+    parser.add_argument('--sonarqube-server-url', help='Fetch the SonarQube issues and hotspots from this server into the --sonarqube paths')
+    parser.add_argument('--sonarqube-project-key', help='Project to fetch with --sonarqube-server-url')
+    parser.add_argument('--sonarqube-branch', help='Branch to fetch with --sonarqube-server-url')
+    parser.add_argument('--sonarqube-token', default=os.environ.get('SONAR_TOKEN'), help='SonarQube token (default $SONAR_TOKEN)')
+    parser.add_argument('--fetch-workers', type=int, default=4, help='SonarQube pages fetched concurrently (default 4)')
+    parser.add_argument('--baseline-bandit', metavar='JSON', help='Bandit results of an earlier scan, report only the difference')
+    parser.add_argument('--baseline-sonarqube', nargs=2, metavar=('ISSUES_JSON', 'HOTSPOTS_JSON'), help='SonarQube issues and hotspots of an earlier analysis')
+    parser.add_argument('--baseline-trufflehog', metavar='JSON', help='Trufflehog results of an earlier scan')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Build this many reports concurrently in worker processes (0 = one per tool, default 1 = one after another)')
+    parser.add_argument('--stream', action='store_true', help=f"Read the results incrementally ({', '.join(STREAMING_TOOLS)})")
+    parser.add_argument('--save-images', action='store_true', help='Also write the chart images next to each report')
+    add_chart_arguments(parser)
+    add_table_arguments(parser)
+    add_cache_arguments(parser)
+    add_history_arguments(parser)
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+    if not any(getattr(args, tool) for tool in TOOLS):
+        parser.error('no scanner output given, expected at least one of ' + ', '.join(f'--{tool}' for tool in TOOLS))
+    if args.sonarqube_server_url and not (args.sonarqube and args.sonarqube_project_key):
+        parser.error('--sonarqube-server-url requires --sonarqube and --sonarqube-project-key')
+    return args
+
+
+def tool_arguments(tool, args):
+    """The arguments ``<tool>/html_generator.py`` would have parsed from its own command line."""
+    tool_args = argparse.Namespace(**vars(args))
+    tool_args.template_path = f'{tool}/report_template.html'
+    tool_args.stream = args.stream and tool in STREAMING_TOOLS
+    tool_args.baseline = getattr(args, f'baseline_{tool}', None) if tool in BASELINE_TOOLS else None
+    if tool == 'sonarqube':
+        tool_args.issues_file_path, tool_args.hotspots_file_path = args.sonarqube
+        tool_args.server_url, tool_args.project_key = args.sonarqube_server_url, args.sonarqube_project_key
+        tool_args.branch, tool_args.token = args.sonarqube_branch, args.sonarqube_token
+    else:
+        tool_args.file_path = getattr(args, tool)
+    return tool_args
+
+
+def build_report(tool, tool_args):
+    """Build one report; returns the formatted traceback on failure so the other reports still get built."""
+    print(f'[{tool}] Building report...')
+    try:
+        GENERATORS[tool].generate_report(tool_args)
+    except Exception:
+        return traceback.format_exc()
+    return None
+
+
+def preload(charts):
+    """Import the heavy modules up front so forked workers inherit them instead of importing them again."""
+    import pandas
+    if charts:
+        import matplotlib.pyplot
+        import seaborn
+    template_environment()
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    tools = [tool for tool in TOOLS if getattr(args, tool)]
+    jobs = [(tool, tool_arguments(tool, args)) for tool in tools]
+
+    workers = min(args.jobs or len(jobs), len(jobs))
+    if workers <= 1:
+        errors = [build_report(tool, tool_args) for tool, tool_args in jobs]
+    else:
+        preload(charts=not args.no_charts)
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            errors = list(pool.map(build_report, *zip(*jobs)))
+
+    failed = [(tool, error) for tool, error in zip(tools, errors) if error]
+    for tool, error in failed:
+        print(f'[{tool}] Report failed:\n{error}', file=sys.stderr)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
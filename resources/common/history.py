@@ -0,0 +1,204 @@
+"""Per-build history of the report aggregates and the trend charts built from it.
+
+The generators append each run's counts (the same aggregates their charts plot)
+with ``--history-dir``; trends are then drawn from those summaries alone, without
+reading any archived scan:
+
+    python history.py --history-dir reports-history --tool bandit --last 500
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows agents: appends are not locked
+    fcntl = None
+
+from report_utils import add_chart_arguments, chart_job, render_charts, render_profile_from_args, template_environment, write_report
+
+# One entry per (run, aggregate, label): ids into the string dictionary and the count
+COLUMNS = ['run', 'aggregate', 'label', 'count']
+COLUMN_DTYPE = '<u4'
+# Lines drawn per trend chart, the remaining labels are summed into "Others"
+DEFAULT_TOP = 8
+
+Trend = namedtuple('Trend', ['builds', 'labels', 'counts'])
+
+
+def add_history_arguments(parser):
+    parser.add_argument('--history-dir', help='Append the aggregates of this run to the history kept in this directory')
+    parser.add_argument('--build-id', default=os.environ.get('BUILD_NUMBER'),
+                        help='Label of this run in the history (default $BUILD_NUMBER, else the run time)')
+
+
+class HistoryStore:
+    """Aggregate counts of one tool over many runs, stored column-wise in append-only files.
+
+    ``<directory>/<tool>/`` holds one little-endian uint32 file per column, a JSON
+    lines dictionary of the aggregate and label strings, and ``runs.jsonl`` with
+    one line per run. Runs are committed by their ``runs.jsonl`` line, which is
+    written last, so a run interrupted halfway is ignored by readers.
+    """
+
+    def __init__(self, directory, tool):
+        self.path = os.path.join(directory, tool)
+
+    def _file(self, name):
+        return os.path.join(self.path, name)
+
+    @contextmanager
+    def _lock(self):
+        os.makedirs(self.path, exist_ok=True)
+        with open(self._file('.lock'), 'w') as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            yield
+
+    def _read_lines(self, name):
+        try:
+            with open(self._file(name)) as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+
+    def _read_column(self, name):
+        import numpy as np
+
+        path = self._file(f'{name}.u32')
+        return np.fromfile(path, dtype=COLUMN_DTYPE) if os.path.exists(path) else np.zeros(0, COLUMN_DTYPE)
+
+    def _read_columns(self):
+        columns = {name: self._read_column(name) for name in COLUMNS}
+        # A run that died while appending may have left some columns longer than others
+        length = min(len(column) for column in columns.values())
+        return {name: column[:length] for name, column in columns.items()}
+
+    def append(self, counts, build_id=None):
+        """Record one run: ``counts`` maps aggregate names to ``{label: count}`` (e.g. Series)."""
+        import numpy as np
+
+        with self._lock():
+            runs = self._read_lines('runs.jsonl')
+            strings = self._read_lines('strings.jsonl')
+            ids = {string: index for index, string in enumerate(strings)}
+            new_strings = []
+
+            def string_id(value):
+                value = str(value)
+                if value not in ids:
+                    ids[value] = len(ids)
+                    new_strings.append(value)
+                return ids[value]
+
+            run = len(runs)
+            rows = [(run, string_id(aggregate), string_id(label), int(count))
+                    for aggregate, values in counts.items() for label, count in values.items()]
+            # Drop what an interrupted run appended after the last committed one; runs are
+            # appended in order, so the committed entries are a prefix of the run column
+            length = int(np.searchsorted(self._read_column('run'), run))
+            with open(self._file('strings.jsonl'), 'a') as f:
+                f.writelines(json.dumps(string) + '\n' for string in new_strings)
+            for index, name in enumerate(COLUMNS):
+                with open(self._file(f'{name}.u32'), 'ab') as f:
+                    f.truncate(length * np.dtype(COLUMN_DTYPE).itemsize)
+                    np.array([row[index] for row in rows], dtype=COLUMN_DTYPE).tofile(f)
+            with open(self._file('runs.jsonl'), 'a') as f:
+                f.write(json.dumps({'build': build_id or time.strftime('%Y-%m-%d %H:%M'), 'time': time.time()}) + '\n')
+
+    def aggregates(self):
+        """Names of the aggregates recorded so far."""
+        import numpy as np
+
+        strings = self._read_lines('strings.jsonl')
+        return [strings[index] for index in np.unique(self._read_columns()['aggregate'])]
+
+    def trend(self, aggregate, last=None):
+        """``Trend`` of one aggregate over the last ``last`` runs, labels by total count, largest first."""
+        import numpy as np
+
+        runs = self._read_lines('runs.jsonl')
+        strings = self._read_lines('strings.jsonl')
+        columns = self._read_columns()
+        first = max(0, len(runs) - last) if last else 0
+        selected = (columns['run'] >= first) & (columns['run'] < len(runs))
+        if aggregate in strings:
+            selected &= columns['aggregate'] == strings.index(aggregate)
+        else:
+            selected[:] = False
+
+        label_ids, label_index = np.unique(columns['label'][selected], return_inverse=True)
+        counts = np.zeros((len(runs) - first, len(label_ids)), dtype=np.int64)
+        counts[columns['run'][selected] - first, label_index] = columns['count'][selected]
+        order = np.argsort(-counts.sum(axis=0), kind='stable')
+        return Trend([run['build'] for run in runs[first:]], [strings[label_ids[index]] for index in order], counts[:, order])
+
+
+def record_run(args, tool, counts):
+    """Append this run's aggregates when ``--history-dir`` is given."""
+    if args.history_dir:
+        HistoryStore(args.history_dir, tool).append(counts, args.build_id)
+        print(f"Recorded the aggregates in {os.path.join(args.history_dir, tool)}")
+
+
+def plot_trend(trend, title, top=DEFAULT_TOP):
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure(figsize=(20, 10))
+    positions = range(len(trend.builds))
+    for label, values in zip(trend.labels[:top], trend.counts.T[:top]):
+        plt.plot(positions, values, marker='o' if len(positions) <= 50 else None, label=label)
+    if len(trend.labels) > top:
+        plt.plot(positions, trend.counts[:, top:].sum(axis=1), color='grey', linestyle='--', label='Others')
+    # Label at most ~20 builds so the axis stays readable over hundreds of runs
+    step = max(1, len(trend.builds) // 20)
+    plt.xticks(list(positions)[::step], trend.builds[::step], rotation=45, ha='right', fontsize=14)
+    plt.yticks(fontsize=14)
+    plt.title(title, fontsize=24)
+    plt.xlabel('Build', fontsize=18)
+    plt.ylabel('Count', fontsize=18)
+    if trend.labels:
+        plt.legend(fontsize=14, loc='upper left')
+    plt.tight_layout()
+    return fig
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Render trend charts from the recorded report aggregates.')
+    parser.add_argument('--history-dir', required=True, help='Directory the generators recorded into with --history-dir')
+    parser.add_argument('--tool', required=True, help='Tool whose history to chart (bandit, safety, sonarqube, trufflehog)')
+    parser.add_argument('--last', type=int, help='Only the most recent runs (default all)')
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP, help=f'Lines per chart, the rest is summed (default {DEFAULT_TOP})')
+    parser.add_argument('--output', help='Report path (default ./<tool>/<tool>-trends.html)')
+    add_chart_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    store = HistoryStore(args.history_dir, args.tool)
+    aggregates = store.aggregates()
+    if not aggregates:
+        sys.exit(f"No history recorded for {args.tool} in {args.history_dir}")
+
+    trends = {aggregate: store.trend(aggregate, args.last) for aggregate in aggregates}
+    jobs = [chart_job(aggregate, plot_trend, trend, f'{args.tool} {aggregate} per build', args.top, dpi=150)
+            for aggregate, trend in trends.items()]
+    plots = {} if args.no_charts else render_charts(jobs, args.chart_workers, render_profile_from_args(args))
+
+    print("Rendering template...")
+    output = args.output or os.path.join('.', args.tool, f'{args.tool}-trends.html')
+    write_report(template_environment().get_template('trend_template.html'), output, dict(
+        tool=args.tool,
+        builds=len(next(iter(trends.values())).builds),
+        charts=[(aggregate, plots.get(aggregate)) for aggregate in aggregates],
+    ))
+    print(f"Finished writing {output}.")
+
+
+if __name__ == '__main__':
+    main()
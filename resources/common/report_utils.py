@@ -0,0 +1,1341 @@
+import argparse
+import base64
+import hashlib
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import pickle
+import re
+import secrets
+import shutil
+import sys
+import tempfile
+import time
+import weakref
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+
+from markupsafe import escape
+
+# Reports are rendered on headless agents: pick the Agg backend before anything
+# imports matplotlib, without importing it here (an explicit MPLBACKEND still wins)
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+# Shared template partials (findings_table.html, ...) sit next to this module
+COMMON_DIR = os.path.dirname(os.path.abspath(__file__))
+# Parent of common/ and the tool directories, in the library checkout and in the pipeline workspace
+RESOURCES_DIR = os.path.dirname(COMMON_DIR)
+JSON_CHUNK_SIZE = 1 << 16
+_WHITESPACE = ' \t\n\r'
+_NUMBER_CHARS = '0123456789+-.eE'
+
+
+def load_generator(tool):
+    """Import ``<tool>/html_generator.py`` under a module name of its own.
+
+    The module is registered in ``sys.modules`` so its plot functions can be
+    pickled into chart worker processes.
+    """
+    import importlib.util
+
+    path = os.path.join(RESOURCES_DIR, tool, 'html_generator.py')
+    spec = importlib.util.spec_from_file_location(f'{tool}_html_generator', path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class JsonStream:
+    """Incremental reader for large JSON documents.
+
+    Values are decoded one at a time with ``json.JSONDecoder.raw_decode`` over a
+    sliding buffer, so only the value currently being decoded is held in memory.
+    """
+
+    def __init__(self, fh, chunk_size=JSON_CHUNK_SIZE):
+        self.fh = fh
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, size=None):
+        chunk = self.fh.read(size or self.chunk_size)
+        if not chunk:
+            self.eof = True
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+
+    def peek(self):
+        """Return the next non-whitespace character without consuming it ('' at EOF)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf) or self.eof:
+                return self.buf[self.pos:self.pos + 1]
+            self._fill()
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"Expected '{char}' at offset {self.pos} of JSON stream")
+        self.pos += 1
+
+    def value(self):
+        """Decode and return the next complete JSON value."""
+        self.peek()
+        read_size = self.chunk_size
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            else:
+                # A number cut by the buffer edge (``12`` of ``12.5e3``) decodes too; only
+                # accept it once a character that cannot continue it has been read
+                if self.eof or not isinstance(value, (int, float)) or isinstance(value, bool) or self._number_ended(end):
+                    self.pos = end
+                    return value
+            self._fill(read_size)
+            read_size *= 2
+
+    def _number_ended(self, end):
+        while end < len(self.buf) and self.buf[end] in _NUMBER_CHARS:
+            end += 1
+        return end < len(self.buf)
+
+    def skip_value(self):
+        """Consume the next value, materialising at most one of its children at a time."""
+        opening = self.peek()
+        if opening == '[':
+            for _ in self.iter_array():
+                pass
+        elif opening == '{':
+            for _ in self.iter_object():
+                pass
+        else:
+            self.value()
+
+    def iter_array(self):
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ',':
+                self.pos += 1
+            else:
+                self.expect(']')
+                return
+
+    def iter_object(self):
+        """Yield (key, value) pairs of the next JSON object."""
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(':')
+            yield key, self.value()
+            if self.peek() == ',':
+                self.pos += 1
+            else:
+                self.expect('}')
+                return
+
+
+def iter_json_array(file_path, key=None, chunk_size=JSON_CHUNK_SIZE):
+    """Yield the items of a JSON array one by one.
+
+    With ``key`` the array is looked up in the top-level object (e.g. Bandit's
+    ``results``); other top-level members are skipped without being kept. Without
+    ``key`` the document may be a top-level array or JSON lines / concatenated
+    JSON values, as produced by ``trufflehog --json``.
+    """
+    with open(file_path, 'r') as f:
+        stream = JsonStream(f, chunk_size)
+        if key is None:
+            if stream.peek() == '[':
+                yield from stream.iter_array()
+                return
+            while stream.peek():
+                yield stream.value()
+            return
+
+        stream.expect('{')
+        while stream.peek() != '}':
+            name = stream.value()
+            stream.expect(':')
+            if name == key:
+                yield from stream.iter_array()
+                return
+            stream.skip_value()
+            if stream.peek() == ',':
+                stream.pos += 1
+
+
+class RowSpool:
+    """Append-only list of table rows kept in a temporary file instead of memory.
+
+    Rows are stored as JSON lines and rebuilt as ``row_type`` on iteration, so a
+    template can loop over them any number of times.
+    """
+
+    def __init__(self, row_type):
+        self.row_type = row_type
+        self._file = tempfile.TemporaryFile(mode='w+', encoding='utf-8')
+        self._count = 0
+
+    def append(self, values):
+        self._file.write(json.dumps(values))
+        self._file.write('\n')
+        self._count += 1
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        self._file.flush()
+        self._file.seek(0)
+        for line in self._file:
+            yield self.row_type(*json.loads(line))
+        self._file.seek(0, 2)
+
+
+class RowRecord:
+    """Table row handed to a template: only the displayed columns, already HTML-escaped.
+
+    Subclasses are created with ``record_type``; attribute access is a plain slot
+    lookup, so templates never touch pandas while rendering rows.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *values):
+        for field, value in zip(self.__slots__, values):
+            setattr(self, field, escape(value))
+
+    def __iter__(self):
+        return (getattr(self, field) for field in self.__slots__)
+
+
+def record_type(name, fields):
+    """Create a ``RowRecord`` subclass with one slot per displayed column."""
+    return type(name, (RowRecord,), {'__slots__': tuple(fields)})
+
+
+def records(record_class, rows):
+    """Lazily convert raw row tuples (DataFrame tuples, spooled rows, ...) into records."""
+    return (record_class(*row) for row in rows)
+
+
+def count_values(values):
+    """Histogram of a column, most frequent first, like ``Series.value_counts``.
+
+    The column is factorized once and counted with ``numpy.bincount`` on the
+    integer codes, which avoids hashing every value again per histogram.
+    """
+    import numpy as np
+    import pandas as pd
+
+    codes, uniques = pd.factorize(values)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    order = np.argsort(-counts, kind='stable')
+    return pd.Series(counts[order], index=pd.Index(np.asarray(uniques)[order], name=values.name), name='count')
+
+
+def counts_from_counter(counter):
+    """Turn a ``collections.Counter`` built while streaming into the same Series ``count_values`` returns."""
+    import pandas as pd
+
+    items = counter.most_common()
+    return pd.Series([count for _, count in items], index=[value for value, _ in items], dtype='int64', name='count')
+
+
+def aggregate(df, columns):
+    """Compute every histogram a report needs in one pass over each column.
+
+    ``columns`` maps an aggregate name to the DataFrame column it counts; columns
+    missing from the DataFrame (e.g. an empty SonarQube export) are left out.
+    """
+    return {name: count_values(df[column]) for name, column in columns.items() if column in df.columns}
+
+
+def partition(df, column, levels=None):
+    """Split ``df`` into one frame per value of ``column`` using a single groupby pass.
+
+    With ``levels`` the result has exactly those keys, in that order, with empty
+    frames for missing levels; otherwise levels appear in order of first occurrence.
+    """
+    if column not in df.columns:
+        return {level: df.iloc[0:0] for level in levels or []}
+    indices = df.groupby(column, sort=False, observed=True, dropna=True).indices
+    if levels is None:
+        levels = list(indices)
+    empty = df.iloc[0:0]
+    return {level: df.take(indices[level]) if level in indices else empty for level in levels}
+
+
+_MISSING = object()
+
+
+class FrameSchema:
+    """The columns a report reads from a tool's findings, and how to store them.
+
+    ``columns`` maps each DataFrame column to the key it is read from, or to a tuple
+    of keys for a nested field (Bandit's ``('issue_cwe', 'id')``); every other field
+    of a finding is dropped while loading. Columns in ``categorical`` hold few
+    distinct values (severities, types, file paths) and are stored as integer codes
+    into one copy of each value instead of one Python string per row.
+    """
+
+    def __init__(self, columns, categorical=()):
+        self.columns = columns
+        self.categorical = set(categorical)
+
+    def _getter(self, path):
+        if isinstance(path, str):
+            return lambda item: item.get(path, _MISSING)
+
+        def get(item):
+            for key in path:
+                if not isinstance(item, dict):
+                    return _MISSING
+                item = item.get(key, _MISSING)
+            return item
+        return get
+
+    def frame(self, items):
+        """Build the DataFrame from an iterable of findings, e.g. ``iter_json_array``.
+
+        Like ``json_normalize``, a column no finding has is left out and missing
+        values are NaN.
+        """
+        import pandas as pd
+
+        getters = [(column, self._getter(path)) for column, path in self.columns.items()]
+        values = {column: [] for column in self.columns}
+        appends = [(values[column].append, get) for column, get in getters]
+        for item in items:
+            for append, get in appends:
+                append(get(item))
+
+        data = {}
+        for column, column_values in values.items():
+            missing = column_values.count(_MISSING)
+            if missing == len(column_values):
+                continue
+            if missing:
+                column_values = [float('nan') if value is _MISSING else value for value in column_values]
+            data[column] = pd.Categorical(column_values) if column in self.categorical else column_values
+        return pd.DataFrame(data)
+
+
+def peak_rss():
+    """Peak resident set size of this process in bytes, or None where ``resource`` is unavailable."""
+    try:
+        import resource
+    except ImportError:  # Windows agents
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+# Arguments copied into a profile besides RENDER_SETTINGS: what was built and how, never credentials
+PROFILE_ARGUMENTS = [
+    'file_path', 'issues_file_path', 'hotspots_file_path', 'template_path', 'baseline', 'stream', 'save_images',
+    'chart_workers', 'cache_dir', 'history_dir', 'project_key', 'branch', 'fetch_workers', 'profile', 'cprofile',
+]
+
+
+class StageTimer:
+    """Wall-clock timing of the stages of a report build.
+
+    Parts are finer timings measured inside a stage (e.g. rasterising within
+    ``charts``, base64 encoding within ``write``); they are reported but not added
+    to the total.
+
+    With ``instrument`` every stage also records its CPU time (including worker
+    processes that exited during it) and the resident set after it, every chart
+    its own timings and memory, and ``finish`` writes all of it as a JSON profile
+    next to the report. ``cprofile`` additionally runs the build under cProfile.
+    """
+
+    def __init__(self, tool=None, instrument=False, cprofile=False):
+        self.tool = tool
+        self.instrument = instrument or cprofile
+        self.timings = []
+        self.parts = []
+        self.stages = []
+        self.charts = []
+        self.frames = {}
+        self.started = time.time()
+        self.profiler = None
+        if cprofile:
+            import cProfile
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        if self.instrument:
+            cpu, children_cpu = time.process_time(), children_cpu_time()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self.timings.append((name, seconds))
+            if self.instrument:
+                self.stages.append({
+                    'name': name,
+                    'wall': seconds,
+                    'cpu': time.process_time() - cpu,
+                    'children_cpu': children_cpu_time() - children_cpu,
+                    'rss': current_rss(),
+                    'peak_rss': peak_rss(),
+                })
+
+    @contextmanager
+    def forking(self):
+        """Pause cProfile while worker processes are forked; they would inherit it and run slower."""
+        if self.profiler:
+            self.profiler.disable()
+        try:
+            yield
+        finally:
+            if self.profiler:
+                self.profiler.enable()
+
+    def add_part(self, name, seconds):
+        self.parts.append((name, seconds))
+
+    def add_chart(self, name, stats):
+        """Record one rendered chart (``stats`` from the chart job), also as parts of its stage."""
+        self.add_part('chart render', stats['render'])
+        if self.instrument:
+            self.charts.append({'name': name, **stats})
+
+    def add_frames(self, frames):
+        """Record the in-memory size of DataFrames when instrumented; measuring walks every object column."""
+        if self.instrument:
+            for name, df in frames.items():
+                self.frames[name] = {'rows': len(df), 'bytes': int(df.memory_usage(deep=True).sum())}
+
+    def as_dict(self):
+        """Seconds per stage and per part, summed over repeated names, plus the total."""
+        result = {'stages': {}, 'parts': {}}
+        for kind, timings in [('stages', self.timings), ('parts', self.parts)]:
+            for name, seconds in timings:
+                result[kind][name] = result[kind].get(name, 0.0) + seconds
+        result['total'] = sum(seconds for _, seconds in self.timings)
+        return result
+
+    def print_summary(self):
+        total = sum(seconds for _, seconds in self.timings)
+        print("Stage timings:")
+        for name, seconds in self.timings:
+            print(f"  {name:<12} {seconds:8.3f}s")
+        for name, seconds in self.as_dict()['parts'].items():
+            print(f"    {name:<14} {seconds:8.3f}s")
+        print(f"  {'total':<12} {total:8.3f}s")
+
+    def profile(self, args=None):
+        """The JSON-serialisable profile of the build."""
+        total = self.as_dict()['total']
+        profile = {
+            'tool': self.tool,
+            'started': time.strftime('%Y-%m-%dT%H:%M:%S%z', time.localtime(self.started)),
+            'python': sys.version.split()[0],
+            'arguments': {name: getattr(args, name) for name in RENDER_SETTINGS + PROFILE_ARGUMENTS if hasattr(args, name)} if args else {},
+            'total': {
+                'wall': total,
+                'cpu': sum(stage['cpu'] for stage in self.stages),
+                'children_cpu': sum(stage['children_cpu'] for stage in self.stages),
+                'peak_rss': peak_rss(),
+            },
+            'stages': self.stages,
+            'charts': self.charts,
+            'frames': self.frames,
+        }
+        return profile
+
+    def finish(self, report_path, args=None):
+        """End of the build: the usual stage timings, or the profile file and a summary on stderr when instrumented."""
+        if not self.instrument:
+            self.print_summary()
+            return None
+        profile = self.profile(args)
+        profile_path = os.path.splitext(report_path)[0] + '.profile.json'
+        if self.profiler:
+            profile['cprofile'] = self._dump_cprofile(os.path.splitext(report_path)[0] + '.prof')
+        with open(profile_path, 'w') as f:
+            json.dump(profile, f, indent=2)
+        self._print_profile(profile, profile_path)
+        return profile_path
+
+    def _dump_cprofile(self, stats_path, top=25):
+        import pstats
+
+        self.profiler.disable()
+        self.profiler.dump_stats(stats_path)
+        stats = pstats.Stats(self.profiler)
+        functions = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:top]
+        return {
+            'stats_file': stats_path,
+            'top_cumulative': [
+                {'function': f'{filename}:{line}({name})', 'calls': calls, 'tottime': tottime, 'cumtime': cumtime}
+                for (filename, line, name), (_, calls, tottime, cumtime, _) in functions
+            ],
+        }
+
+    def _print_profile(self, profile, profile_path):
+        total = profile['total']
+        peak = f", peak RSS {total['peak_rss'] / 1e6:.0f} MB" if total['peak_rss'] else ''
+        print(f"Profile of {self.tool or 'the report'}: {total['wall']:.2f}s wall, "
+              f"{total['cpu'] + total['children_cpu']:.2f}s CPU{peak} -> {profile_path}", file=sys.stderr)
+        for stage in profile['stages']:
+            rss = f"  rss {stage['rss'] / 1e6:6.0f} MB" if stage['rss'] else ''
+            print(f"  {stage['name']:<10} {stage['wall']:8.3f}s  cpu {stage['cpu'] + stage['children_cpu']:8.3f}s{rss}", file=sys.stderr)
+        if profile['frames']:
+            sizes = ', '.join(f"{name} {frame['bytes'] / 1e6:.1f} MB ({frame['rows']} rows)" for name, frame in profile['frames'].items())
+            print(f"  frames: {sizes}", file=sys.stderr)
+        if profile['charts']:
+            slowest = max(profile['charts'], key=lambda chart: chart['render'])
+            print(f"  slowest chart: {slowest['name']} {slowest['render']:.3f}s", file=sys.stderr)
+
+
+def add_profile_arguments(parser):
+    parser.add_argument('--profile', action='store_true',
+                        help='Record wall time, CPU time and memory per stage and per chart in a .profile.json next to the report')
+    parser.add_argument('--cprofile', action='store_true', help='Also run the build under cProfile (implies --profile, stats in a .prof file)')
+
+
+def timer_from_args(args, tool):
+    return StageTimer(tool, getattr(args, 'profile', False), getattr(args, 'cprofile', False))
+
+
+def children_cpu_time():
+    """CPU seconds of the terminated child processes (chart and report workers), 0 where unavailable."""
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def current_rss():
+    """Resident set size of this process in bytes, or None outside Linux."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        return None
+
+
+# How charts are rasterised. ``dpi=None`` keeps each chart's own resolution and
+# ``figsize=None`` its designed size; ``png8`` is a palette-quantized, optimized PNG.
+RenderProfile = namedtuple('RenderProfile', ['dpi', 'figsize', 'image_format'])
+
+RENDER_PROFILES = {
+    'compact': RenderProfile(72, None, 'png8'),
+    'standard': RenderProfile(100, None, 'png'),
+    'legacy': RenderProfile(None, None, 'png'),
+    'svg': RenderProfile(None, None, 'svg'),
+}
+DEFAULT_RENDER_PROFILE = 'compact'
+IMAGE_FORMATS = {'png': 'image/png', 'png8': 'image/png', 'svg': 'image/svg+xml'}
+
+
+def _quantize_png(image, colors=256):
+    from PIL import Image
+
+    with Image.open(io.BytesIO(image)) as original:
+        quantized = original.convert('RGB').quantize(colors=colors)
+    buffer = io.BytesIO()
+    quantized.save(buffer, format='PNG', optimize=True)
+    return buffer.getvalue()
+
+
+def figure_to_data_url(fig, dpi=None, save_path=None, profile=None):
+    """Encode a matplotlib figure as a base64 data URL straight from memory.
+
+    ``profile`` (a ``RenderProfile``) overrides the resolution, size and image
+    format; ``dpi`` is the chart's own resolution, used when the profile has none.
+    The figure is closed once encoded so memory does not grow with every chart.
+    The image is only written to disk when ``save_path`` is given, with its
+    extension matching the image format.
+    """
+    profile = profile or RENDER_PROFILES['legacy']
+    image = figure_to_image(fig, dpi, profile)
+    if save_path:
+        _save_image(image, save_path, profile.image_format == 'svg')
+    return image_data_url(image, profile.image_format)
+
+
+def figure_to_image(fig, dpi=None, profile=None):
+    """Rasterise (or serialise, for SVG) a figure with a ``RenderProfile`` and close it; returns the file bytes."""
+    import matplotlib.pyplot as plt
+
+    profile = profile or RENDER_PROFILES['legacy']
+    image_format = profile.image_format
+    buffer = io.BytesIO()
+    try:
+        if profile.figsize:
+            fig.set_size_inches(profile.figsize)
+            fig.tight_layout()
+        if image_format == 'svg':
+            # Keep text as text instead of glyph paths (much smaller documents); a fixed id
+            # salt and no date so the same chart always gives the same bytes for the cache
+            with plt.rc_context({'svg.fonttype': 'none', 'svg.hashsalt': 'security-reports'}):
+                fig.savefig(buffer, format='svg', metadata={'Date': None})
+        else:
+            fig.savefig(buffer, format='png', dpi=profile.dpi or dpi)
+    finally:
+        plt.close(fig)
+    image = buffer.getvalue()
+    if image_format == 'png8':
+        image = _quantize_png(image)
+    return image
+
+
+def image_data_url(image, image_format):
+    return f"data:{IMAGE_FORMATS[image_format]};base64,{base64.b64encode(image).decode()}"
+
+
+# Raw bytes base64-encoded at a time; a multiple of 3 so the chunks join without padding
+IMAGE_CHUNK_SIZE = 3 << 16
+# Placeholders carry a random token of this process: findings text (attacker-controlled in
+# pull request scans) cannot forge one to pull a chart into a table cell or break the write
+_PLACEHOLDER_TOKEN = secrets.token_hex(16)
+_IMAGE_PLACEHOLDER = re.compile(f'\0chart:{_PLACEHOLDER_TOKEN}:([0-9]+)\0')
+_chart_images = weakref.WeakValueDictionary()
+_chart_ids = itertools.count()
+
+
+class ChartImage:
+    """Encoded chart that a template prints as its data URL.
+
+    Rendered, it is only a short placeholder; ``write_report`` replaces it with
+    ``data:<type>;base64,...`` encoded chunk by chunk straight into the report, so
+    the base64 text of the image never exists as one string.
+    """
+
+    __slots__ = ('image', 'image_format', 'placeholder', '__weakref__')
+
+    def __init__(self, image, image_format):
+        self.image = image
+        self.image_format = image_format
+        chart_id = next(_chart_ids)
+        self.placeholder = f'\0chart:{_PLACEHOLDER_TOKEN}:{chart_id}\0'
+        _chart_images[str(chart_id)] = self
+
+    def __str__(self):
+        return self.placeholder
+
+    __html__ = __str__
+
+    def write_data_url(self, f):
+        f.write(f'data:{IMAGE_FORMATS[self.image_format]};base64,')
+        image = memoryview(self.image)
+        for start in range(0, len(image), IMAGE_CHUNK_SIZE):
+            f.write(base64.b64encode(image[start:start + IMAGE_CHUNK_SIZE]).decode())
+
+
+def _save_image(image, save_path, svg=False):
+    save_path = os.path.splitext(save_path)[0] + ('.svg' if svg else '.png')
+    os.makedirs(os.path.dirname(save_path) or '.', exist_ok=True)
+    with open(save_path, 'wb') as image_file:
+        image_file.write(image)
+
+
+# One chart of a report: the template variable it fills, the plot function and its
+# arguments, plus how to save it. Plot functions must be module-level so the job can
+# be sent to a worker process.
+ChartJob = namedtuple('ChartJob', ['name', 'plot', 'args', 'dpi', 'save_path', 'rc'])
+
+
+def chart_job(name, plot, *args, dpi=None, save_path=None, rc=None):
+    return ChartJob(name, plot, args, dpi, save_path, rc or {})
+
+
+def chart_key_data(value):
+    """Plain-data form of chart arguments for cache keys.
+
+    Pickles of pandas objects depend on how they were built (a categorical index
+    from a freshly parsed frame and from the cached model differently), so
+    histograms become ``[(label, count), ...]`` and arrays lists before hashing.
+    """
+    if hasattr(value, 'items') and hasattr(value, 'keys'):
+        return [(str(label), chart_key_data(item)) for label, item in value.items()]
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    if isinstance(value, (list, tuple)):
+        return [chart_key_data(item) for item in value]
+    return value
+
+
+def subset(counts, *names):
+    """The named aggregates of ``counts`` (missing ones left out).
+
+    Chart jobs get only the aggregates they plot, so a cached chart stays valid
+    while unrelated aggregates change.
+    """
+    return {name: counts[name] for name in names if name in counts}
+
+
+def _figsize(value):
+    try:
+        width, height = (float(part) for part in value.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT in inches, got '{value}'")
+    return width, height
+
+
+def add_chart_arguments(parser):
+    parser.add_argument('--no-charts', action='store_true',
+                        help='Tables only: skip the charts and never import matplotlib or seaborn')
+    parser.add_argument('--chart-workers', type=int, default=1,
+                        help='Render charts in this many worker processes (0 = one per CPU, default 1 = serial)')
+    parser.add_argument('--render-profile', choices=sorted(RENDER_PROFILES), default=DEFAULT_RENDER_PROFILE,
+                        help=f'Chart resolution and format preset (default {DEFAULT_RENDER_PROFILE}; legacy = 300 dpi PNG as before)')
+    parser.add_argument('--dpi', type=int, help='Override the resolution of the render profile')
+    parser.add_argument('--figsize', type=_figsize, help='Override the figure size, e.g. 16x9 (inches)')
+    parser.add_argument('--image-format', choices=sorted(IMAGE_FORMATS), help='Override the image format of the render profile')
+
+
+def render_profile_from_args(args):
+    """Build the ``RenderProfile`` selected on the command line."""
+    profile = RENDER_PROFILES[args.render_profile]
+    return profile._replace(
+        dpi=args.dpi or profile.dpi,
+        figsize=args.figsize or profile.figsize,
+        image_format=args.image_format or profile.image_format,
+    )
+
+
+def _render_chart_job(job, profile=None):
+    """Image bytes of one chart, with its timings and memory measured in the process that rendered it."""
+    import matplotlib.pyplot as plt
+
+    profile = profile or RENDER_PROFILES['legacy']
+    start, cpu, rss = time.perf_counter(), time.process_time(), current_rss()
+    # rc settings are scoped to the job so the output does not depend on which
+    # worker (or which earlier chart) touched matplotlib's global state
+    with plt.rc_context(job.rc):
+        image = figure_to_image(job.plot(*job.args), job.dpi, profile)
+    if job.save_path:
+        _save_image(image, job.save_path, profile.image_format == 'svg')
+    end_rss = current_rss()
+    return image, {
+        'render': time.perf_counter() - start,
+        'cpu': time.process_time() - cpu,
+        'rss_delta': end_rss - rss if rss is not None and end_rss is not None else None,
+        'image_bytes': len(image),
+    }
+
+
+def render_charts(jobs, workers=1, profile=None, cache=None, timer=None):
+    """Render chart jobs with a ``RenderProfile`` and return ``{name: ChartImage}`` in job order.
+
+    Charts found in the ``ReportCache`` (same plot, arguments and settings) are
+    reused; only the others are rendered. With more than one worker they are
+    rasterised in a process pool, since matplotlib is not thread-safe. Workers are
+    forked where possible so they inherit the already imported generator modules
+    instead of re-importing them. A ``StageTimer`` gets the timings of every
+    rendered chart; cached charts cost nothing and are not recorded.
+    """
+    cache = cache or NO_CACHE
+    image_format = (profile or RENDER_PROFILES['legacy']).image_format
+    keys = {job.name: cache.key('chart', job.name, job.plot.__qualname__, chart_key_data(job.args), job.dpi, job.rc, profile) for job in jobs}
+    images = {}
+    for job in jobs:
+        cached = cache.get('chart', keys[job.name])
+        if cached is not None:
+            images[job.name] = cached
+            if job.save_path:
+                _save_image(cached, job.save_path, image_format == 'svg')
+
+    pending = [job for job in jobs if job.name not in images]
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(pending))
+    if workers <= 1:
+        rendered = [_render_chart_job(job, profile) for job in pending]
+    else:
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+        with timer.forking() if timer else nullcontext(), ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            rendered = list(pool.map(_render_chart_job, pending, [profile] * len(pending)))
+    for job, (image, stats) in zip(pending, rendered):
+        images[job.name] = image
+        cache.put('chart', keys[job.name], image)
+        if timer:
+            timer.add_chart(job.name, stats)
+    return {job.name: ChartImage(images[job.name], image_format) for job in jobs}
+
+
+# Findings tables: plain HTML rows, or rendered client-side from JSON for large reports
+TABLE_MODES = ['auto', 'html', 'embedded', 'paged']
+DEFAULT_LARGE_REPORT_THRESHOLD = 5000
+DEFAULT_PAGE_SIZE = 500
+
+
+def add_table_arguments(parser):
+    parser.add_argument('--table-mode', choices=TABLE_MODES, default='auto',
+                        help='html: one <tr> per finding; embedded: findings embedded once as JSON and rendered '
+                             'page by page in the browser; paged: findings split into sidecar chunk files loaded '
+                             'on demand; auto (default): html up to --large-report-threshold findings, embedded above')
+    parser.add_argument('--large-report-threshold', type=int, default=DEFAULT_LARGE_REPORT_THRESHOLD,
+                        help=f'Number of findings above which auto switches to embedded tables (default {DEFAULT_LARGE_REPORT_THRESHOLD})')
+    parser.add_argument('--page-size', type=int, default=DEFAULT_PAGE_SIZE,
+                        help=f'Rows per page of client-side tables (default {DEFAULT_PAGE_SIZE})')
+
+
+def client_table_mode(args, total):
+    """Return 'embedded' or 'paged' when tables should be rendered client-side, else None."""
+    mode = args.table_mode
+    if mode == 'auto':
+        mode = 'embedded' if total > args.large_report_threshold else 'html'
+    return None if mode == 'html' else mode
+
+
+def _script_json(value):
+    # Safe inside <script>: no "</script>" or "<!--" can appear in the output
+    return json.dumps(value, separators=(',', ':')).replace('<', '\\u003c').replace('\u2028', '\\u2028').replace('\u2029', '\\u2029')
+
+
+def client_tables(sections, mode, page_size, report_path=None):
+    """Prepare findings for client-side rendering by ``findings_table.html``.
+
+    ``sections`` maps the ``data-findings`` key of a table body to a
+    ``(column_kinds, rows, total)`` tuple, where each column kind is 'text',
+    'pre' or 'link'. In embedded mode the rows go into the returned JSON; in
+    paged mode they are written ``page_size`` at a time to JavaScript chunk files
+    in a ``<report>-data`` directory next to ``report_path`` and only the chunk
+    locations go into the JSON, so only one page of rows is in memory at a time.
+    """
+    config = {'pageSize': page_size, 'sections': {}}
+    if mode == 'paged':
+        data_dir = os.path.splitext(report_path)[0] + '-data'
+        shutil.rmtree(data_dir, ignore_errors=True)
+        os.makedirs(data_dir)
+    for index, (key, (columns, rows, total)) in enumerate(sections.items()):
+        section = {'columns': columns, 'total': total}
+        if mode == 'paged':
+            page_name = f's{index}-p{{page}}.js'
+            section['src'] = f'{os.path.basename(data_dir)}/{page_name}'
+            pages = 0
+            for page, chunk in enumerate(_chunks(rows, page_size)):
+                with open(os.path.join(data_dir, page_name.format(page=page)), 'w') as f:
+                    f.write(f'reportFindingsPage({_script_json(key)},{page},{_script_json(chunk)});\n')
+                pages += 1
+            section['pages'] = pages
+        else:
+            section['rows'] = [[str(value) for value in row] for row in rows]
+        config['sections'][key] = section
+    return _script_json(config)
+
+
+def _chunks(rows, size):
+    chunk = []
+    for row in rows:
+        chunk.append([str(value) for value in row])
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# Baseline comparison: findings of the current scan against a previous one
+FindingsDiff = namedtuple('FindingsDiff', ['new', 'fixed', 'unchanged'])
+# One table of the baseline summary: counts plus the fixed findings as records
+BaselineSection = namedtuple('BaselineSection', ['title', 'new', 'fixed', 'unchanged', 'columns', 'fixed_rows'])
+
+
+def diff_findings(current, baseline, fingerprint):
+    """Split findings into new, fixed and unchanged ones by their fingerprint.
+
+    The baseline is indexed once in a dict, so this is linear in the size of both
+    scans. Identical fingerprints are matched one to one: a third copy of a
+    finding that the baseline had twice counts as new.
+    """
+    index = {}
+    for item in baseline:
+        index.setdefault(fingerprint(item), []).append(item)
+    new, unchanged = [], []
+    for item in current:
+        matches = index.get(fingerprint(item))
+        if matches:
+            matches.pop()
+            unchanged.append(item)
+        else:
+            new.append(item)
+    fixed = [item for matches in index.values() for item in matches]
+    return FindingsDiff(new, fixed, unchanged)
+
+
+def baseline_section(title, diff, columns, record_class):
+    """Summary of ``diff`` for baseline_diff.html, the fixed findings shown with the record's fields."""
+    rows = ([item.get(field) for field in record_class.__slots__] for item in diff.fixed)
+    return BaselineSection(title, len(diff.new), len(diff.fixed), len(diff.unchanged), columns, records(record_class, rows))
+
+
+def write_baseline_diff(path, diffs):
+    """Print the comparison and write it as JSON (counts, new and fixed findings) for pipeline gating."""
+    summary = {}
+    for name, diff in diffs.items():
+        print(f"Baseline comparison, {name}: {len(diff.new)} new, {len(diff.fixed)} fixed, {len(diff.unchanged)} unchanged")
+        summary[name] = {
+            'new': len(diff.new),
+            'fixed': len(diff.fixed),
+            'unchanged': len(diff.unchanged),
+            'new_findings': diff.new,
+            'fixed_findings': diff.fixed,
+        }
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(summary, f)
+
+
+# Incremental builds: parsed scans, chart images and finished reports, content-addressed
+DEFAULT_CACHE_SIZE_MB = 256
+# Subdirectory of the cache directory holding Jinja's template bytecode
+TEMPLATE_CACHE_DIR = 'templates'
+# Arguments that change what a report looks like (file paths are covered by content digests)
+RENDER_SETTINGS = ['no_charts', 'render_profile', 'dpi', 'figsize', 'image_format', 'table_mode', 'large_report_threshold', 'page_size']
+
+
+def add_cache_arguments(parser):
+    parser.add_argument('--cache-dir', help='Reuse parsed scans, charts and reports from earlier runs stored in this directory (only share it between trusted builds)')
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE_MB,
+                        help=f'Size limit of the cache directory in MB, least recently used entries go first (default {DEFAULT_CACHE_SIZE_MB})')
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def encode_model(value):
+    """Serialise a DataFrame, or a tuple of DataFrames and JSON values, without pickle.
+
+    The result is an ``.npz`` archive: numeric columns and category codes as arrays,
+    other columns as JSON. ``decode_model`` reads it with ``allow_pickle=False``.
+    Frames must have the default ``RangeIndex``; namedtuples come back as lists.
+    """
+    import numpy as np
+    import pandas as pd
+
+    items = value if isinstance(value, tuple) else (value,)
+    arrays = {}
+    meta = {'pandas': pd.__version__, 'tuple': isinstance(value, tuple), 'items': []}
+    for i, item in enumerate(items):
+        if not isinstance(item, pd.DataFrame):
+            meta['items'].append({'json': item})
+            continue
+        if not item.index.equals(pd.RangeIndex(len(item))):
+            raise ValueError('only frames with the default index can be cached')
+        columns = []
+        for j, (name, series) in enumerate(item.items()):
+            column = {'name': name, 'dtype': str(series.dtype)}
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                categories = series.cat.categories
+                column.update(categories=categories.tolist(), categories_dtype=str(categories.dtype), ordered=bool(series.cat.ordered))
+                arrays[f'{i}_{j}'] = series.cat.codes.to_numpy()
+            elif isinstance(series.dtype, np.dtype) and series.dtype.kind in 'biuf':
+                arrays[f'{i}_{j}'] = series.to_numpy()
+            else:
+                column['json'] = True
+                arrays[f'{i}_{j}'] = np.frombuffer(json.dumps(series.tolist()).encode(), dtype=np.uint8)
+            columns.append(column)
+        meta['items'].append({'rows': len(item), 'columns': columns})
+    arrays['meta'] = np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8)
+    buffer = io.BytesIO()
+    np.savez(buffer, **arrays)
+    return buffer.getvalue()
+
+
+def decode_model(data):
+    """Value stored by ``encode_model``; None when it was written by another pandas release."""
+    import numpy as np
+    import pandas as pd
+
+    with np.load(io.BytesIO(data), allow_pickle=False) as archive:
+        meta = json.loads(archive['meta'].tobytes())
+        if meta['pandas'] != pd.__version__:
+            return None
+        items = []
+        for i, item in enumerate(meta['items']):
+            if 'json' in item:
+                items.append(item['json'])
+                continue
+            columns = {}
+            for j, column in enumerate(item['columns']):
+                array = archive[f'{i}_{j}']
+                if 'categories' in column:
+                    dtype = pd.CategoricalDtype(pd.Index(column['categories'], dtype=column['categories_dtype']), column['ordered'])
+                    columns[column['name']] = pd.Categorical.from_codes(array, dtype=dtype)
+                elif column.get('json'):
+                    columns[column['name']] = pd.Series(json.loads(array.tobytes()), dtype=column['dtype'])
+                else:
+                    columns[column['name']] = array
+            items.append(pd.DataFrame(columns, index=pd.RangeIndex(item['rows'])))
+    return tuple(items) if meta['tuple'] else items[0]
+
+
+class ReportCache:
+    """Content-addressed store of report artefacts in a local directory.
+
+    Every entry is a file named after the SHA-256 of everything it was built from,
+    so a changed input simply misses instead of needing invalidation. ``salt`` is
+    mixed into every key; generators pass their own source so code changes start
+    afresh. Reads refresh an entry's mtime and writes evict the least recently
+    used entries once the directory exceeds ``max_bytes``. Without a directory the
+    cache is disabled: nothing is found and nothing is stored.
+
+    Entries are data only (HTML, images, ``encode_model`` archives), never pickles,
+    so reading one cannot run code. Whoever can write to the directory can still
+    plant a report, so it should be private to the job or shared only between
+    trusted builds.
+    """
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_CACHE_SIZE_MB << 20, salt=''):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.salt = salt
+        self._digests = {}
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def key(self, *parts):
+        if not self.directory:
+            return None
+        digest = hashlib.sha256(self.salt.encode())
+        for part in parts:
+            if isinstance(part, str):
+                part = part.encode()
+            elif not isinstance(part, bytes):
+                part = pickle.dumps(part, protocol=4)
+            digest.update(len(part).to_bytes(8, 'big'))
+            digest.update(part)
+        return digest.hexdigest()
+
+    def file_digest(self, path):
+        if path not in self._digests:
+            self._digests[path] = file_digest(path)
+        return self._digests[path]
+
+    def _path(self, kind, key):
+        return os.path.join(self.directory, f'{key}.{kind}')
+
+    def get(self, kind, key):
+        if not self.directory or key is None:
+            return None
+        path = self._path(kind, key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return data
+
+    def put(self, kind, key, data):
+        if not self.directory or key is None:
+            return
+        # Write under a temporary name first so concurrent builds never read half an entry
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, self._path(kind, key))
+        self.evict()
+
+    def put_file(self, kind, key, path):
+        """``put`` the contents of a file, copied without reading it into memory."""
+        if not self.directory or key is None:
+            return
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f, open(path, 'rb') as source:
+            shutil.copyfileobj(source, f)
+        os.replace(temp_path, self._path(kind, key))
+        self.evict()
+
+    def cached(self, kind, key, build):
+        """Decode the entry (see ``encode_model``), or build it with ``build()`` and store it."""
+        data = self.get(kind, key)
+        if data is not None:
+            try:
+                value = decode_model(data)
+            except Exception:  # damaged or foreign entry: rebuild it
+                value = None
+            if value is not None:
+                return value
+        value = build()
+        self.put(kind, key, encode_model(value))
+        return value
+
+    def evict(self):
+        """Remove the least recently used entries, including the template bytecode that
+        ``template_environment`` keeps in ``templates/``, until the directory fits ``max_bytes``.
+
+        Other processes may evict from the same directory concurrently, so entries can
+        vanish between listing and removal.
+        """
+        entries = []
+        for directory in (self.directory, os.path.join(self.directory, TEMPLATE_CACHE_DIR)):
+            try:
+                listing = list(os.scandir(directory))
+            except FileNotFoundError:
+                continue
+            for entry in listing:
+                try:
+                    if entry.is_file() and not entry.name.endswith('.tmp'):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+                except FileNotFoundError:
+                    continue
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def report_key(self, args, input_paths):
+        """Key of the finished HTML, or None when the run has to do more than write the report:
+        sidecar files, saved images, a baseline diff or a history entry.
+        """
+        if not self.directory or args.save_images or getattr(args, 'table_mode', None) == 'paged':
+            return None
+        if getattr(args, 'baseline', None) or getattr(args, 'history_dir', None):
+            return None
+        templates = template_sources(args.template_path)
+        settings = {name: getattr(args, name, None) for name in RENDER_SETTINGS}
+        return self.key('report', *(self.file_digest(path) for path in input_paths), *templates, json.dumps(settings, sort_keys=True))
+
+
+NO_CACHE = ReportCache()
+
+
+def template_sources(name):
+    """Sources of a template and of every partial it includes, directly or through another partial."""
+    from jinja2 import meta
+
+    environment = template_environment()
+    sources, pending, seen = [], [name], {name}
+    while pending:
+        source = environment.loader.get_source(environment, pending.pop(0))[0]
+        sources.append(source)
+        for partial in meta.find_referenced_templates(environment.parse(source)):
+            # None for includes whose name is only known at render time; ours are all literal
+            if partial is not None and partial not in seen:
+                seen.add(partial)
+                pending.append(partial)
+    return sources
+
+
+def cache_from_args(args, generator_path):
+    """``ReportCache`` selected on the command line, salted with the generator and this module."""
+    if not args.cache_dir:
+        return NO_CACHE
+    salt = file_digest(generator_path) + file_digest(os.path.abspath(__file__))
+    return ReportCache(args.cache_dir, args.cache_size << 20, salt)
+
+
+def restore_report(cache, report_key, report_path):
+    """Write the cached HTML to ``report_path``; False when there is none."""
+    html = cache.get('html', report_key) if report_key else None
+    if html is None:
+        return False
+    os.makedirs(os.path.dirname(report_path) or '.', exist_ok=True)
+    with open(report_path, 'wb') as f:
+        f.write(html)
+    print("Inputs unchanged, reused the cached report.")
+    return True
+
+
+# Templates shipped with the library; compile_templates.py stores their Jinja-compiled code in compiled_templates.py
+BUNDLED_TEMPLATES = [
+    'bandit/report_template.html', 'safety/report_template.html', 'sonarqube/report_template.html', 'trufflehog/report_template.html',
+    'common/findings_table.html', 'common/baseline_diff.html', 'common/trend_template.html',
+]
+
+
+def template_digest(source):
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+
+def compiled_templates():
+    """``{source digest: generated Python}`` of the bundled templates, empty when the shipped
+    code was generated by another Jinja release than the installed one.
+    """
+    import jinja2
+
+    try:
+        from compiled_templates import JINJA_VERSION, TEMPLATES
+    except ImportError:
+        return {}
+    return TEMPLATES if jinja2.__version__.split('.')[:2] == JINJA_VERSION.split('.') else {}
+
+
+def _template_loader(searchpath, compiled):
+    from jinja2 import FileSystemLoader
+
+    class PrecompiledLoader(FileSystemLoader):
+        """``FileSystemLoader`` taking the bundled templates' code from ``compiled_templates.py``.
+
+        Code is looked up by the digest of the template source, so whatever path a
+        template is loaded from it is only reused while the source is unchanged; an
+        edited or custom template is lexed, parsed and compiled as usual.
+        """
+
+        def load(self, environment, name, globals=None):
+            source, filename, uptodate = self.get_source(environment, name)
+            code = compiled.get(template_digest(source))
+            if code is None:
+                return super().load(environment, name, globals)
+            return environment.template_class.from_code(
+                environment, compile(code, filename, 'exec'), environment.make_globals(globals), uptodate
+            )
+
+    return PrecompiledLoader(searchpath)
+
+
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def write_report(template, report_path, context, cache=NO_CACHE, report_key=None, timer=None):
+    """Stream ``template`` rendered with ``context`` into ``report_path``, then store the file
+    in the cache under ``report_key``.
+
+    The document goes through a buffered file as Jinja generates it and charts are
+    encoded where their ``ChartImage`` placeholder appears, so the HTML is never held
+    in memory as a whole. A ``StageTimer`` gets the time spent base64-encoding.
+    """
+    os.makedirs(os.path.dirname(report_path) or '.', exist_ok=True)
+    encode = 0.0
+    with open(report_path, 'w', buffering=WRITE_BUFFER_SIZE) as f:
+        for chunk in template.generate(**context):
+            if '\0' not in chunk:
+                f.write(chunk)
+                continue
+            # split() alternates text and the ids of the charts in between
+            for index, part in enumerate(_IMAGE_PLACEHOLDER.split(chunk)):
+                if index % 2:
+                    start = time.perf_counter()
+                    _chart_images[part].write_data_url(f)
+                    encode += time.perf_counter() - start
+                else:
+                    f.write(part)
+    if timer:
+        timer.add_part('base64 encode', encode)
+    cache.put_file('html', report_key, report_path)
+
+
+_environment = None
+
+
+def template_environment(cache_dir=None):
+    """Jinja environment resolving templates from the working directory, the shared partials,
+    then the tool directories (``bandit/report_template.html``, ...).
+
+    One environment is shared by every report built in the process, so templates
+    and partials are loaded and compiled once. The bundled templates come precompiled;
+    with ``cache_dir`` (``--cache-dir``) the compiled code of other templates is kept
+    in ``<cache_dir>/templates`` for the next run.
+    """
+    global _environment
+    if _environment is None:
+        from jinja2 import Environment
+
+        _environment = Environment(loader=_template_loader(['./', COMMON_DIR, RESOURCES_DIR], compiled_templates()))
+    if cache_dir and _environment.bytecode_cache is None:
+        from jinja2 import FileSystemBytecodeCache
+
+        directory = os.path.join(cache_dir, TEMPLATE_CACHE_DIR)
+        os.makedirs(directory, exist_ok=True)
+        _environment.bytecode_cache = FileSystemBytecodeCache(directory)
+    return _environment
+
+
+def build_report(args, tool, generator_path, report_path, input_paths, parse, aggregate=None, counts=None,
+                 charts=None, context=None, total=None, tables=None):
+    """Build a tool's report from parsed arguments and return its ``StageTimer``.
+
+    Every generator's ``generate_report`` (also what the combined generate_reports.py
+    calls) runs through here, with callbacks for what differs between the tools:
+
+    - ``parse(args, cache, timer)`` reads the scan in its own stages (parse, fetch
+      or diff) and returns it with the baseline sections, None without --baseline;
+    - ``aggregate(data)`` builds the model the other callbacks read from it, or is
+      None when reading already did (streaming);
+    - ``counts(model)`` gives the aggregates recorded with --history-dir;
+    - ``charts(model, args)`` gives the ``chart_job`` list;
+    - ``context(model, args)`` gives the tool's template variables;
+    - ``total(model)`` and ``tables(model)`` give the number of findings and the
+      ``client_tables`` sections, for generators with the table options.
+
+    ``input_paths`` is None when the inputs only exist once fetched, so there is no
+    cached report to look up.
+    """
+    from history import record_run
+
+    timer = timer_from_args(args, tool)
+    cache = cache_from_args(args, generator_path)
+    report_key = cache.report_key(args, input_paths) if input_paths else None
+    with timer.stage('restore'):
+        restored = restore_report(cache, report_key, report_path)
+    if restored:
+        # Still finish: --profile writes its file and --cprofile stops profiling
+        timer.finish(report_path, args)
+        return timer
+
+    # Load the scan once; every later stage works on the same model
+    model, baseline = parse(args, cache, timer)
+    if aggregate:
+        with timer.stage('aggregate'):
+            model = aggregate(model)
+    # A baseline report only covers the new findings, which are not the build's totals
+    if baseline is None:
+        record_run(args, tool, counts(model))
+
+    plots = {}
+    if not args.no_charts:
+        with timer.stage('charts'):
+            plots = render_charts(charts(model, args), args.chart_workers, render_profile_from_args(args), cache, timer)
+
+    # Large reports: findings go to the browser as JSON instead of one <tr> each
+    findings = None
+    table_mode = client_table_mode(args, total(model)) if tables else None
+    if table_mode:
+        with timer.stage('tables'):
+            findings = client_tables(tables(model), table_mode, args.page_size, report_path)
+
+    with timer.stage('render'):
+        template = template_environment(args.cache_dir).get_template(args.template_path)
+        variables = dict(context(model, args), findings=findings, baseline=baseline, no_charts=args.no_charts, **plots)
+
+    # Jinja renders while the report is written, so the document is never built as one string
+    with timer.stage('write'):
+        print("Rendering template into the report...")
+        write_report(template, report_path, variables, cache, report_key, timer)
+
+    print("Finished writing file.")
+    timer.finish(report_path, args)
+    return timer
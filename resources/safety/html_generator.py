@@ -2,55 +2,68 @@
 import argparse
 import json
 import os
-import base64
-from jinja2 import Environment, FileSystemLoader
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import sys
+from collections import namedtuple
+from operator import attrgetter
 
-# Argument parsing
-parser = argparse.ArgumentParser(description='Process the JSON file and HTML template.')
-parser.add_argument('file_path', type=str, help='Path to the JSON file')
-parser.add_argument('template_path', type=str, help='Path to the HTML template file')
-args = parser.parse_args()
-file_path = args.file_path
-template_path = args.template_path
-
-# Define the path for images
+# The shared modules sit in ../common, both in the library checkout and in .security-reports/ where the pipeline steps copy them
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'common'))
+from report_utils import FrameSchema, add_cache_arguments, add_chart_arguments, add_profile_arguments, aggregate, build_report, chart_job, record_type, records, subset
+from history import add_history_arguments
+
+# Define the path for images, only written with --save-images
 images_path = './safety/images/'
-os.makedirs(images_path, exist_ok=True)  # Create the directory if it doesn't exist
+report_path = './safety/safety-report.html'
+
+AGGREGATES = {'package': 'package_name'}
+# Columns shown in the vulnerabilities table
+SafetyRecord = record_type('SafetyRecord', ['package_name', 'analyzed_version', 'advisory', 'more_info_url'])
 
-def get_image_as_data_url(image_path):
-    with open(image_path, 'rb') as image_file:
-        encoded_image = base64.b64encode(image_file.read()).decode()
-    return f"data:image/png;base64,{encoded_image}"
+# The only fields read from each vulnerability
+SCHEMA = FrameSchema({column: column for column in SafetyRecord.__slots__}, categorical=['package_name', 'analyzed_version'])
+# Sizes of the package lists, all the summary chart needs of them
+PackageTotals = namedtuple('PackageTotals', ['scanned', 'affected'])
+SafetyScan = namedtuple('SafetyScan', ['vulnerabilities', 'totals', 'counts'])
+
+# Argument parsing
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Process the JSON file and HTML template.')
+    parser.add_argument('file_path', type=str, help='Path to the JSON file')
+    parser.add_argument('template_path', type=str, help='Path to the HTML template file')
+    parser.add_argument('--save-images', action='store_true', help=f'Also write the chart images to {images_path}')
+    add_chart_arguments(parser)
+    add_cache_arguments(parser)
+    add_history_arguments(parser)
+    add_profile_arguments(parser)
+    return parser.parse_args(argv)
 
 def parse_safety_json(data):
-    return pd.DataFrame(data['vulnerabilities'])
+    return SCHEMA.frame(data['vulnerabilities'])
 
 def load_and_parse(file_path):
     with open(file_path) as f:
         data = json.load(f)
     df = parse_safety_json(data)
-    return df, data
+    return df, PackageTotals(len(data['scanned_packages']), len(data['affected_packages']))
 
-def generate_packages_summary_plot(data):
-    total_packages = len(data['scanned_packages'])
-    affected_packages = len(data['affected_packages'])
+def generate_packages_summary_plot(total_packages, affected_packages):
+    import matplotlib.pyplot as plt
     safe_packages = total_packages - affected_packages
     labels = ['Affected Packages', 'Safe Packages']
     sizes = [affected_packages, safe_packages]
-    plt.figure(figsize=(12, 8))
+    fig = plt.figure(figsize=(12, 8))
     colors = ['#f72d2a', '#66BB6A']
     plt.pie(sizes, labels=labels, autopct='%1.0f%%', labeldistance=1.1, textprops={'fontsize': 18}, startangle=140, colors=colors)
     plt.title('Summary of Packages', fontsize=20)
     plt.tight_layout()
     plt.gca().xaxis.set_major_formatter(plt.NullFormatter())
-    plt.savefig(os.path.join(images_path, 'packages_summary_plot.png'), dpi=300)
+    return fig
 
-def generate_vulnerabilities_per_package_plot(df):
-    vulnerability_counts = df['package_name'].value_counts()
-    plt.figure(figsize=(12, 8))
+def generate_vulnerabilities_per_package_plot(counts):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    vulnerability_counts = counts['package']
+    fig = plt.figure(figsize=(12, 8))
     colors = sns.color_palette('Set3', len(vulnerability_counts))
     patches, texts, autotexts = plt.pie(vulnerability_counts, labels=vulnerability_counts.index, autopct=lambda p: '{:.0f}'.format(p * sum(vulnerability_counts) / 100), startangle=140, colors=colors, labeldistance=1.1, textprops={'fontsize': 18})
     for text in texts:
@@ -62,33 +75,48 @@ def generate_vulnerabilities_per_package_plot(df):
     plt.title('Number of Vulnerabilities per Package', fontsize=20)
     plt.tight_layout()
     plt.gca().xaxis.set_major_formatter(plt.NullFormatter())
-    plt.savefig(os.path.join(images_path, 'vulnerabilities_per_package_plot.png'), dpi=300)
+    return fig
+
+def chart_jobs(scan, args):
+    """Both pie charts, keyed by template variable."""
+    def save_path(image_name):
+        return os.path.join(images_path, image_name) if args.save_images else None
 
-def generate_all_plots(file_path):
-    df, data = load_and_parse(file_path)
-    generate_packages_summary_plot(data)
-    generate_vulnerabilities_per_package_plot(df)
-    return df, data
+    return [
+        chart_job('total_packages_pie', generate_packages_summary_plot,
+                  scan.totals.scanned, scan.totals.affected,
+                  dpi=300, save_path=save_path('packages_summary_plot.png')),
+        chart_job('vulnerabilities_per_package_pie', generate_vulnerabilities_per_package_plot, subset(scan.counts, 'package'),
+                  dpi=300, save_path=save_path('vulnerabilities_per_package_plot.png')),
+    ]
 
-# Generate the plots and get data for the template
-df_safety, safety_data = generate_all_plots(file_path)
+def read_scan(args, cache, timer):
+    """The vulnerabilities frame and the package totals; Safety reports have no baseline."""
+    with timer.stage('parse'):
+        model_key = cache.key('model', cache.file_digest(args.file_path))
+        df_safety, totals = cache.cached('model', model_key, lambda: load_and_parse(args.file_path))
+        totals = PackageTotals(*totals)  # a list when read back from the cache
+    timer.add_frames({'vulnerabilities': df_safety})
+    return (df_safety, totals), None
 
-# Convert the images to data URLs
-packages_summary_data_url = get_image_as_data_url(os.path.join(images_path, 'packages_summary_plot.png'))
-vulnerabilities_per_package_data_url = get_image_as_data_url(os.path.join(images_path, 'vulnerabilities_per_package_plot.png'))
+def build_scan(data):
+    df_safety, totals = data
+    return SafetyScan(df_safety, totals, aggregate(df_safety, AGGREGATES))
 
-env = Environment(loader=FileSystemLoader('./'))
-template = env.get_template(template_path)
+def template_context(scan, args):
+    return dict(
+        rows=records(SafetyRecord, scan.vulnerabilities.reindex(columns=list(SafetyRecord.__slots__)).itertuples(index=False)),
+        total=len(scan.vulnerabilities),
+    )
 
-print("Rendering template...")
-html_content = template.render(
-    data=df_safety,
-    total_packages_pie=packages_summary_data_url,
-    vulnerabilities_per_package_pie=vulnerabilities_per_package_data_url
-)
+def main(argv=None):
+    generate_report(parse_args(argv))
 
-print("Writing HTML content to file...")
-with open('./safety/safety-report.html', 'w') as f:
-    f.write(html_content)
+def generate_report(args):
+    return build_report(
+        args, 'safety', __file__, report_path, [args.file_path], read_scan,
+        aggregate=build_scan, counts=attrgetter('counts'), charts=chart_jobs, context=template_context,
+    )
 
-print("Finished writing file.")
+if __name__ == '__main__':
+    main()
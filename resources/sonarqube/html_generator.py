@@ -1,55 +1,220 @@
 import argparse
+import base64
+import http.client
 import json
 import os
-import base64
-from jinja2 import Environment, FileSystemLoader
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import queue
+import sys
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from textwrap import wrap
+from urllib.parse import urlencode, urlsplit
 
-# Argument parsing for SonarQube report generation
-parser = argparse.ArgumentParser(description='Process the JSON files for SonarQube and HTML template.')
-parser.add_argument('issues_file_path', type=str, help='Path to the SonarQube issues JSON file')
-parser.add_argument('hotspots_file_path', type=str, help='Path to the SonarQube hotspots JSON file')
-parser.add_argument('template_path', type=str, help='Path to the HTML template file')
-args = parser.parse_args()
-issues_file_path = args.issues_file_path
-hotspots_file_path = args.hotspots_file_path
-template_path = args.template_path
-
-# Define the path for images
+# The shared modules sit in ../common, both in the library checkout and in .security-reports/ where the pipeline steps copy them
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'common'))
+from report_utils import FrameSchema, add_cache_arguments, add_chart_arguments, add_profile_arguments, add_table_arguments, aggregate, baseline_section, build_report, chart_job, diff_findings, iter_json_array, partition, record_type, records, subset, write_baseline_diff
+from history import add_history_arguments
+
+# Define the path for images, only written with --save-images
 images_path = 'sonarqube/images/'
-os.makedirs(images_path, exist_ok=True)
+report_path = 'sonarqube/sonarqube-report.html'
+diff_path = 'sonarqube/sonarqube-baseline-diff.json'
+
+ISSUE_AGGREGATES = {'severity': 'severity', 'component': 'component', 'type': 'type'}
+HOTSPOT_AGGREGATES = {'category': 'securityCategory', 'probability': 'vulnerabilityProbability', 'component': 'component'}
+# Columns shown in the issue and hotspot tables
+ISSUE_COLUMNS = ['component', 'line', 'severity', 'type', 'message']
+HOTSPOT_COLUMNS = ['component', 'line', 'vulnerabilityProbability', 'message']
+IssueRecord = record_type('IssueRecord', ISSUE_COLUMNS)
+HotspotRecord = record_type('HotspotRecord', HOTSPOT_COLUMNS)
+# The only fields read from each issue and hotspot; flows, text ranges, impacts etc. are never loaded
+ISSUE_SCHEMA = FrameSchema({column: column for column in ['severity', 'component', 'type', 'line', 'message']},
+                           categorical=['severity', 'component', 'type'])
+HOTSPOT_SCHEMA = FrameSchema({column: column for column in ['securityCategory', 'vulnerabilityProbability', 'component', 'line', 'message']},
+                             categorical=['securityCategory', 'vulnerabilityProbability', 'component'])
+SCHEMAS = {'issues': ISSUE_SCHEMA, 'hotspots': HOTSPOT_SCHEMA}
+# Frames, histograms and table segments of an analysis, read by the charts, the tables and the template
+SonarQubeScan = namedtuple('SonarQubeScan', ['issues', 'hotspots', 'issue_counts', 'hotspot_counts', 'issues_segmented', 'hotspots_segmented'])
 
-def get_image_as_data_url(image_path):
-    with open(image_path, 'rb') as image_file:
-        encoded_image = base64.b64encode(image_file.read()).decode()
-    return f"data:image/png;base64,{encoded_image}"
+# Search endpoint and project parameter of each export, fetched with --server-url
+ENDPOINTS = {'issues': ('/api/issues/search', 'componentKeys'), 'hotspots': ('/api/hotspots/search', 'projectKey')}
+# Largest page both search endpoints accept
+API_PAGE_SIZE = 500
+# The search index behind both endpoints refuses to page past this many results
+API_RESULT_LIMIT = 10000
+DEFAULT_FETCH_WORKERS = 4
+# Table headers of the fixed issues and hotspots in the baseline comparison
+ISSUE_HEADERS = ['Component', 'Line', 'Severity', 'Issue Type', 'Message']
+HOTSPOT_HEADERS = ['Component', 'Line', 'Vulnerability Probability', 'Message']
+
+# Argument parsing for SonarQube report generation
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Process the JSON files for SonarQube and HTML template.')
+    parser.add_argument('issues_file_path', type=str, help='Path to the SonarQube issues JSON file')
+    parser.add_argument('hotspots_file_path', type=str, help='Path to the SonarQube hotspots JSON file')
+    parser.add_argument('template_path', type=str, help='Path to the HTML template file')
+    parser.add_argument('--save-images', action='store_true', help=f'Also write the chart images to {images_path}')
+    parser.add_argument('--server-url', help='Fetch the issues and hotspots from this SonarQube server instead of reading them; '
+                                             'the two JSON paths are then where the fetched exports are written')
+    parser.add_argument('--project-key', help='Project to fetch with --server-url')
+    parser.add_argument('--branch', help='Branch to fetch with --server-url (default the main branch)')
+    parser.add_argument('--token', default=os.environ.get('SONAR_TOKEN'), help='SonarQube token (default $SONAR_TOKEN, which keeps it off the command line)')
+    parser.add_argument('--fetch-workers', type=int, default=DEFAULT_FETCH_WORKERS,
+                        help=f'Pages fetched concurrently with --server-url (default {DEFAULT_FETCH_WORKERS})')
+    parser.add_argument('--baseline', nargs=2, metavar=('ISSUES_JSON', 'HOTSPOTS_JSON'),
+                        help=f'Issues and hotspots of an earlier analysis: only report what is new since then, list what was fixed and write {diff_path}')
+    add_chart_arguments(parser)
+    add_table_arguments(parser)
+    add_cache_arguments(parser)
+    add_history_arguments(parser)
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.server_url and not args.project_key:
+        parser.error('--server-url requires --project-key')
+    return args
 
 def load_json(file_path, key):
-    with open(file_path) as f:
-        data = json.load(f)
-    return pd.json_normalize(data[key])
+    # Items are decoded one at a time, so the whole export is never held in memory
+    return normalize(iter_json_array(file_path, key), key)
+
+def normalize(items, key):
+    """DataFrame of the ``key`` ('issues' or 'hotspots') items with only the columns the report reads."""
+    return SCHEMAS[key].frame(items)
+
+def fingerprint(item):
+    return item['key']
+
+class SonarQubeClient:
+    """Web API client keeping a pool of keep-alive connections, shared by the page fetching threads.
+
+    Each thread takes a connection from the pool for one request and puts it back,
+    so the pool never holds more connections than there are concurrent requests.
+    """
+
+    def __init__(self, server_url, token=None, timeout=60):
+        url = urlsplit(server_url)
+        self.connection_class = http.client.HTTPSConnection if url.scheme == 'https' else http.client.HTTPConnection
+        self.host = url.netloc
+        self.base_path = url.path.rstrip('/')
+        self.timeout = timeout
+        self.headers = {'Accept': 'application/json'}
+        if token:
+            # Tokens are sent as the user name of basic authentication
+            self.headers['Authorization'] = 'Basic ' + base64.b64encode(f'{token}:'.encode()).decode()
+        self._pool = queue.LifoQueue()
+
+    def get(self, path, params):
+        """GET a JSON document; a pooled connection the server has closed in the meantime is replaced once."""
+        url = f'{self.base_path}{path}?{urlencode(params)}'
+        try:
+            connection, reused = self._pool.get_nowait(), True
+        except queue.Empty:
+            connection, reused = self.connection_class(self.host, timeout=self.timeout), False
+        while True:
+            try:
+                connection.request('GET', url, headers=self.headers)
+                response = connection.getresponse()
+                body = response.read()
+                break
+            except (http.client.HTTPException, ConnectionError):
+                connection.close()
+                if not reused:
+                    raise
+                connection, reused = self.connection_class(self.host, timeout=self.timeout), False
+        self._pool.put(connection)
+        if response.status != 200:
+            raise RuntimeError(f'GET {path} failed with HTTP {response.status}: {body[:200].decode(errors="replace")}')
+        return json.loads(body)
+
+    def close(self):
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
+
+def fetch_pages(client, key, project_key, branch=None, page_size=API_PAGE_SIZE, workers=DEFAULT_FETCH_WORKERS):
+    """Yield the pages of the ``key`` ('issues' or 'hotspots') search in order.
+
+    The first page gives the total; up to ``workers`` of the following pages are
+    then in flight at a time, so memory holds a bounded number of pages however
+    large the project.
+    """
+    path, project_param = ENDPOINTS[key]
+    params = {project_param: project_key, 'ps': page_size}
+    if branch:
+        params['branch'] = branch
+
+    def page(number):
+        return client.get(path, {**params, 'p': number})
+
+    first = page(1)
+    # Older servers put the paging fields at the top level of the issues search
+    total = first.get('paging', first).get('total', 0)
+    if total > API_RESULT_LIMIT:
+        print(f"Warning: {project_key} has {total} {key}, the API only returns the first {API_RESULT_LIMIT}", file=sys.stderr)
+        total = API_RESULT_LIMIT
+    yield first
+    numbers = iter(range(2, -(-total // page_size) + 1))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = deque(pool.submit(page, number) for _, number in zip(range(workers), numbers))
+        while pending:
+            result = pending.popleft().result()
+            number = next(numbers, None)
+            if number is not None:
+                pending.append(pool.submit(page, number))
+            yield result
 
-def generate_no_data_image(image_path, title):
-    plt.figure(figsize=(20, 12))
+def export_items(pages, key, path):
+    """Yield the items of the fetched pages while writing them to ``path`` as a ``{key: [...]}`` export.
+
+    The export is what the generator reads without --server-url, so it can be
+    archived and used as the next build's --baseline.
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    partial = path + '.part'
+    count = 0
+    try:
+        with open(partial, 'w') as f:
+            f.write(f'{{"{key}": [')
+            for page in pages:
+                for item in page[key]:
+                    f.write(',\n' if count else '\n')
+                    f.write(json.dumps(item))
+                    count += 1
+                    yield item
+            f.write(f'\n], "total": {count}}}\n')
+    except BaseException:
+        # A failed or abandoned fetch must not leave a truncated export behind
+        os.remove(partial)
+        raise
+    os.replace(partial, path)
+    print(f"Fetched {count} {key} into {path}")
+
+def fetch(args, key, path):
+    """Items of ``key`` streamed from the server, written to ``path`` on the way."""
+    client = SonarQubeClient(args.server_url, args.token)
+    try:
+        yield from export_items(fetch_pages(client, key, args.project_key, args.branch, workers=args.fetch_workers), key, path)
+    finally:
+        client.close()
+
+def generate_no_data_image(title):
+    import matplotlib.pyplot as plt
+    fig = plt.figure(figsize=(20, 12))
     plt.text(0.5, 0.6, title, horizontalalignment='center', verticalalignment='center', fontsize=28, color='black')
     plt.text(0.5, 0.4, 'No Data Found', horizontalalignment='center', verticalalignment='center', fontsize=28, color='red')
     plt.axis('off')
     plt.tight_layout()
-    plt.savefig(image_path)
+    return fig
 
 def wrap_text(text, width=55):
     """Wrap text into multiple lines of the given width."""
     return '\n'.join(wrap(text, width=width))
 
-def generate_severity_plot(df):
-    if 'severity' not in df.columns:
-        generate_no_data_image(os.path.join(images_path, 'severity_counts.png'), 'Number of Issues per Severity Level')
-        return
+def generate_severity_plot(counts):
+    import matplotlib.pyplot as plt
+    if 'severity' not in counts:
+        return generate_no_data_image('Number of Issues per Severity Level')
 
-    severity_counts = df['severity'].value_counts()
+    severity_counts = counts['severity']
     colors = {
         'CRITICAL': '#f72d2a',  # red
         'MAJOR': '#ff7f0e',    # orange
@@ -57,7 +222,7 @@ def generate_severity_plot(df):
     }
     bar_colors = [colors.get(severity, '#808080') for severity in severity_counts.index]  # default to grey if severity not found
     
-    plt.figure(figsize=(20, 12))
+    fig = plt.figure(figsize=(20, 12))
     bars = plt.bar(severity_counts.index, severity_counts.values, color=bar_colors)
     plt.title('Number of Issues per Severity Level', fontsize=28)
     plt.xlabel('Severity Level', fontsize=22)
@@ -66,13 +231,15 @@ def generate_severity_plot(df):
     plt.yticks(fontsize=20)
     plt.tight_layout()
     plt.subplots_adjust(top=0.9)
-    plt.savefig(os.path.join(images_path, 'severity_counts.png'))
+    return fig
 
-def generate_file_plot(df):
-    file_counts = df['component'].value_counts().head(10)
+def generate_file_plot(counts):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    file_counts = counts['component'].head(10)
     wrapped_labels = [wrap_text(label) for label in file_counts.index]
 
-    plt.figure(figsize=(20, 12))
+    fig = plt.figure(figsize=(20, 12))
     bars = plt.barh(wrapped_labels, file_counts.values, color=sns.color_palette(['#66BB6A', '#1f77b4', '#66bba2', '#ff7f0e'], 10))
     plt.title('Top 10 Components with Most Issues', fontsize=28)
     plt.xlabel('Number of Issues', fontsize=22)
@@ -81,29 +248,35 @@ def generate_file_plot(df):
     plt.yticks(fontsize=20)
     plt.tight_layout()
     plt.subplots_adjust(top=0.9)
-    plt.savefig(os.path.join(images_path, 'file_counts.png'))
+    return fig
 
-def generate_issue_type_plot(df):
-    issue_type_counts = df['type'].value_counts()
-    plt.figure(figsize=(20, 12))
+def generate_issue_type_plot(counts):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    issue_type_counts = counts['type']
+    fig = plt.figure(figsize=(20, 12))
     issue_type_counts.plot.pie(autopct="%.1f%%", colors=sns.color_palette(['#66BB6A', '#1f77b4', '#66bba2'], len(issue_type_counts)), startangle=90, fontsize=22, textprops={'fontsize': 20})
     plt.title('Distribution of Issue Types', fontsize=28)
     plt.tight_layout()
     plt.subplots_adjust(top=0.9)
-    plt.savefig(os.path.join(images_path, 'issue_type_counts.png'))
+    return fig
 
-def generate_category_plot(df):
-    category_counts = df['securityCategory'].value_counts()
-    plt.figure(figsize=(20, 12))
+def generate_category_plot(counts):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    category_counts = counts['category']
+    fig = plt.figure(figsize=(20, 12))
     category_counts.plot.pie(autopct="%.1f%%", colors=sns.color_palette(['#66BB6A', '#1f77b4', '#ff7f0e', '#66bba2'], len(category_counts)), startangle=90, fontsize=22, textprops={'fontsize': 20})
     plt.title('Number of Hotspots per Security Category', fontsize=28)
     plt.tight_layout()
     plt.subplots_adjust(top=0.9)
-    plt.savefig(os.path.join(images_path, 'category_counts.png'))
+    return fig
 
-def generate_vulnerability_prob_plot(df):
-    vulnerability_prob_counts = df['vulnerabilityProbability'].value_counts()
-    plt.figure(figsize=(20, 12))
+def generate_vulnerability_prob_plot(counts):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    vulnerability_prob_counts = counts['probability']
+    fig = plt.figure(figsize=(20, 12))
     bars = plt.bar(vulnerability_prob_counts.index, vulnerability_prob_counts.values, color=sns.color_palette(['#ff7f0e', '#f72d2a', '#d1ca6f'], len(vulnerability_prob_counts)))
     plt.title('Distribution of Hotspots by Vulnerability Probability', fontsize=28)
     plt.xlabel('Vulnerability Probability', fontsize=22)
@@ -112,13 +285,15 @@ def generate_vulnerability_prob_plot(df):
     plt.yticks(fontsize=20)
     plt.tight_layout()
     plt.subplots_adjust(top=0.9)
-    plt.savefig(os.path.join(images_path, 'vulnerability_prob_counts.png'))
+    return fig
 
-def generate_hotspot_file_plot(df):
-    hotspot_file_counts = df['component'].value_counts().head(10)
+def generate_hotspot_file_plot(counts):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    hotspot_file_counts = counts['component'].head(10)
     wrapped_labels = [wrap_text(label) for label in hotspot_file_counts.index]
 
-    plt.figure(figsize=(20, 12))
+    fig = plt.figure(figsize=(20, 12))
     bars = plt.barh(wrapped_labels, hotspot_file_counts.values, color=sns.color_palette(['#66BB6A', '#1f77b4', '#66bba2'], 10))
     plt.title('Top 10 Components with Most Hotspots', fontsize=28)
     plt.xlabel('Number of Hotspots', fontsize=22)
@@ -127,65 +302,133 @@ def generate_hotspot_file_plot(df):
     plt.yticks(fontsize=20)
     plt.tight_layout()
     plt.subplots_adjust(top=0.9)
-    plt.savefig(os.path.join(images_path, 'hotspot_file_counts.png'))
+    return fig
+
+def table_rows(df, columns):
+    return df.reindex(columns=columns).itertuples(index=False)
 
 def segment_data_by_column(df, column_name):
     """Segment data by unique values in a column."""
-    levels = df[column_name].unique()
-    return {level: df[df[column_name] == level] for level in levels}
-
-# Main
-df_issues = load_json(issues_file_path, 'issues')
-df_hotspots = load_json(hotspots_file_path, 'hotspots')
-
-# Segment the data
-issues_segmented = segment_data_by_column(df_issues, 'severity') if 'severity' in df_issues.columns else {}
-hotspots_segmented = segment_data_by_column(df_hotspots, 'vulnerabilityProbability')
-
-# Check if there are issues and generate corresponding plots
-if not df_issues.empty:
-    generate_severity_plot(df_issues)
-    generate_file_plot(df_issues)
-    generate_issue_type_plot(df_issues)
-else:
-    generate_no_data_image(os.path.join(images_path, 'severity_counts.png'), 'Number of Issues per Severity Level')
-    generate_no_data_image(os.path.join(images_path, 'file_counts.png'), 'Top 10 Components with Most Issues')
-    generate_no_data_image(os.path.join(images_path, 'issue_type_counts.png'), 'Distribution of Issue Types')
-
-# Check if there are hotspots and generate corresponding plots
-if not df_hotspots.empty:
-    generate_category_plot(df_hotspots)
-    generate_vulnerability_prob_plot(df_hotspots)
-    generate_hotspot_file_plot(df_hotspots)
-else:
-    generate_no_data_image(os.path.join(images_path, 'category_counts.png'), 'Number of Hotspots per Security Category')
-    generate_no_data_image(os.path.join(images_path, 'vulnerability_prob_counts.png'), 'Distribution of Hotspots by Vulnerability Probability')
-    generate_no_data_image(os.path.join(images_path, 'hotspot_file_counts.png'), 'Top 10 Components with Most Hotspots')
-
-# Convert the images to data URLs
-severity_plot_data_url = get_image_as_data_url(os.path.join(images_path, 'severity_counts.png'))
-file_plot_data_url = get_image_as_data_url(os.path.join(images_path, 'file_counts.png'))
-issue_type_plot_data_url = get_image_as_data_url(os.path.join(images_path, 'issue_type_counts.png'))
-category_plot_data_url = get_image_as_data_url(os.path.join(images_path, 'category_counts.png'))
-vulnerability_prob_plot_data_url = get_image_as_data_url(os.path.join(images_path, 'vulnerability_prob_counts.png'))
-hotspot_file_plot_data_url = get_image_as_data_url(os.path.join(images_path, 'hotspot_file_counts.png'))
-
-# Render the HTML template
-env = Environment(loader=FileSystemLoader('./'))
-template = env.get_template(template_path)
-html_content = template.render(
-    issues_data_segmented=issues_segmented,
-    hotspots_data_segmented=hotspots_segmented,
-    severity_plot=severity_plot_data_url,
-    file_plot=file_plot_data_url,
-    issue_type_plot=issue_type_plot_data_url,
-    category_plot=category_plot_data_url,
-    vulnerability_prob_plot=vulnerability_prob_plot_data_url,
-    hotspot_file_plot=hotspot_file_plot_data_url
-)
-
-# Save the rendered content to an HTML file
-with open('sonarqube/sonarqube-report.html', 'w') as f:
-    f.write(html_content)
-
-print("Finished writing file.")
+    return partition(df, column_name)
+
+def chart_jobs(scan, args):
+    """The six summary charts, keyed by template variable."""
+    def job(name, image_name, plot, *plot_args):
+        save_path = os.path.join(images_path, image_name) if args.save_images else None
+        return chart_job(name, plot, *plot_args, save_path=save_path)
+
+    # Check if there are issues and generate corresponding plots
+    if not scan.issues.empty:
+        jobs = [
+            job('severity_plot', 'severity_counts.png', generate_severity_plot, subset(scan.issue_counts, 'severity')),
+            job('file_plot', 'file_counts.png', generate_file_plot, subset(scan.issue_counts, 'component')),
+            job('issue_type_plot', 'issue_type_counts.png', generate_issue_type_plot, subset(scan.issue_counts, 'type')),
+        ]
+    else:
+        jobs = [
+            job('severity_plot', 'severity_counts.png', generate_no_data_image, 'Number of Issues per Severity Level'),
+            job('file_plot', 'file_counts.png', generate_no_data_image, 'Top 10 Components with Most Issues'),
+            job('issue_type_plot', 'issue_type_counts.png', generate_no_data_image, 'Distribution of Issue Types'),
+        ]
+
+    # Check if there are hotspots and generate corresponding plots
+    if not scan.hotspots.empty:
+        jobs += [
+            job('category_plot', 'category_counts.png', generate_category_plot, subset(scan.hotspot_counts, 'category')),
+            job('vulnerability_prob_plot', 'vulnerability_prob_counts.png', generate_vulnerability_prob_plot, subset(scan.hotspot_counts, 'probability')),
+            job('hotspot_file_plot', 'hotspot_file_counts.png', generate_hotspot_file_plot, subset(scan.hotspot_counts, 'component')),
+        ]
+    else:
+        jobs += [
+            job('category_plot', 'category_counts.png', generate_no_data_image, 'Number of Hotspots per Security Category'),
+            job('vulnerability_prob_plot', 'vulnerability_prob_counts.png', generate_no_data_image, 'Distribution of Hotspots by Vulnerability Probability'),
+            job('hotspot_file_plot', 'hotspot_file_counts.png', generate_no_data_image, 'Top 10 Components with Most Hotspots'),
+        ]
+    return jobs
+
+def read_scan(args, cache, timer):
+    """The issues and hotspots frames, fetched with --server-url, and the baseline sections."""
+    input_paths = [args.issues_file_path, args.hotspots_file_path]
+    if args.baseline:
+        if args.server_url:
+            # The diff reads the exports from disk, so fetch them there first
+            with timer.stage('fetch'):
+                for key, path in zip(SCHEMAS, input_paths):
+                    deque(fetch(args, key, path), maxlen=0)
+        with timer.stage('diff'):
+            issues_diff = diff_findings(iter_json_array(args.issues_file_path, 'issues'), iter_json_array(args.baseline[0], 'issues'), fingerprint)
+            hotspots_diff = diff_findings(iter_json_array(args.hotspots_file_path, 'hotspots'), iter_json_array(args.baseline[1], 'hotspots'), fingerprint)
+            write_baseline_diff(diff_path, {'issues': issues_diff, 'hotspots': hotspots_diff})
+            baseline = [
+                baseline_section('Issues', issues_diff, ISSUE_HEADERS, IssueRecord),
+                baseline_section('Hotspots', hotspots_diff, HOTSPOT_HEADERS, HotspotRecord),
+            ]
+        # The rest of the report only covers the new issues and hotspots
+        with timer.stage('parse'):
+            frames = normalize(issues_diff.new, 'issues'), normalize(hotspots_diff.new, 'hotspots')
+    elif args.server_url:
+        baseline = None
+        # Pages go straight into the DataFrames as they arrive
+        with timer.stage('fetch'):
+            frames = tuple(normalize(fetch(args, key, path), key) for key, path in zip(SCHEMAS, input_paths))
+    else:
+        baseline = None
+        with timer.stage('parse'):
+            model_key = cache.key('model', *(cache.file_digest(path) for path in input_paths))
+            frames = cache.cached('model', model_key, lambda: (
+                load_json(args.issues_file_path, 'issues'),
+                load_json(args.hotspots_file_path, 'hotspots'),
+            ))
+    timer.add_frames(dict(zip(SCHEMAS, frames)))
+    return frames, baseline
+
+def build_scan(frames):
+    """Compute every histogram once; the plots and the template only read these."""
+    df_issues, df_hotspots = frames
+    issue_counts = aggregate(df_issues, ISSUE_AGGREGATES)
+    hotspot_counts = aggregate(df_hotspots, HOTSPOT_AGGREGATES)
+
+    # Segment the data
+    issues_segmented = segment_data_by_column(df_issues, 'severity') if 'severity' in df_issues.columns else {}
+    hotspots_segmented = segment_data_by_column(df_hotspots, 'vulnerabilityProbability')
+    return SonarQubeScan(df_issues, df_hotspots, issue_counts, hotspot_counts, issues_segmented, hotspots_segmented)
+
+def history_counts(scan):
+    return {
+        **{f'issues {name}': counts for name, counts in scan.issue_counts.items()},
+        **{f'hotspots {name}': counts for name, counts in scan.hotspot_counts.items()},
+    }
+
+def table_total(scan):
+    return len(scan.issues) + len(scan.hotspots)
+
+def table_sections(scan):
+    sections = {}
+    for severity, data in scan.issues_segmented.items():
+        sections[f'issues:{severity}'] = (['text'] * len(ISSUE_COLUMNS), table_rows(data, ISSUE_COLUMNS), len(data))
+    for prob, data in scan.hotspots_segmented.items():
+        sections[f'hotspots:{prob}'] = (['text'] * len(HOTSPOT_COLUMNS), table_rows(data, HOTSPOT_COLUMNS), len(data))
+    return sections
+
+def template_context(scan, args):
+    return dict(
+        issues_data_segmented={severity: records(IssueRecord, table_rows(data, ISSUE_COLUMNS)) for severity, data in scan.issues_segmented.items()},
+        hotspots_data_segmented={prob: records(HotspotRecord, table_rows(data, HOTSPOT_COLUMNS)) for prob, data in scan.hotspots_segmented.items()},
+        issues_severity_totals={severity: len(data) for severity, data in scan.issues_segmented.items()},
+        hotspots_probability_totals={prob: len(data) for prob, data in scan.hotspots_segmented.items()},
+    )
+
+def main(argv=None):
+    generate_report(parse_args(argv))
+
+def generate_report(args):
+    # Fetched exports only exist once they are fetched, so there is nothing to look up
+    input_paths = None if args.server_url else [args.issues_file_path, args.hotspots_file_path]
+    return build_report(
+        args, 'sonarqube', __file__, report_path, input_paths, read_scan,
+        aggregate=build_scan, counts=history_counts, charts=chart_jobs, context=template_context,
+        total=table_total, tables=table_sections,
+    )
+
+if __name__ == '__main__':
+    main()
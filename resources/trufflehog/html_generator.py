@@ -1,37 +1,72 @@
 import argparse
-import json
 import os
-import base64
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from jinja2 import Environment, FileSystemLoader
+import sys
+from collections import Counter, namedtuple
+from operator import attrgetter
 
-# Argument parsing
-parser = argparse.ArgumentParser(description='Process the JSON file and HTML template for Trufflehog.')
-parser.add_argument('file_path', type=str, help='Path to the JSON file')
-parser.add_argument('template_path', type=str, help='Path to the HTML template file')
-args = parser.parse_args()
-file_path = args.file_path
-template_path = args.template_path
-
-# Define the path for images
+# The shared modules sit in ../common, both in the library checkout and in .security-reports/ where the pipeline steps copy them
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'common'))
+from report_utils import FrameSchema, RowSpool, add_cache_arguments, add_chart_arguments, add_profile_arguments, add_table_arguments, baseline_section, build_report, chart_job, count_values, counts_from_counter, diff_findings, iter_json_array, record_type, records, write_baseline_diff
+from history import add_history_arguments
+
+# Define the path for images, only written with --save-images
 images_path = './trufflehog/images/'
-os.makedirs(images_path, exist_ok=True)  # Create the directory if it doesn't exist
+report_path = './trufflehog/trufflehog-report.html'
+diff_path = './trufflehog/trufflehog-baseline-diff.json'
+
+# Argument parsing
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Process the JSON file and HTML template for Trufflehog.')
+    parser.add_argument('file_path', type=str, help='Path to the JSON file')
+    parser.add_argument('template_path', type=str, help='Path to the HTML template file')
+    parser.add_argument('--stream', action='store_true', help='Read the findings incrementally (JSON array or JSON lines) instead of loading the whole file')
+    parser.add_argument('--save-images', action='store_true', help=f'Also write the chart image to {images_path}')
+    parser.add_argument('--baseline', help=f'Trufflehog JSON of an earlier scan: only report the secrets that are new since then, list the fixed ones and write {diff_path}')
+    add_chart_arguments(parser)
+    add_table_arguments(parser)
+    add_cache_arguments(parser)
+    add_history_arguments(parser)
+    add_profile_arguments(parser)
+    return parser.parse_args(argv)
+
+TrufflehogRow = namedtuple('TrufflehogRow', ['path', 'commit', 'date', 'reason', 'stringsFound'])
+TrufflehogRecord = record_type('TrufflehogRecord', TrufflehogRow._fields)
+# The only fields read from each finding; the diff and printable diff are never loaded
+SCHEMA = FrameSchema({field: field for field in TrufflehogRow._fields}, categorical=['path', 'commit', 'date', 'reason'])
+# Fixed secrets in the baseline comparison
+BaselineRecord = record_type('TrufflehogBaselineRecord', ['path', 'commit', 'date', 'reason'])
+BASELINE_COLUMNS = ['File Path', 'Commit', 'Date', 'Reason']
+# Secrets per file and the table rows, read once by the charts, the tables or the template
+TrufflehogScan = namedtuple('TrufflehogScan', ['file_counts', 'rows', 'total'])
 
-def get_image_as_data_url(image_path):
-    with open(image_path, 'rb') as image_file:
-        encoded_image = base64.b64encode(image_file.read()).decode()
-    return f"data:image/png;base64,{encoded_image}"
+def fingerprint(item):
+    return item.get('path'), item.get('commit'), item.get('reason')
 
 def load_and_parse_trufflehog(file_path):
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-    df = pd.DataFrame(data)
-    return df
+    # Findings are decoded one at a time (JSON array or JSON lines), never the whole file at once
+    return SCHEMA.frame(iter_json_array(file_path))
 
-def generate_file_plot_trufflehog_pie(df, top_n=5): 
-    file_counts = df['path'].value_counts()
+def stream_and_aggregate_trufflehog(file_path):
+    """Count secrets per file one finding at a time, spooling table rows to disk."""
+    path_counter = Counter()
+    rows = RowSpool(TrufflehogRow)
+    for item in iter_json_array(file_path):
+        if item.get('path') is not None:
+            path_counter[item['path']] += 1
+        rows.append([item.get(field) for field in TrufflehogRow._fields])
+    file_counts = counts_from_counter(path_counter)
+    return file_counts, rows
+
+def generate_file_plot_trufflehog_pie(file_counts, top_n=5):
+    import pandas as pd
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    if file_counts.empty:
+        # plt.pie fails on an empty series; a clean scan still gets a chart
+        fig = plt.figure(figsize=(20, 15))
+        plt.text(0.5, 0.5, 'No Secrets Found', horizontalalignment='center', verticalalignment='center', fontsize=28)
+        plt.axis('off')
+        return fig
     if len(file_counts) > top_n:
         top_files = file_counts[:top_n]
         others_count = file_counts[top_n:].sum()
@@ -48,26 +83,58 @@ def generate_file_plot_trufflehog_pie(df, top_n=5):
     fig.suptitle('Distribution of Secrets Detected Across Files', fontsize=28, y=0.92)
     
     plt.tight_layout()
-    plt.savefig(os.path.join(images_path, 'file_counts_trufflehog_pie_professional.png'), dpi=300)
+    return fig
+
+def chart_jobs(scan, args):
+    """The pie chart of the secrets per file."""
+    save_path = os.path.join(images_path, 'file_counts_trufflehog_pie_professional.png') if args.save_images else None
+    return [chart_job('file_plot', generate_file_plot_trufflehog_pie, scan.file_counts, dpi=300, save_path=save_path)]
+
+def read_scan(args, cache, timer):
+    """The findings frame (the aggregated scan with --stream, the new findings with --baseline) and the baseline sections."""
+    if args.baseline:
+        with timer.stage('diff'):
+            diff = diff_findings(iter_json_array(args.file_path), iter_json_array(args.baseline), fingerprint)
+            write_baseline_diff(diff_path, {'trufflehog': diff})
+            baseline = [baseline_section('Trufflehog', diff, BASELINE_COLUMNS, BaselineRecord)]
+        # The rest of the report only covers the new secrets
+        return diff.new, baseline
+    if args.stream:
+        with timer.stage('parse'):
+            file_counts, rows = stream_and_aggregate_trufflehog(args.file_path)
+        return TrufflehogScan(file_counts, rows, len(rows)), None
+    with timer.stage('parse'):
+        model_key = cache.key('model', cache.file_digest(args.file_path))
+        df = cache.cached('model', model_key, lambda: load_and_parse_trufflehog(args.file_path).reindex(columns=list(TrufflehogRow._fields)))
+    timer.add_frames({'findings': df})
+    return df, None
+
+def build_scan(df):
+    return TrufflehogScan(count_values(df['path']), df.itertuples(index=False, name='TrufflehogRow'), len(df))
+
+def build_scan_from_items(items):
+    rows = [[item.get(field) for field in TrufflehogRow._fields] for item in items]
+    return TrufflehogScan(counts_from_counter(Counter(row[0] for row in rows if row[0] is not None)), rows, len(rows))
 
-# Main logic
-df = load_and_parse_trufflehog(file_path)
-generate_file_plot_trufflehog_pie(df)
+def history_counts(scan):
+    return {'file': scan.file_counts}
 
-# Convert the image to data URL
-file_plot_data_url = get_image_as_data_url(os.path.join(images_path, 'file_counts_trufflehog_pie_professional.png'))
+def table_sections(scan):
+    return {'secrets': (['text'] * len(TrufflehogRow._fields), scan.rows, scan.total)}
 
-env = Environment(loader=FileSystemLoader('./'))
-template = env.get_template(template_path)
+def template_context(scan, args):
+    return dict(rows=records(TrufflehogRecord, scan.rows), total=scan.total)
 
-print("Rendering template...")
-html_content = template.render(
-    data=df,
-    file_plot=file_plot_data_url
-)
+def main(argv=None):
+    generate_report(parse_args(argv))
 
-print("Writing HTML content to file...")
-with open('./trufflehog/trufflehog-report.html', 'w') as f:
-    f.write(html_content)
+def generate_report(args):
+    return build_report(
+        args, 'trufflehog', __file__, report_path, [args.file_path], read_scan,
+        aggregate=build_scan_from_items if args.baseline else (None if args.stream else build_scan),
+        counts=history_counts, charts=chart_jobs, context=template_context,
+        total=attrgetter('total'), tables=table_sections,
+    )
 
-print("Finished writing file.")
\ No newline at end of file
+if __name__ == '__main__':
+    main()
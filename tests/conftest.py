@@ -0,0 +1,5 @@
+import os
+import sys
+
+RESOURCES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'resources')
+sys.path.append(os.path.join(RESOURCES, 'common'))
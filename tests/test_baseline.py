@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+from report_utils import diff_findings, load_generator
+
+
+@pytest.fixture(scope='module')
+def bandit():
+    return load_generator('bandit')
+
+
+def bandit_result(filename, line, code, test_id='B101', severity='LOW'):
+    return {
+        'filename': filename, 'line_number': line, 'code': code, 'test_id': test_id,
+        'issue_severity': severity, 'issue_confidence': 'HIGH', 'issue_text': f'{test_id} in {filename}',
+        'issue_cwe': {'id': 703}, 'more_info': 'https://bandit.readthedocs.io/',
+    }
+
+
+def test_diff_by_fingerprint():
+    diff = diff_findings([{'id': 1}, {'id': 2}], [{'id': 2}, {'id': 3}], lambda item: item['id'])
+    assert diff.new == [{'id': 1}]
+    assert diff.fixed == [{'id': 3}]
+    assert diff.unchanged == [{'id': 2}]
+
+
+def test_identical_fingerprints_match_one_to_one():
+    current = [{'id': 1, 'copy': copy} for copy in range(3)]
+    diff = diff_findings(current, current[:2], lambda item: item['id'])
+    assert (len(diff.new), len(diff.fixed), len(diff.unchanged)) == (1, 0, 2)
+    diff = diff_findings(current[:1], current, lambda item: item['id'])
+    assert (len(diff.new), len(diff.fixed), len(diff.unchanged)) == (0, 2, 1)
+
+
+def test_bandit_fingerprint_survives_moved_code(bandit):
+    before = bandit_result('app.py', 10, '10 import pickle\n11 pickle.loads(data)\n')
+    after = bandit_result('app.py', 42, '42 import pickle\n43     pickle.loads(data)\n')
+    assert bandit.fingerprint(before) == bandit.fingerprint(after)
+
+
+def test_bandit_fingerprint_changes_with_code_file_or_test(bandit):
+    finding = bandit_result('app.py', 10, '10 pickle.loads(data)\n')
+    assert bandit.fingerprint(finding) != bandit.fingerprint(bandit_result('app.py', 10, '10 pickle.loads(other)\n'))
+    assert bandit.fingerprint(finding) != bandit.fingerprint(bandit_result('lib.py', 10, '10 pickle.loads(data)\n'))
+    assert bandit.fingerprint(finding) != bandit.fingerprint(bandit_result('app.py', 10, '10 pickle.loads(data)\n', 'B301'))
+
+
+def test_bandit_fingerprint_without_code(bandit):
+    finding = bandit_result('app.py', 10, None)
+    del finding['code']
+    assert bandit.fingerprint(finding) == ('app.py', 'B101', '')
+
+
+def test_trufflehog_and_sonarqube_fingerprints():
+    trufflehog = load_generator('trufflehog')
+    secret = {'path': 'config.py', 'commit': 'abc', 'reason': 'High Entropy', 'date': '2024-01-01'}
+    assert trufflehog.fingerprint(secret) == trufflehog.fingerprint({**secret, 'date': '2024-02-01', 'diff': '+x'})
+    assert trufflehog.fingerprint(secret) != trufflehog.fingerprint({**secret, 'commit': 'def'})
+    # Issue keys are stable across analyses
+    sonarqube = load_generator('sonarqube')
+    assert sonarqube.fingerprint({'key': 'AX1', 'line': 3}) == sonarqube.fingerprint({'key': 'AX1', 'line': 30})
+
+
+def test_bandit_report_with_baseline(bandit, tmp_path, monkeypatch):
+    unchanged = bandit_result('app.py', 10, '10 assert user\n')
+    fixed = bandit_result('old.py', 5, '5 eval(x)\n', 'B307', 'MEDIUM')
+    new = bandit_result('new.py', 7, '7 exec(code)\n', 'B102', 'HIGH')
+    (tmp_path / 'baseline.json').write_text(json.dumps({'results': [unchanged, fixed]}))
+    (tmp_path / 'current.json').write_text(json.dumps({'results': [dict(unchanged, line_number=12, code='12 assert user\n'), new]}))
+    monkeypatch.chdir(tmp_path)
+
+    bandit.generate_report(bandit.parse_args(['current.json', 'bandit/report_template.html', '--baseline', 'baseline.json', '--no-charts']))
+
+    with open(bandit.diff_path) as f:
+        summary = json.load(f)['bandit']
+    assert (summary['new'], summary['fixed'], summary['unchanged']) == (1, 1, 1)
+    assert summary['new_findings'] == [new]
+    assert summary['fixed_findings'] == [fixed]
+    with open(bandit.report_path) as f:
+        html = f.read()
+    # The tables only list the new finding; the fixed one is in the baseline section
+    assert 'new.py' in html and 'old.py' in html
+    assert 'app.py' not in html
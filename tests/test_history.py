@@ -0,0 +1,87 @@
+import json
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from history import COLUMNS, COLUMN_DTYPE, HistoryStore, fcntl
+
+
+def test_trend_over_runs(tmp_path):
+    store = HistoryStore(str(tmp_path), 'bandit')
+    store.append({'severity': {'LOW': 3, 'HIGH': 1}}, 'build-1')
+    store.append({'severity': {'LOW': 1, 'MEDIUM': 5}, 'file': {'app.py': 6}}, 'build-2')
+
+    assert sorted(store.aggregates()) == ['file', 'severity']
+    trend = store.trend('severity')
+    assert trend.builds == ['build-1', 'build-2']
+    # Labels by total count, largest first; a label missing from a run counts 0
+    assert trend.labels == ['MEDIUM', 'LOW', 'HIGH']
+    assert trend.counts.tolist() == [[0, 3, 1], [5, 1, 0]]
+    last = store.trend('severity', last=1)
+    assert last.builds == ['build-2']
+    assert last.counts.tolist() == [[5, 1]]
+
+
+def test_unknown_aggregate_and_empty_store(tmp_path):
+    store = HistoryStore(str(tmp_path), 'safety')
+    assert store.aggregates() == []
+    assert store.trend('package').counts.shape == (0, 0)
+    store.append({'package': {'django': 2}}, 'build-1')
+    trend = store.trend('severity')
+    assert trend.builds == ['build-1']
+    assert trend.labels == []
+
+
+def interrupt(store, counts):
+    """Leave the column files of a run that died before writing its runs.jsonl line."""
+    store.append(counts, 'interrupted')
+    with open(store._file('runs.jsonl')) as f:
+        lines = f.readlines()
+    with open(store._file('runs.jsonl'), 'w') as f:
+        f.writelines(lines[:-1])
+    # Dying mid-append can also leave the columns of different lengths
+    with open(store._file('count.u32'), 'ab') as f:
+        f.truncate(f.tell() - np.dtype(COLUMN_DTYPE).itemsize)
+
+
+def test_interrupted_run_is_ignored_and_overwritten(tmp_path):
+    store = HistoryStore(str(tmp_path), 'bandit')
+    store.append({'severity': {'LOW': 1}}, 'build-1')
+    interrupt(store, {'severity': {'LOW': 100, 'HIGH': 100}})
+
+    assert store.trend('severity').counts.tolist() == [[1]]
+    store.append({'severity': {'HIGH': 2}}, 'build-2')
+    trend = store.trend('severity')
+    assert trend.builds == ['build-1', 'build-2']
+    assert dict(zip(trend.labels, trend.counts.T.tolist())) == {'LOW': [1, 0], 'HIGH': [0, 2]}
+    lengths = {name: len(store._read_column(name)) for name in COLUMNS}
+    assert set(lengths.values()) == {2}
+
+
+def append_runs(directory, worker, runs):
+    store = HistoryStore(directory, 'bandit')
+    for run in range(runs):
+        store.append({'severity': {'LOW': 1}, 'worker': {f'worker-{worker}': run + 1}}, f'{worker}-{run}')
+
+
+@pytest.mark.skipif(fcntl is None, reason='appends are only locked where fcntl is available')
+def test_concurrent_appends(tmp_path):
+    workers, runs = 4, 25
+    context = multiprocessing.get_context('fork')
+    processes = [context.Process(target=append_runs, args=(str(tmp_path), worker, runs)) for worker in range(workers)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+        assert process.exitcode == 0
+
+    store = HistoryStore(str(tmp_path), 'bandit')
+    trend = store.trend('severity')
+    assert len(trend.builds) == workers * runs
+    assert trend.counts.tolist() == [[1]] * (workers * runs)
+    # Every run got its own entries and every string was stored once
+    with open(store._file('strings.jsonl')) as f:
+        strings = [json.loads(line) for line in f]
+    assert len(strings) == len(set(strings)) == 3 + workers
+    assert store.trend('worker').counts.sum(axis=0).tolist() == [runs * (runs + 1) // 2] * workers
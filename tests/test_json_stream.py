@@ -0,0 +1,95 @@
+import json
+import random
+
+import pytest
+
+from report_utils import JSON_CHUNK_SIZE, iter_json_array
+
+# Chunks this small put a buffer edge inside every number, literal and string,
+# which the generators' 64 KB chunks only hit by chance
+CHUNK_SIZES = range(1, 65)
+
+
+def scalar(rng):
+    return rng.choice([
+        rng.randint(-10 ** 12, 10 ** 12),
+        rng.uniform(-1e4, 1e4),
+        rng.uniform(-1, 1) * 10 ** rng.randint(-30, 30),
+        rng.choice([True, False, None]),
+        rng.choice(['', 'plain', 'esc\\aped "quotes"', 'unicode é中', '1.5e3']),
+    ])
+
+
+def value(rng, depth=0):
+    kind = rng.random()
+    if depth < 3 and kind < 0.15:
+        return [value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    if depth < 3 and kind < 0.3:
+        return {f'k{i}': value(rng, depth + 1) for i in range(rng.randint(0, 4))}
+    return scalar(rng)
+
+
+ITEMS = [value(random.Random(0)) for _ in range(100)]
+CONTAINERS = [item for item in ITEMS if isinstance(item, (dict, list, str))]
+
+# (text, key, expected items) of every layout iter_json_array reads
+DOCUMENTS = {
+    'array': (json.dumps(ITEMS), None, ITEMS),
+    'compact array': (json.dumps(ITEMS, separators=(',', ':')), None, ITEMS),
+    'json lines': ('\n'.join(json.dumps(item) for item in ITEMS) + '\n', None, ITEMS),
+    'concatenated': (''.join(json.dumps(item) for item in CONTAINERS), None, CONTAINERS),
+    # Scalar and nested members before and after the array are skipped
+    'keyed': (json.dumps({'version': 1.25e3, 'skipped': ITEMS[:20], 'count': 974209767201, 'results': ITEMS, 'total': -0.5}), 'results', ITEMS),
+}
+
+
+def write(tmp_path, text):
+    path = tmp_path / 'document.json'
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+@pytest.mark.parametrize('name', DOCUMENTS)
+def test_matches_json_load_at_every_small_chunk_size(tmp_path, name):
+    text, key, expected = DOCUMENTS[name]
+    path = write(tmp_path, text)
+    for chunk_size in CHUNK_SIZES:
+        assert list(iter_json_array(path, key, chunk_size)) == expected, f'chunk size {chunk_size}'
+
+
+@pytest.mark.parametrize('text, key, expected', [
+    ('[12345]', None, [12345]),
+    ('[12345, 6]', None, [12345, 6]),
+    ('12345\n6\n', None, [12345, 6]),
+    ('[-1.5e+10]', None, [-1.5e+10]),
+    ('{"n": 12345, "results": [1]}', 'results', [1]),
+])
+def test_number_ending_at_the_buffer_edge(tmp_path, text, key, expected):
+    # A number cut off by the end of the buffer must not be decoded as a shorter one
+    path = write(tmp_path, text)
+    for chunk_size in range(1, len(text) + 2):
+        assert list(iter_json_array(path, key, chunk_size)) == expected, f'chunk size {chunk_size}'
+
+
+def test_literals_split_across_chunks(tmp_path):
+    path = write(tmp_path, '[true, false, null, "tru", "e"]')
+    for chunk_size in range(1, 8):
+        assert list(iter_json_array(path, chunk_size=chunk_size)) == [True, False, None, 'tru', 'e']
+
+
+def test_default_chunk_size(tmp_path):
+    items = [{'filename': f'file{index}.py', 'line_number': index} for index in range(10000)]
+    path = write(tmp_path, json.dumps({'results': items}))
+    assert len(json.dumps(items)) > JSON_CHUNK_SIZE
+    assert list(iter_json_array(path, 'results')) == items
+
+
+def test_missing_key_and_empty_file(tmp_path):
+    assert list(iter_json_array(write(tmp_path, '{"errors": [], "metrics": {}}'), 'results')) == []
+    assert list(iter_json_array(write(tmp_path, ''))) == []
+
+
+@pytest.mark.parametrize('text', ['[1, 2', '[1,]', '[{"a": 1}'])
+def test_truncated_or_invalid_array(tmp_path, text):
+    with pytest.raises(ValueError):
+        list(iter_json_array(write(tmp_path, text), chunk_size=2))
@@ -0,0 +1,140 @@
+import argparse
+import os
+
+import pandas as pd
+import pytest
+
+from report_utils import TEMPLATE_CACHE_DIR, ReportCache, add_cache_arguments, add_chart_arguments, add_table_arguments, decode_model, encode_model
+
+
+def make_cache(tmp_path, max_bytes=1 << 20, salt=''):
+    return ReportCache(str(tmp_path / 'cache'), max_bytes, salt)
+
+
+def test_disabled_cache():
+    cache = ReportCache()
+    assert cache.key('model', 'digest') is None
+    cache.put('html', 'key', b'data')
+    assert cache.get('html', 'key') is None
+    assert cache.cached('model', None, lambda: 42) == 42
+
+
+def test_key_covers_salt_parts_and_their_boundaries(tmp_path):
+    cache = make_cache(tmp_path)
+    assert cache.key('model', 'a') == cache.key('model', 'a')
+    assert cache.key('model', 'a') != cache.key('chart', 'a')
+    assert cache.key('ab', 'c') != cache.key('a', 'bc')
+    assert cache.key('a', b'b', 3) == cache.key('a', 'b', 3)
+    assert make_cache(tmp_path, salt='generator v2').key('model', 'a') != cache.key('model', 'a')
+
+
+def test_put_and_get(tmp_path):
+    cache = make_cache(tmp_path)
+    key = cache.key('html', 'digest')
+    assert cache.get('html', key) is None
+    cache.put('html', key, b'<html>')
+    assert cache.get('html', key) == b'<html>'
+    # Same key, other kind of entry
+    assert cache.get('chart', key) is None
+    source = tmp_path / 'report.html'
+    source.write_bytes(b'<html>report</html>')
+    cache.put_file('html', key, str(source))
+    assert cache.get('html', key) == b'<html>report</html>'
+    assert not [name for name in os.listdir(cache.directory) if name.endswith('.tmp')]
+
+
+def test_cached_model_round_trip(tmp_path):
+    frame = pd.DataFrame({
+        'severity': pd.Categorical(['LOW', 'HIGH', None], categories=['HIGH', 'LOW']),
+        'line': [1, 2, 3],
+        'text': pd.Series(['a', None, 'c'], dtype='str'),
+        'cwe': [{'id': 1}, None, [2, 3]],
+    })
+    cache = make_cache(tmp_path)
+    key = cache.key('model', 'digest')
+    built = cache.cached('model', key, lambda: (frame, [3, 4]))
+    restored = cache.cached('model', key, lambda: pytest.fail('the cached model was rebuilt'))
+    assert restored[1] == [3, 4]
+    pd.testing.assert_frame_equal(restored[0], built[0])
+
+
+def test_damaged_model_is_rebuilt(tmp_path):
+    cache = make_cache(tmp_path)
+    key = cache.key('model', 'digest')
+    cache.put('model', key, b'not an archive')
+    assert cache.cached('model', key, lambda: 42) == 42
+    assert decode_model(cache.get('model', key)) == 42
+
+
+def test_model_archives_refuse_other_indexes():
+    with pytest.raises(ValueError):
+        encode_model(pd.DataFrame({'a': [1, 2]}, index=[5, 6]))
+
+
+def test_eviction_removes_least_recently_used(tmp_path):
+    cache = make_cache(tmp_path, max_bytes=2500)
+    keys = [cache.key('chart', index) for index in range(3)]
+    for age, key in enumerate(keys[:2]):
+        cache.put('chart', key, b'x' * 1000)
+        os.utime(cache._path('chart', key), (age, age))
+    # Reading refreshes an entry, so the first one outlives the second
+    assert cache.get('chart', keys[0]) is not None
+    cache.put('chart', keys[2], b'x' * 1000)
+    assert cache.get('chart', keys[1]) is None
+    assert cache.get('chart', keys[0]) is not None
+    assert cache.get('chart', keys[2]) is not None
+
+
+def test_eviction_counts_template_bytecode(tmp_path):
+    cache = make_cache(tmp_path, max_bytes=1500)
+    templates = os.path.join(cache.directory, TEMPLATE_CACHE_DIR)
+    os.makedirs(templates)
+    bytecode = os.path.join(templates, '__jinja2_stale.cache')
+    with open(bytecode, 'wb') as f:
+        f.write(b'x' * 1000)
+    os.utime(bytecode, (0, 0))
+    cache.put('chart', cache.key('chart'), b'x' * 1000)
+    assert not os.path.exists(bytecode)
+
+
+def test_eviction_tolerates_entries_removed_meanwhile(tmp_path, monkeypatch):
+    cache = make_cache(tmp_path, max_bytes=0)
+    cache.put('chart', cache.key('chart', 1), b'x')
+    monkeypatch.setattr(os, 'remove', lambda path: (os.unlink(path), os.unlink(path)))
+    cache.put('chart', cache.key('chart', 2), b'x')
+    assert os.listdir(cache.directory) == []
+
+
+def report_args(argv):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('template_path')
+    parser.add_argument('--save-images', action='store_true')
+    parser.add_argument('--baseline')
+    parser.add_argument('--history-dir')
+    add_chart_arguments(parser)
+    add_table_arguments(parser)
+    add_cache_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def test_report_key(tmp_path):
+    cache = make_cache(tmp_path)
+    scan = tmp_path / 'scan.json'
+    scan.write_text('{"results": []}')
+    key = cache.report_key(report_args(['bandit/report_template.html']), [str(scan)])
+    assert key is not None
+    assert key == cache.report_key(report_args(['bandit/report_template.html']), [str(scan)])
+    assert key != cache.report_key(report_args(['bandit/report_template.html', '--no-charts']), [str(scan)])
+    assert key != cache.report_key(report_args(['trufflehog/report_template.html']), [str(scan)])
+    # Inputs are keyed by content, read once per cache
+    other = make_cache(tmp_path)
+    scan.write_text('{"results": [{}]}')
+    assert key != other.report_key(report_args(['bandit/report_template.html']), [str(scan)])
+
+
+@pytest.mark.parametrize('argv', [['--save-images'], ['--baseline', 'old.json'], ['--history-dir', 'history'], ['--table-mode', 'paged']])
+def test_no_report_key_for_runs_writing_more_than_the_report(tmp_path, argv):
+    cache = make_cache(tmp_path)
+    scan = tmp_path / 'scan.json'
+    scan.write_text('{}')
+    assert cache.report_key(report_args(['bandit/report_template.html', *argv]), [str(scan)]) is None
@@ -1,11 +1,28 @@
 def call(Map config = [:]) {
+    // Scripts go to a per-tool directory so the report steps do not overwrite each other's files
+    def scriptDir = '.security-reports'
+
     // Load the Python script
-    loadScript(name: 'html_generator.py', path: 'bandit/html_generator.py')
+    loadScript(name: "${scriptDir}/bandit/html_generator.py", path: 'bandit/html_generator.py')
+    loadScript(name: "${scriptDir}/common/report_utils.py", path: 'common/report_utils.py')
+    loadScript(name: "${scriptDir}/common/history.py", path: 'common/history.py')
+    loadScript(name: "${scriptDir}/common/compiled_templates.py", path: 'common/compiled_templates.py')
+    loadScript(name: "${scriptDir}/common/findings_table.html", path: 'common/findings_table.html')
+    loadScript(name: "${scriptDir}/common/baseline_diff.html", path: 'common/baseline_diff.html')
     
     // Load the HTML template
-    def tempTemplateFile = 'temp_report_template.html'
-    loadScript(name: tempTemplateFile, path: 'bandit/report_template.html')
+    def templateFile = "${scriptDir}/bandit/report_template.html"
+    loadScript(name: templateFile, path: 'bandit/report_template.html')
     
-    // Call the Python script with the JSON file and temporary HTML template file
-    sh "python ./html_generator.py ${config.json} ${tempTemplateFile}"
+    // Call the Python script with the JSON file and HTML template file
+    def flags = (config.stream ? ' --stream' : '') + (config.saveImages ? ' --save-images' : '') +
+        (config.baseline ? " --baseline ${config.baseline}" : '') +
+        (config.noCharts ? ' --no-charts' : '') +
+        (config.chartWorkers ? " --chart-workers ${config.chartWorkers}" : '') +
+        (config.renderProfile ? " --render-profile ${config.renderProfile}" : '') +
+        (config.cacheDir ? " --cache-dir ${config.cacheDir}" : '') +
+        (config.historyDir ? " --history-dir ${config.historyDir}" : '') +
+        (config.profile ? ' --profile' : '') +
+        (config.tableMode ? " --table-mode ${config.tableMode}" : '')
+    sh "python ${scriptDir}/bandit/html_generator.py ${config.json} ${templateFile}${flags}"
 }
\ No newline at end of file
@@ -1,12 +1,25 @@
 
 def call(Map config = [:]) {
+    // Scripts go to a per-tool directory so the report steps do not overwrite each other's files
+    def scriptDir = '.security-reports'
+
     // Load the Python script for Safety report generation
-    loadScript(name: 'html_generator.py', path: 'safety/html_generator.py')
+    loadScript(name: "${scriptDir}/safety/html_generator.py", path: 'safety/html_generator.py')
+    loadScript(name: "${scriptDir}/common/report_utils.py", path: 'common/report_utils.py')
+    loadScript(name: "${scriptDir}/common/history.py", path: 'common/history.py')
+    loadScript(name: "${scriptDir}/common/compiled_templates.py", path: 'common/compiled_templates.py')
     
     // Load the HTML template for Safety report
-    def tempTemplateFile = 'temp_report_template.html'
-    loadScript(name: tempTemplateFile, path: 'safety/report_template.html')
+    def templateFile = "${scriptDir}/safety/report_template.html"
+    loadScript(name: templateFile, path: 'safety/report_template.html')
     
-    // Call the Python script with the JSON file and temporary HTML template file
-    sh "python ./html_generator.py ${config.json} ${tempTemplateFile}"
+    // Call the Python script with the JSON file and HTML template file
+    def flags = (config.saveImages ? ' --save-images' : '') +
+        (config.noCharts ? ' --no-charts' : '') +
+        (config.chartWorkers ? " --chart-workers ${config.chartWorkers}" : '') +
+        (config.renderProfile ? " --render-profile ${config.renderProfile}" : '') +
+        (config.cacheDir ? " --cache-dir ${config.cacheDir}" : '') +
+        (config.historyDir ? " --history-dir ${config.historyDir}" : '') +
+        (config.profile ? ' --profile' : '')
+    sh "python ${scriptDir}/safety/html_generator.py ${config.json} ${templateFile}${flags}"
 }
\ No newline at end of file
@@ -0,0 +1,38 @@
+def call(Map config = [:]) {
+    // Same layout as the library resources, so generate_reports.py finds every generator and template
+    def scriptDir = '.security-reports'
+    loadScript(name: "${scriptDir}/common/generate_reports.py", path: 'common/generate_reports.py')
+    loadScript(name: "${scriptDir}/common/report_utils.py", path: 'common/report_utils.py')
+    loadScript(name: "${scriptDir}/common/history.py", path: 'common/history.py')
+    loadScript(name: "${scriptDir}/common/compiled_templates.py", path: 'common/compiled_templates.py')
+    loadScript(name: "${scriptDir}/common/findings_table.html", path: 'common/findings_table.html')
+    loadScript(name: "${scriptDir}/common/baseline_diff.html", path: 'common/baseline_diff.html')
+    for (tool in ['bandit', 'safety', 'sonarqube', 'trufflehog']) {
+        loadScript(name: "${scriptDir}/${tool}/html_generator.py", path: "${tool}/html_generator.py")
+        loadScript(name: "${scriptDir}/${tool}/report_template.html", path: "${tool}/report_template.html")
+    }
+
+    // Only the scanners given in the config get a report
+    def inputs = (config.bandit ? " --bandit ${config.bandit}" : '') +
+        (config.safety ? " --safety ${config.safety}" : '') +
+        (config.sonarqube_issues_json ? " --sonarqube ${config.sonarqube_issues_json} ${config.sonarqube_hotspots_json}" : '') +
+        (config.trufflehog ? " --trufflehog ${config.trufflehog}" : '') +
+        // Fetch the SonarQube exports from the server into the paths above, the token comes from $SONAR_TOKEN
+        (config.sonarqube_server_url ? " --sonarqube-server-url ${config.sonarqube_server_url} --sonarqube-project-key ${config.sonarqube_project_key}" : '') +
+        (config.sonarqube_branch ? " --sonarqube-branch ${config.sonarqube_branch}" : '')
+    // Baseline scans (e.g. from main) turn the reports into new/fixed comparisons
+    def baselines = (config.bandit_baseline ? " --baseline-bandit ${config.bandit_baseline}" : '') +
+        (config.sonarqube_baseline_issues_json ? " --baseline-sonarqube ${config.sonarqube_baseline_issues_json} ${config.sonarqube_baseline_hotspots_json}" : '') +
+        (config.trufflehog_baseline ? " --baseline-trufflehog ${config.trufflehog_baseline}" : '')
+    def flags = (config.jobs != null ? " --jobs ${config.jobs}" : '') +
+        (config.fetchWorkers ? " --fetch-workers ${config.fetchWorkers}" : '') +
+        (config.stream ? ' --stream' : '') + (config.saveImages ? ' --save-images' : '') +
+        (config.noCharts ? ' --no-charts' : '') +
+        (config.chartWorkers ? " --chart-workers ${config.chartWorkers}" : '') +
+        (config.renderProfile ? " --render-profile ${config.renderProfile}" : '') +
+        (config.cacheDir ? " --cache-dir ${config.cacheDir}" : '') +
+        (config.profile ? ' --profile' : '') +
+        (config.historyDir ? " --history-dir ${config.historyDir}" : '') +
+        (config.tableMode ? " --table-mode ${config.tableMode}" : '')
+    sh "python ${scriptDir}/common/generate_reports.py${inputs}${baselines}${flags}"
+}
@@ -1,11 +1,33 @@
 def call(Map config = [:]) {
+    // Scripts go to a per-tool directory so the report steps do not overwrite each other's files
+    def scriptDir = '.security-reports'
+
     // Load the Python script
-    loadScript(name: 'html_generator.py', path: 'sonarqube/html_generator.py')
+    loadScript(name: "${scriptDir}/sonarqube/html_generator.py", path: 'sonarqube/html_generator.py')
+    loadScript(name: "${scriptDir}/common/report_utils.py", path: 'common/report_utils.py')
+    loadScript(name: "${scriptDir}/common/history.py", path: 'common/history.py')
+    loadScript(name: "${scriptDir}/common/compiled_templates.py", path: 'common/compiled_templates.py')
+    loadScript(name: "${scriptDir}/common/findings_table.html", path: 'common/findings_table.html')
+    loadScript(name: "${scriptDir}/common/baseline_diff.html", path: 'common/baseline_diff.html')
     
     // Load the HTML template
-    def tempTemplateFile = 'temp_report_template.html'
-    loadScript(name: tempTemplateFile, path: 'sonarqube/report_template.html')
+    def templateFile = "${scriptDir}/sonarqube/report_template.html"
+    loadScript(name: templateFile, path: 'sonarqube/report_template.html')
     
-    // Call the Python script with the JSON files and temporary HTML template file paths
-    sh "python ./html_generator.py ${config.issues_json} ${config.hotspots_json} ${tempTemplateFile}"
+    // Call the Python script with the JSON files and HTML template file paths. With serverUrl the
+    // generator fetches the issues and hotspots itself and writes them to those paths; the token is
+    // read from $SONAR_TOKEN (e.g. withCredentials) so it never shows up in the build log
+    def flags = (config.saveImages ? ' --save-images' : '') +
+        (config.serverUrl ? " --server-url ${config.serverUrl} --project-key ${config.projectKey}" : '') +
+        (config.branch ? " --branch ${config.branch}" : '') +
+        (config.fetchWorkers ? " --fetch-workers ${config.fetchWorkers}" : '') +
+        (config.baseline_issues_json ? " --baseline ${config.baseline_issues_json} ${config.baseline_hotspots_json}" : '') +
+        (config.noCharts ? ' --no-charts' : '') +
+        (config.chartWorkers ? " --chart-workers ${config.chartWorkers}" : '') +
+        (config.renderProfile ? " --render-profile ${config.renderProfile}" : '') +
+        (config.cacheDir ? " --cache-dir ${config.cacheDir}" : '') +
+        (config.historyDir ? " --history-dir ${config.historyDir}" : '') +
+        (config.profile ? ' --profile' : '') +
+        (config.tableMode ? " --table-mode ${config.tableMode}" : '')
+    sh "python ${scriptDir}/sonarqube/html_generator.py ${config.issues_json} ${config.hotspots_json} ${templateFile}${flags}"
 }
@@ -0,0 +1,18 @@
+def call(Map config = [:]) {
+    // Same layout as the report steps, so the history they recorded is read from config.historyDir
+    def scriptDir = '.security-reports'
+    loadScript(name: "${scriptDir}/common/history.py", path: 'common/history.py')
+    loadScript(name: "${scriptDir}/common/compiled_templates.py", path: 'common/compiled_templates.py')
+    loadScript(name: "${scriptDir}/common/report_utils.py", path: 'common/report_utils.py')
+    loadScript(name: "${scriptDir}/common/trend_template.html", path: 'common/trend_template.html')
+
+    // One trends report per tool, e.g. tools: ['bandit', 'trufflehog']
+    def flags = (config.last ? " --last ${config.last}" : '') +
+        (config.top ? " --top ${config.top}" : '') +
+        (config.noCharts ? ' --no-charts' : '') +
+        (config.chartWorkers ? " --chart-workers ${config.chartWorkers}" : '') +
+        (config.renderProfile ? " --render-profile ${config.renderProfile}" : '')
+    for (tool in config.tools) {
+        sh "python ${scriptDir}/common/history.py --history-dir ${config.historyDir} --tool ${tool}${flags}"
+    }
+}